@@ -0,0 +1,9 @@
+"""
+Micro-benchmarks for zipline's hot paths.
+
+Each module in this package is runnable as a script, e.g.::
+
+    $ python -m benchmarks.bench_minute_bars
+
+and prints the best wall-clock time of each variant under test.
+"""
@@ -0,0 +1,134 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compare loading and traversing adjusted daily pricing windows with
+``SQLiteAdjustmentReader`` against ``BcolzCumulativeAdjustmentReader``.
+
+Usage::
+
+    $ python -m benchmarks.bench_adjustments [num_sids] [num_days]
+"""
+from __future__ import print_function
+import shutil
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from zipline.data.us_equity_pricing import (
+    BcolzCumulativeAdjustmentReader,
+    BcolzDailyBarReader,
+    SQLiteAdjustmentReader,
+    SQLiteAdjustmentWriter,
+)
+from zipline.pipeline.data import USEquityPricing
+from zipline.pipeline.loaders.equity_pricing_loader import (
+    USEquityPricingLoader,
+)
+from zipline.utils.tradingcalendar import trading_days
+
+from .bench_daily_bars import RandomDailyBarWriter
+from .utils import best_of, report
+
+WINDOW_LENGTH = 20
+ADJUSTMENTS_PER_SID_PER_YEAR = 5
+
+
+def random_adjustments(calendar, sids, count):
+    rand = np.random.RandomState(0)
+    return pd.DataFrame({
+        'effective_date': rand.choice(
+            calendar.asi8 // 10 ** 9, count,
+        ).astype(np.int64),
+        'ratio': rand.uniform(0.5, 1.0, count),
+        'sid': rand.choice(sids, count).astype(np.int64),
+    })
+
+
+def traverse_all(loader, columns, dates, assets):
+    mask = np.ones((len(dates), len(assets)), dtype=bool)
+    arrays = loader.load_adjusted_array(columns, dates, assets, mask)
+    for column in columns:
+        for _ in arrays[column].traverse(WINDOW_LENGTH):
+            pass
+
+
+def main(num_sids=3000, num_days=1260):
+    calendar = trading_days[trading_days.slice_indexer('2010-01-01')]
+    calendar = calendar[:num_days]
+    sids = list(range(1, num_sids + 1))
+    assets = pd.Int64Index(sids)
+    columns = [USEquityPricing.close, USEquityPricing.volume]
+    count = num_sids * num_days * ADJUSTMENTS_PER_SID_PER_YEAR // 252
+
+    rootdir = tempfile.mkdtemp()
+    try:
+        daily_bar_reader = BcolzDailyBarReader(
+            RandomDailyBarWriter(calendar).write(
+                rootdir + '/daily.bcolz', calendar, sids,
+            )
+        )
+        writer = SQLiteAdjustmentWriter(
+            rootdir + '/adjustments.db', calendar, daily_bar_reader,
+        )
+        writer.write(
+            splits=random_adjustments(calendar, sids, count // 2),
+            mergers=random_adjustments(calendar, sids, count // 2),
+            dividends=pd.DataFrame({
+                'sid': np.array([], dtype=np.uint32),
+                'amount': np.array([], dtype=float),
+                'ex_date': np.array([], dtype='datetime64[ns]'),
+                'record_date': np.array([], dtype='datetime64[ns]'),
+                'declared_date': np.array([], dtype='datetime64[ns]'),
+                'pay_date': np.array([], dtype='datetime64[ns]'),
+            }),
+        )
+        writer.write_cumulative_factors(rootdir + '/adjustments.bcolz')
+
+        sqlite_loader = USEquityPricingLoader(
+            daily_bar_reader,
+            SQLiteAdjustmentReader(writer.conn),
+        )
+        cumulative_loader = USEquityPricingLoader(
+            daily_bar_reader,
+            BcolzCumulativeAdjustmentReader(rootdir + '/adjustments.bcolz'),
+        )
+        # Leave a day for the loader to shift the query back by.
+        dates = calendar[1:]
+
+        timings = [
+            ('SQLiteAdjustmentReader', best_of(
+                lambda: traverse_all(sqlite_loader, columns, dates, assets),
+            )),
+            ('BcolzCumulativeAdjustmentReader', best_of(
+                lambda: traverse_all(
+                    cumulative_loader, columns, dates, assets,
+                ),
+            )),
+        ]
+    finally:
+        shutil.rmtree(rootdir)
+
+    report(
+        '{0} sids x {1} days, {2} adjustments'.format(
+            num_sids, num_days, count,
+        ),
+        timings,
+    )
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
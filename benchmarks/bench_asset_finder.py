@@ -0,0 +1,113 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compare AssetFinder and AssetFinderPreloaded on a large equities table.
+
+"Cold" timings build a new finder for each trial, so they include reading
+the database.  "Warm" timings reuse a finder that has already served the
+same requests.
+
+Usage::
+
+    $ python -m benchmarks.bench_asset_finder [num_assets] [num_lookups]
+"""
+from __future__ import print_function
+import sys
+
+import numpy as np
+import pandas as pd
+import sqlalchemy as sa
+
+from zipline.assets import AssetFinder, AssetFinderPreloaded
+from zipline.assets.asset_writer import AssetDBWriterFromDataFrame
+
+from .utils import best_of, report
+
+
+def make_engine(num_assets):
+    rand = np.random.RandomState(0)
+    starts = pd.Timestamp('2000-01-03', tz='UTC') + pd.to_timedelta(
+        rand.randint(0, 3000, num_assets), unit='D',
+    )
+    ends = starts + pd.to_timedelta(
+        rand.randint(30, 3000, num_assets), unit='D',
+    )
+    equities = pd.DataFrame(
+        {
+            'symbol': ['S%d' % i for i in range(num_assets)],
+            'start_date': starts,
+            'end_date': ends,
+            'exchange': 'NYSE',
+        },
+        index=np.arange(num_assets),
+    )
+    engine = sa.create_engine('sqlite://')
+    AssetDBWriterFromDataFrame(equities=equities).write_all(engine)
+    return engine, equities
+
+
+def retrieve_all(finder, sids):
+    finder.retrieve_all(sids)
+
+
+def lookup_symbols(finder, symbols, as_of):
+    for symbol in symbols:
+        finder.lookup_symbol(symbol, as_of)
+
+
+def main(num_assets=40000, num_lookups=2000):
+    engine, equities = make_engine(num_assets)
+    sids = list(equities.index)
+    symbols = list(equities.symbol.iloc[:num_lookups])
+    as_of = pd.Timestamp('2008-01-02', tz='UTC')
+    finder_types = [AssetFinder, AssetFinderPreloaded]
+
+    report(
+        'construct + retrieve_all, {0} assets (cold)'.format(num_assets),
+        [
+            (cls.__name__, best_of(
+                lambda: retrieve_all(cls(engine), sids),
+            ))
+            for cls in finder_types
+        ],
+        unit=('assets', num_assets),
+    )
+
+    warm = {cls: cls(engine) for cls in finder_types}
+    for finder in warm.values():
+        retrieve_all(finder, sids)
+    report(
+        'retrieve_all, {0} assets (warm)'.format(num_assets),
+        [
+            (cls.__name__, best_of(lambda: retrieve_all(warm[cls], sids)))
+            for cls in finder_types
+        ],
+        unit=('assets', num_assets),
+    )
+
+    report(
+        'lookup_symbol, {0} symbols'.format(len(symbols)),
+        [
+            (cls.__name__, best_of(
+                lambda: lookup_symbols(warm[cls], symbols, as_of),
+            ))
+            for cls in finder_types
+        ],
+        unit=('lookups', len(symbols)),
+    )
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
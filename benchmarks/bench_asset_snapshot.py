@@ -0,0 +1,80 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compare the time to start serving assets from a database and from a
+snapshot of it.
+
+Each trial builds a new finder and retrieves every asset, as a process
+starting a backtest would.  The database is written to a file so that
+reading it goes through sqlite the way it would in practice.
+
+Usage::
+
+    $ python -m benchmarks.bench_asset_snapshot [num_assets]
+"""
+from __future__ import print_function
+import os
+import sys
+
+import sqlalchemy as sa
+from testfixtures import TempDirectory
+
+from zipline.assets import (
+    AssetFinder,
+    AssetFinderPreloaded,
+    AssetFinderSnapshot,
+)
+from zipline.assets.asset_writer import AssetDBWriterFromDataFrame
+
+from .bench_asset_finder import make_engine, retrieve_all
+from .utils import best_of, report
+
+
+def main(num_assets=40000):
+    _, equities = make_engine(num_assets)
+    sids = list(equities.index)
+
+    with TempDirectory() as tmp:
+        engine = sa.create_engine(
+            'sqlite:///' + os.path.join(tmp.path, 'assets.db'),
+        )
+        snapshot_path = tmp.getpath('snapshot')
+        AssetDBWriterFromDataFrame(equities=equities).write_all(
+            engine,
+            snapshot_path=snapshot_path,
+        )
+
+        report(
+            'construct + retrieve_all, {0} assets'.format(num_assets),
+            [
+                ('AssetFinder', best_of(
+                    lambda: retrieve_all(AssetFinder(engine), sids),
+                )),
+                ('AssetFinderPreloaded', best_of(
+                    lambda: retrieve_all(AssetFinderPreloaded(engine), sids),
+                )),
+                ('AssetFinderSnapshot', best_of(
+                    lambda: retrieve_all(
+                        AssetFinderSnapshot(engine, snapshot_path),
+                        sids,
+                    ),
+                )),
+            ],
+            unit=('assets', num_assets),
+        )
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
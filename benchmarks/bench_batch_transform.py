@@ -0,0 +1,106 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compare BatchTransform's Panel and array backends on minute bars that are
+downsampled to daily bars, calling the transform on every bar.
+
+Usage::
+
+    $ python -m benchmarks.bench_batch_transform [num_sids] [num_days]
+"""
+from __future__ import print_function
+import sys
+
+import numpy as np
+import pandas as pd
+
+from zipline.finance.trading import TradingEnvironment
+from zipline.protocol import BarData, SIDData
+from zipline.transforms import BatchTransform
+from zipline.utils.algo_instance import set_algo_instance
+
+from .utils import best_of, report
+
+
+class FakeAlgorithm(object):
+    """
+    Just enough of an algorithm for BatchTransform to find the trading
+    environment.
+    """
+    def __init__(self, env):
+        self.trading_environment = env
+
+
+def mean_price(data):
+    return np.nanmean(np.asarray(data['price']))
+
+
+def make_bars(minutes, num_sids):
+    rand = np.random.RandomState(0)
+    prices = rand.uniform(10, 100, (len(minutes), num_sids))
+    volumes = rand.randint(100, 10000, (len(minutes), num_sids))
+    bars = []
+    for i, dt in enumerate(minutes):
+        bars.append(BarData({
+            sid: SIDData(sid, {
+                'dt': dt,
+                'price': prices[i, sid],
+                'close_price': prices[i, sid],
+                'open_price': prices[i, sid],
+                'high': prices[i, sid],
+                'low': prices[i, sid],
+                'volume': volumes[i, sid],
+            })
+            for sid in range(num_sids)
+        }))
+    return bars
+
+
+def run(bars, panel):
+    transform = BatchTransform(
+        func=mean_price,
+        refresh_period=1,
+        window_length=3,
+        bars='minute',
+        downsample=True,
+        panel=panel,
+    )
+    for bar in bars:
+        transform.handle_data(bar)
+
+
+def main(num_sids=100, num_days=5):
+    env = TradingEnvironment()
+    set_algo_instance(FakeAlgorithm(env))
+    days = env.days_in_range(
+        pd.Timestamp('2013-06-03', tz='UTC'),
+        pd.Timestamp('2013-12-31', tz='UTC'),
+    )[:num_days]
+    minutes = env.minutes_for_days_in_range(days[0], days[-1])
+    bars = make_bars(minutes, num_sids)
+
+    report(
+        'BatchTransform(bars="minute", downsample=True), '
+        '{0} sids x {1} minutes'.format(num_sids, len(minutes)),
+        [
+            ('panel=True', best_of(lambda: run(bars, True), repeat=1)),
+            ('panel=False', best_of(lambda: run(bars, False), repeat=1)),
+        ],
+        unit=('bars', len(minutes)),
+    )
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,112 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compare running the built-in technical factors with their vectorized
+``compute_all`` against calling ``compute`` once per day.
+
+Usage::
+
+    $ python -m benchmarks.bench_compute_all [num_sids] [num_years]
+"""
+from __future__ import print_function
+import sys
+
+import pandas as pd
+
+from zipline.finance.trading import TradingEnvironment
+from zipline.pipeline import Pipeline
+from zipline.pipeline.data import USEquityPricing
+from zipline.pipeline.engine import SimplePipelineEngine
+from zipline.pipeline.factors import (
+    AverageDollarVolume,
+    EWMA,
+    Returns,
+    SimpleMovingAverage,
+    VWAP,
+)
+from zipline.pipeline.loaders.synthetic import SeededRandomLoader
+from zipline.testing import make_simple_equity_info
+
+from .utils import best_of, report
+
+
+def per_day(factor_type):
+    """
+    Return a subclass of `factor_type` that doesn't use ``compute_all``.
+    """
+    return type(factor_type.__name__, (factor_type,), {'compute_all': None})
+
+
+def make_pipeline(factor_types):
+    close = USEquityPricing.close
+    sma, ewma, returns, adv, vwap = factor_types
+    return Pipeline(
+        columns={
+            'sma': sma(inputs=[close], window_length=50),
+            'ewma': ewma.from_span(
+                inputs=[close], window_length=50, span=20,
+            ),
+            'returns': returns(window_length=20),
+            'adv': adv(window_length=30),
+            'vwap': vwap(window_length=30),
+        },
+    )
+
+
+def main(num_sids=8000, num_years=10):
+    env = TradingEnvironment()
+    calendar = env.trading_days
+    end = calendar[calendar.searchsorted(pd.Timestamp('2015-01-01'))]
+    start = end - pd.DateOffset(years=num_years)
+    start = calendar[calendar.searchsorted(start)]
+    # Leave room for the lookback of the longest window.
+    first_day = calendar[calendar.get_loc(start) - 100]
+
+    sids = list(range(1, num_sids + 1))
+    env.write_data(
+        equities_df=make_simple_equity_info(sids, first_day, end),
+    )
+    loader = SeededRandomLoader(
+        0,
+        USEquityPricing.columns,
+        calendar[calendar.slice_indexer(first_day, end)],
+        sids,
+    )
+    engine = SimplePipelineEngine(
+        lambda column: loader, calendar, env.asset_finder,
+    )
+    factor_types = [
+        SimpleMovingAverage, EWMA, Returns, AverageDollarVolume, VWAP,
+    ]
+    vectorized = make_pipeline(factor_types)
+    looped = make_pipeline([per_day(t) for t in factor_types])
+
+    report(
+        '{0} sids x {1} years'.format(num_sids, num_years),
+        [
+            ('compute per day', best_of(
+                lambda: engine.run_pipeline(looped, start, end),
+                repeat=1,
+            )),
+            ('compute_all', best_of(
+                lambda: engine.run_pipeline(vectorized, start, end),
+                repeat=1,
+            )),
+        ],
+    )
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
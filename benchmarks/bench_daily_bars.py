@@ -0,0 +1,114 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compare looping over ``BcolzDailyBarReader.spot_price`` against a single
+``BcolzDailyBarReader.spot_prices`` call.
+
+Usage::
+
+    $ python -m benchmarks.bench_daily_bars [num_sids] [num_days]
+"""
+from __future__ import print_function
+import shutil
+import sys
+import tempfile
+
+from bcolz import ctable
+import numpy as np
+
+from zipline.data.us_equity_pricing import (
+    BcolzDailyBarReader,
+    BcolzDailyBarWriter,
+    NoDataOnDate,
+)
+from zipline.utils.tradingcalendar import trading_days
+
+from .utils import best_of, report
+
+COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+
+class RandomDailyBarWriter(BcolzDailyBarWriter):
+    """
+    Writes uniformly random prices for every asset on every day of
+    ``calendar``.
+    """
+    def __init__(self, calendar):
+        self._calendar = calendar
+
+    def gen_tables(self, assets):
+        rand = np.random.RandomState(0)
+        days = self._calendar.asi8 // 10 ** 9
+        for asset in assets:
+            prices = rand.randint(1000, 100000, len(days))
+            yield asset, ctable(
+                columns=[prices, prices, prices, prices, prices, days],
+                names=COLUMNS + ['day'],
+            )
+
+    def to_uint32(self, array, colname):
+        return array.astype(np.uint32)
+
+
+def spot_price_loop(reader, sids, day):
+    out = np.empty((len(COLUMNS), len(sids)))
+    for i, column in enumerate(COLUMNS):
+        for j, sid in enumerate(sids):
+            try:
+                out[i, j] = reader.spot_price(sid, day, column)
+            except NoDataOnDate:
+                out[i, j] = np.nan
+    return out
+
+
+def main(num_sids=3000, num_days=252):
+    calendar = trading_days[trading_days.slice_indexer('2014-01-01')]
+    calendar = calendar[:num_days]
+    sids = list(range(1, num_sids + 1))
+
+    rootdir = tempfile.mkdtemp()
+    try:
+        table = RandomDailyBarWriter(calendar).write(
+            rootdir + '/daily.bcolz', calendar, sids,
+        )
+        reader = BcolzDailyBarReader(table)
+        day = calendar[num_days // 2]
+
+        # Warm the column cache so that we time lookups, not reads.
+        expected = reader.spot_prices(sids, day, COLUMNS)
+        np.testing.assert_array_equal(
+            expected, spot_price_loop(reader, sids, day),
+        )
+
+        timings = [
+            ('spot_price loop', best_of(
+                lambda: spot_price_loop(reader, sids, day),
+            )),
+            ('spot_prices', best_of(
+                lambda: reader.spot_prices(sids, day, COLUMNS),
+            )),
+        ]
+    finally:
+        shutil.rmtree(rootdir)
+
+    report(
+        '{0} sids x {1} columns'.format(num_sids, len(COLUMNS)),
+        timings,
+        unit=('prices', num_sids * len(COLUMNS)),
+    )
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,99 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Time building the next and previous event frames of an EventsLoader for a
+synthetic set of quarterly events, each learned about a month or two before
+it occurs.
+
+Usage::
+
+    $ python -m benchmarks.bench_event_frames [num_sids] [num_years]
+"""
+from __future__ import print_function
+import sys
+
+import numpy as np
+import pandas as pd
+
+from zipline.pipeline.common import ANNOUNCEMENT_FIELD_NAME
+from zipline.pipeline.loaders.utils import (
+    next_date_frame,
+    previous_event_frame,
+)
+from zipline.utils.numpy_utils import NaTns, datetime64ns_dtype
+from zipline.utils.tradingcalendar import trading_days
+
+from .utils import best_of, report
+
+
+def make_events(num_sids, dates):
+    rand = np.random.RandomState(0)
+    num_events = len(dates) // 63
+    events_by_sid = {}
+    for sid in range(num_sids):
+        event_dates = dates[
+            np.arange(num_events) * 63 + rand.randint(0, 63, num_events)
+        ].tz_localize(None)
+        knowledge_dates = event_dates - pd.to_timedelta(
+            rand.randint(20, 60, num_events),
+            unit='D',
+        )
+        events_by_sid[sid] = pd.DataFrame(
+            {ANNOUNCEMENT_FIELD_NAME: event_dates},
+            index=knowledge_dates,
+        )
+    return events_by_sid
+
+
+def main(num_sids=2000, num_years=15):
+    dates = trading_days[
+        trading_days.slice_indexer(
+            pd.Timestamp('%d-01-01' % (2015 - num_years), tz='UTC'),
+            pd.Timestamp('2014-12-31', tz='UTC'),
+        )
+    ]
+    events_by_sid = make_events(num_sids, dates)
+    num_events = sum(map(len, events_by_sid.values()))
+
+    title = '{0}, {1} events of {2} sids over {3} days'
+    report(
+        title.format('next_date_frame', num_events, num_sids, len(dates)),
+        [('next_date_frame', best_of(
+            lambda: next_date_frame(
+                dates,
+                events_by_sid,
+                ANNOUNCEMENT_FIELD_NAME,
+            ),
+        ))],
+        unit=('events', num_events),
+    )
+    report(
+        title.format('previous_event_frame', num_events, num_sids, len(dates)),
+        [('previous_event_frame', best_of(
+            lambda: previous_event_frame(
+                events_by_sid,
+                dates,
+                NaTns,
+                datetime64ns_dtype,
+                ANNOUNCEMENT_FIELD_NAME,
+                ANNOUNCEMENT_FIELD_NAME,
+            ),
+        ))],
+        unit=('events', num_events),
+    )
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,146 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compare per-event and columnar ``DataFrameSource`` throughput, both for the
+bare source and for a full simulation of an algorithm that does nothing, and
+compare merging sources with ``date_sorted_sources`` + ``groupby`` against
+``dt_aligned_snapshots``.
+
+Usage::
+
+    $ python -m benchmarks.bench_event_stream [num_sids] [num_years]
+"""
+from __future__ import print_function
+from itertools import groupby
+from operator import attrgetter
+import sys
+
+import numpy as np
+import pandas as pd
+
+from zipline.finance.trading import TradingEnvironment
+from zipline.gens.composites import date_sorted_sources, dt_aligned_snapshots
+from zipline.protocol import DATASOURCE_TYPE, Event
+from zipline.sources import DataFrameSource
+from zipline.test_algorithms import NoopAlgorithm
+from zipline.utils.factory import create_simulation_parameters
+
+from .utils import best_of, report
+
+
+def make_frame(trading_days, num_sids):
+    rand = np.random.RandomState(0)
+    return pd.DataFrame(
+        rand.uniform(10, 100, (len(trading_days), num_sids)),
+        index=trading_days,
+        columns=pd.Int64Index(np.arange(num_sids)),
+    )
+
+
+def drain(source):
+    for _ in source:
+        pass
+
+
+def heap_merge(sources, benchmark):
+    merged = date_sorted_sources(benchmark, date_sorted_sources(*sources))
+    for _, events in groupby(merged, attrgetter('dt')):
+        for _ in events:
+            pass
+
+
+def snapshot_merge(sources, benchmark):
+    for _, events in dt_aligned_snapshots(sources, benchmark):
+        pass
+
+
+def bench_merge(df, columnar):
+    benchmark = [
+        Event({
+            'dt': dt,
+            'returns': 0.0,
+            'type': DATASOURCE_TYPE.BENCHMARK,
+            'source_id': 'benchmarks',
+        })
+        for dt in df.index
+    ]
+    halves = [df.iloc[:, ::2], df.iloc[:, 1::2]]
+
+    def sources():
+        return [DataFrameSource(half, columnar=columnar) for half in halves]
+
+    report(
+        'Merging 2 sources + benchmark, columnar={0}'.format(columnar),
+        [
+            ('date_sorted_sources', best_of(
+                lambda: heap_merge(sources(), benchmark),
+                repeat=1,
+            )),
+            ('dt_aligned_snapshots', best_of(
+                lambda: snapshot_merge(sources(), benchmark),
+                repeat=1,
+            )),
+        ],
+        unit=('events', df.size),
+    )
+
+
+def main(num_sids=500, num_years=10):
+    env = TradingEnvironment()
+    env.write_data(equities_identifiers=list(range(num_sids)))
+    sim_params = create_simulation_parameters(
+        start=pd.Timestamp('2004-01-02', tz='UTC'),
+        end=pd.Timestamp('2004-01-02', tz='UTC') + pd.DateOffset(
+            years=num_years,
+        ),
+        env=env,
+    )
+    df = make_frame(sim_params.trading_days, num_sids)
+    num_events = df.size
+
+    report(
+        'DataFrameSource, {0} sids x {1} days'.format(num_sids, len(df)),
+        [
+            ('events', best_of(
+                lambda: drain(DataFrameSource(df)),
+                repeat=1,
+            )),
+            ('columnar', best_of(
+                lambda: drain(DataFrameSource(df, columnar=True)),
+                repeat=1,
+            )),
+        ],
+        unit=('events', num_events),
+    )
+
+    bench_merge(df, columnar=False)
+    bench_merge(df, columnar=True)
+
+    def run(columnar):
+        algo = NoopAlgorithm(sim_params=sim_params, env=env)
+        algo.run(DataFrameSource(df, columnar=columnar))
+
+    report(
+        'NoopAlgorithm, {0} sids x {1} days'.format(num_sids, len(df)),
+        [
+            ('events', best_of(lambda: run(False), repeat=1)),
+            ('columnar', best_of(lambda: run(True), repeat=1)),
+        ],
+        unit=('events', num_events),
+    )
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,93 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Time looking up the chains of several root symbols on every trading day of
+a backtest, as a futures strategy using ``FutureChain`` does.
+
+"Cold" timings build a new AssetFinder for each trial, so they include
+reading each root symbol's contracts.
+
+Usage::
+
+    $ python -m benchmarks.bench_future_chain [num_roots] [num_years]
+"""
+from __future__ import print_function
+import sys
+
+import pandas as pd
+
+from zipline.assets import AssetFinder, AssetFinderPreloaded
+from zipline.testing import make_commodity_future_info, tmp_assets_db
+from zipline.utils.tradingcalendar import trading_days
+
+from .utils import best_of, report
+
+
+def lookup_chains(finder, root_symbols, dates):
+    for dt in dates:
+        for root_symbol in root_symbols:
+            finder.lookup_future_chain(root_symbol, dt)
+
+
+def main(num_roots=10, num_years=10):
+    root_symbols = ['R%s' % chr(ord('A') + i) for i in range(num_roots)]
+    years = list(range(2005, 2005 + num_years))
+    futures = make_commodity_future_info(
+        first_sid=0,
+        root_symbols=root_symbols,
+        years=years,
+    )
+    dates = trading_days[
+        trading_days.slice_indexer(
+            pd.Timestamp('%d-01-01' % years[0], tz='UTC'),
+            pd.Timestamp('%d-12-31' % years[-1], tz='UTC'),
+        )
+    ]
+    num_lookups = len(dates) * num_roots
+
+    with tmp_assets_db(futures=futures) as engine:
+        finder_types = [AssetFinder, AssetFinderPreloaded]
+        report(
+            'lookup_future_chain, {0} roots x {1} days (cold)'.format(
+                num_roots, len(dates),
+            ),
+            [
+                (cls.__name__, best_of(
+                    lambda: lookup_chains(cls(engine), root_symbols, dates),
+                ))
+                for cls in finder_types
+            ],
+            unit=('lookups', num_lookups),
+        )
+
+        warm = {cls: cls(engine) for cls in finder_types}
+        for finder in warm.values():
+            lookup_chains(finder, root_symbols, dates[:1])
+        report(
+            'lookup_future_chain, {0} roots x {1} days (warm)'.format(
+                num_roots, len(dates),
+            ),
+            [
+                (cls.__name__, best_of(
+                    lambda: lookup_chains(warm[cls], root_symbols, dates),
+                ))
+                for cls in finder_types
+            ],
+            unit=('lookups', num_lookups),
+        )
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,120 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compare ``HistoryContainer`` and ``RingBufferHistoryContainer`` on a minute
+simulation's worth of ``update`` and ``get_history`` calls, with several
+concurrent HistorySpecs.
+
+Usage::
+
+    $ python -m benchmarks.bench_history [num_sids] [num_days]
+"""
+from __future__ import print_function
+import sys
+
+import numpy as np
+import pandas as pd
+
+from zipline.finance.trading import TradingEnvironment
+from zipline.history import HistorySpec
+from zipline.history.history_container import (
+    HistoryContainer,
+    RingBufferHistoryContainer,
+)
+from zipline.protocol import BarData
+
+from .utils import best_of, report
+
+
+SPECS = (
+    (20, '1d', 'price', True),
+    (20, '1d', 'volume', False),
+    (30, '1m', 'price', True),
+    (5, '1d', 'high', True),
+    (1, '1m', 'low', False),
+)
+
+
+def make_bars(minutes, num_sids):
+    rand = np.random.RandomState(0)
+    prices = rand.uniform(10, 100, (len(minutes), num_sids))
+    volumes = rand.randint(100, 10000, (len(minutes), num_sids))
+    bars = []
+    for i, dt in enumerate(minutes):
+        bars.append(BarData({
+            sid: {
+                'dt': dt,
+                'price': prices[i, sid],
+                'close_price': prices[i, sid],
+                'open_price': prices[i, sid],
+                'high': prices[i, sid],
+                'low': prices[i, sid],
+                'volume': volumes[i, sid],
+            }
+            for sid in range(num_sids)
+        }))
+    return bars
+
+
+def run(container_class, specs, num_sids, minutes, bars, env):
+    container = container_class(
+        {spec.key_str: spec for spec in specs},
+        list(range(num_sids)),
+        minutes[0],
+        'minute',
+        env=env,
+    )
+    for dt, bar in zip(minutes, bars):
+        container.update(bar, dt)
+        for spec in specs:
+            container.get_history(spec, dt)
+
+
+def main(num_sids=500, num_days=5):
+    env = TradingEnvironment()
+    days = env.days_in_range(
+        pd.Timestamp('2013-06-03', tz='UTC'),
+        pd.Timestamp('2013-12-31', tz='UTC'),
+    )[:num_days]
+    minutes = env.minutes_for_days_in_range(days[0], days[-1])
+    bars = make_bars(minutes, num_sids)
+    specs = [
+        HistorySpec(bar_count, frequency, field, ffill, env=env,
+                    data_frequency='minute')
+        for bar_count, frequency, field, ffill in SPECS
+    ]
+
+    report(
+        'update + {0} history() calls per bar, {1} sids x {2} minutes'.format(
+            len(specs), num_sids, len(minutes),
+        ),
+        [
+            ('HistoryContainer', best_of(
+                lambda: run(HistoryContainer,
+                            specs, num_sids, minutes, bars, env),
+                repeat=1,
+            )),
+            ('RingBufferHistoryContainer', best_of(
+                lambda: run(RingBufferHistoryContainer,
+                            specs, num_sids, minutes, bars, env),
+                repeat=1,
+            )),
+        ],
+        unit=('bars', len(minutes)),
+    )
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,114 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Measure the startup cost of ``import zipline`` and of first using the NYSE
+trading calendar, in fresh interpreters, with and without the calendar cached
+on disk.
+
+On Python 3.7+, also report the slowest modules imported by ``import
+zipline``, as measured by ``python -X importtime``.
+
+Usage::
+
+    $ python -m benchmarks.bench_import [repeat] [num_modules]
+"""
+from __future__ import print_function
+import os
+import shutil
+import subprocess
+import sys
+from tempfile import mkdtemp
+
+from .utils import best_of, report
+
+IMPORT_ZIPLINE = 'import zipline'
+USE_CALENDAR = (
+    'import zipline\n'
+    'from zipline.utils import tradingcalendar\n'
+    'tradingcalendar.open_and_closes\n'
+)
+
+
+def run(code, zipline_root):
+    env = dict(os.environ, ZIPLINE_ROOT=zipline_root)
+    subprocess.check_call([sys.executable, '-c', code], env=env)
+
+
+def run_cold(code):
+    zipline_root = mkdtemp()
+    try:
+        run(code, zipline_root)
+    finally:
+        shutil.rmtree(zipline_root)
+
+
+def slowest_imports(num_modules):
+    """
+    Return the `num_modules` modules with the largest cumulative import time,
+    as (seconds, module) pairs.
+    """
+    output = subprocess.check_output(
+        [sys.executable, '-X', 'importtime', '-c', IMPORT_ZIPLINE],
+        stderr=subprocess.STDOUT,
+        universal_newlines=True,
+    )
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, module = line[len('import time:'):].split('|')
+        try:
+            timings.append((int(cumulative) / 1e6, module.strip()))
+        except ValueError:
+            # The header line.
+            continue
+    return sorted(timings, reverse=True)[:num_modules]
+
+
+def main(repeat=5, num_modules=15):
+    warm_root = mkdtemp()
+    try:
+        # Populate the calendar cache.
+        run(USE_CALENDAR, warm_root)
+        report(
+            'startup, best of {0}'.format(repeat),
+            [
+                ('import zipline + calendar, cold', best_of(
+                    lambda: run_cold(USE_CALENDAR),
+                    repeat=repeat,
+                )),
+                ('import zipline + calendar, warm', best_of(
+                    lambda: run(USE_CALENDAR, warm_root),
+                    repeat=repeat,
+                )),
+                ('import zipline', best_of(
+                    lambda: run(IMPORT_ZIPLINE, warm_root),
+                    repeat=repeat,
+                )),
+            ],
+        )
+    finally:
+        shutil.rmtree(warm_root)
+
+    if sys.version_info >= (3, 7):
+        title = 'slowest imports (cumulative)'
+        print(title)
+        print('-' * len(title))
+        for seconds, module in slowest_imports(num_modules):
+            print('{0:>10.4f}s  {1}'.format(seconds, module))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,80 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Time building pipeline root masks for consecutive chunks of a long date
+range, with and without ``AssetFinder.lifetimes(..., alive_only=True)``.
+
+Each chunk's dates reach back ``window_length`` days before the chunk, as
+they do for a pipeline with a trailing window.
+
+Usage::
+
+    $ python -m benchmarks.bench_lifetimes [num_assets] [chunksize] \
+        [window_length]
+"""
+from __future__ import print_function
+import sys
+
+import pandas as pd
+
+from zipline.assets import AssetFinder
+from zipline.utils.tradingcalendar import trading_days
+
+from .bench_asset_finder import make_engine
+from .utils import best_of, report
+
+
+def root_masks(finder, chunks, window_length, alive_only):
+    for dates in chunks:
+        lifetimes = finder.lifetimes(
+            dates,
+            include_start_date=False,
+            alive_only=alive_only,
+        )
+        lifetimes.loc[:, lifetimes.iloc[window_length:].any()]
+
+
+def main(num_assets=40000, chunksize=126, window_length=20):
+    engine, _ = make_engine(num_assets)
+    calendar = trading_days[
+        trading_days.slice_indexer(
+            pd.Timestamp('2000-01-03', tz='UTC'),
+            pd.Timestamp('2016-01-04', tz='UTC'),
+        )
+    ]
+    chunks = [
+        calendar[start - window_length:start + chunksize]
+        for start in range(window_length, len(calendar), chunksize)
+    ]
+
+    report(
+        'root masks, {0} assets, {1} chunks of {2} days'.format(
+            num_assets, len(chunks), chunksize,
+        ),
+        [
+            (label, best_of(
+                lambda: root_masks(
+                    AssetFinder(engine), chunks, window_length, alive_only,
+                ),
+            ))
+            for label, alive_only in (('all assets', False),
+                                      ('alive_only', True))
+        ],
+        unit=('chunks', len(chunks)),
+    )
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
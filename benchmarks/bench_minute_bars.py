@@ -0,0 +1,182 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compare the per-sid minute window loop against
+``BcolzMinuteBarReader.load_raw_window``, and spot lookups through
+``BcolzMinuteBarReader.get_value`` against ``MmapMinuteBarReader.get_value``.
+
+Usage::
+
+    $ python -m benchmarks.bench_minute_bars [num_sids] [num_days]
+"""
+from __future__ import print_function
+from multiprocessing.pool import ThreadPool
+import shutil
+import sys
+import tempfile
+
+import numpy as np
+
+from zipline.data.minute_bars import (
+    BcolzMinuteBarReader,
+    BcolzMinuteBarWriter,
+    MmapMinuteBarReader,
+    MmapMinuteBarWriter,
+    US_EQUITIES_MINUTES_PER_DAY,
+)
+from zipline.utils.tradingcalendar import open_and_closes
+
+from .utils import best_of, report
+
+FIELDS = ['open', 'high', 'low', 'close', 'volume']
+
+
+def write_data(rootdir, market_opens, num_sids,
+               writer_type=BcolzMinuteBarWriter):
+    writer = writer_type(
+        market_opens.index[0],
+        rootdir,
+        market_opens,
+        US_EQUITIES_MINUTES_PER_DAY,
+    )
+    deltas = np.arange(US_EQUITIES_MINUTES_PER_DAY).astype('timedelta64[m]')
+    dts = (market_opens.values[:, None] + deltas).ravel()
+    rand = np.random.RandomState(0)
+    for sid in range(1, num_sids + 1):
+        prices = rand.uniform(10, 100, len(dts))
+        writer.write_cols(sid, dts, {
+            'open': prices,
+            'high': prices,
+            'low': prices,
+            'close': prices,
+            'volume': rand.randint(1, 10000, len(dts)),
+        })
+
+
+def per_sid_window(reader, fields, start_dt, end_dt, sids):
+    """
+    The original per-(field, sid) read loop, kept here as a reference.
+    """
+    start_idx = reader._find_position_of_minute(start_dt)
+    end_idx = reader._find_position_of_minute(end_dt)
+    shape = (len(sids), (end_idx - start_idx + 1))
+    results = []
+    for field in fields:
+        if field != 'volume':
+            out = np.full(shape, np.nan)
+        else:
+            out = np.zeros(shape, dtype=np.uint32)
+        for i, sid in enumerate(sids):
+            values = reader._open_minute_file(field, sid)[
+                start_idx:end_idx + 1
+            ]
+            where = values != 0
+            out[i, where] = values[where]
+        if field != 'volume':
+            out *= reader._ohlc_inverse
+        results.append(out)
+    return results
+
+
+def main(num_sids=3000, num_days=5):
+    market_opens = open_and_closes.market_open['2015-06-01':][:num_days]
+    rootdir = tempfile.mkdtemp()
+    try:
+        write_data(rootdir, market_opens, num_sids)
+        reader = BcolzMinuteBarReader(rootdir)
+        sids = list(range(1, num_sids + 1))
+        end_dt = reader._minute_index[-1]
+        start_dt = reader._minute_index[-US_EQUITIES_MINUTES_PER_DAY]
+
+        # Warm the carray cache so that we time reads, not opens.
+        reader.load_raw_window(FIELDS, start_dt, end_dt, sids)
+
+        out = np.empty(
+            (len(FIELDS), num_sids, US_EQUITIES_MINUTES_PER_DAY),
+        )
+        pool = ThreadPool(4)
+        try:
+            timings = [
+                ('per-sid loop', best_of(
+                    lambda: per_sid_window(
+                        reader, FIELDS, start_dt, end_dt, sids,
+                    ),
+                )),
+                ('load_raw_window', best_of(
+                    lambda: reader.load_raw_window(
+                        FIELDS, start_dt, end_dt, sids, out=out,
+                    ),
+                )),
+                ('load_raw_window (4 threads)', best_of(
+                    lambda: reader.load_raw_window(
+                        FIELDS, start_dt, end_dt, sids, out=out, pool=pool,
+                    ),
+                )),
+            ]
+        finally:
+            pool.close()
+            pool.join()
+    finally:
+        shutil.rmtree(rootdir)
+
+    report(
+        '{0} sids x {1} minute window, {2} fields'.format(
+            num_sids, US_EQUITIES_MINUTES_PER_DAY, len(FIELDS),
+        ),
+        timings,
+    )
+
+
+def spot_lookups(reader, minutes, sids):
+    for sid in sids:
+        for minute in minutes:
+            reader.get_value(sid, minute, 'close')
+
+
+def main_spot(num_sids=100, num_days=5):
+    market_opens = open_and_closes.market_open['2015-06-01':][:num_days]
+    bcolz_dir = tempfile.mkdtemp()
+    mmap_dir = tempfile.mkdtemp()
+    try:
+        write_data(bcolz_dir, market_opens, num_sids)
+        write_data(mmap_dir, market_opens, num_sids, MmapMinuteBarWriter)
+        bcolz_reader = BcolzMinuteBarReader(bcolz_dir)
+        mmap_reader = MmapMinuteBarReader(mmap_dir)
+
+        sids = list(range(1, num_sids + 1))
+        minutes = list(bcolz_reader._minute_index[::37])
+
+        timings = [
+            ('bcolz get_value', best_of(
+                lambda: spot_lookups(bcolz_reader, minutes, sids),
+            )),
+            ('mmap get_value', best_of(
+                lambda: spot_lookups(mmap_reader, minutes, sids),
+            )),
+        ]
+    finally:
+        shutil.rmtree(bcolz_dir)
+        shutil.rmtree(mmap_dir)
+
+    report(
+        'spot lookups',
+        timings,
+        unit=('lookups', len(minutes) * num_sids),
+    )
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
+    main_spot()
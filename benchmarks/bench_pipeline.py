@@ -0,0 +1,103 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compare computing a long pipeline with a single ``run_pipeline`` call against
+``run_chunked_pipeline``, both sequentially and across worker processes.
+
+Usage::
+
+    $ python -m benchmarks.bench_pipeline [num_sids] [num_years] [workers]
+"""
+from __future__ import print_function
+import sys
+
+import pandas as pd
+
+from zipline.finance.trading import TradingEnvironment
+from zipline.pipeline import Pipeline
+from zipline.pipeline.data import USEquityPricing
+from zipline.pipeline.engine import SimplePipelineEngine
+from zipline.pipeline.factors import (
+    AverageDollarVolume,
+    Returns,
+    SimpleMovingAverage,
+)
+from zipline.pipeline.loaders.synthetic import SeededRandomLoader
+from zipline.testing import make_simple_equity_info
+
+from .utils import best_of, report
+
+
+def make_pipeline():
+    close = USEquityPricing.close
+    return Pipeline(
+        columns={
+            'sma_short': SimpleMovingAverage(inputs=[close], window_length=10),
+            'sma_long': SimpleMovingAverage(inputs=[close], window_length=100),
+            'returns': Returns(window_length=20),
+        },
+        screen=AverageDollarVolume(window_length=30).top(100),
+    )
+
+
+def main(num_sids=500, num_years=15, workers=4):
+    env = TradingEnvironment()
+    calendar = env.trading_days
+    end = calendar[calendar.searchsorted(pd.Timestamp('2015-01-01'))]
+    start = end - pd.DateOffset(years=num_years)
+    start = calendar[calendar.searchsorted(start)]
+    # Leave room for the lookback of the longest window.
+    first_day = calendar[calendar.get_loc(start) - 200]
+
+    sids = list(range(1, num_sids + 1))
+    env.write_data(
+        equities_df=make_simple_equity_info(sids, first_day, end),
+    )
+    loader = SeededRandomLoader(
+        0,
+        USEquityPricing.columns,
+        calendar[calendar.slice_indexer(first_day, end)],
+        sids,
+    )
+    engine = SimplePipelineEngine(
+        lambda column: loader, calendar, env.asset_finder,
+    )
+    pipeline = make_pipeline()
+
+    report(
+        '{0} sids x {1} years'.format(num_sids, num_years),
+        [
+            ('run_pipeline', best_of(
+                lambda: engine.run_pipeline(pipeline, start, end),
+                repeat=1,
+            )),
+            ('chunked, 252 days', best_of(
+                lambda: engine.run_chunked_pipeline(
+                    pipeline, start, end, chunksize=252,
+                ),
+                repeat=1,
+            )),
+            ('chunked, 252 days, {0} workers'.format(workers), best_of(
+                lambda: engine.run_chunked_pipeline(
+                    pipeline, start, end, chunksize=252, workers=workers,
+                ),
+                repeat=1,
+            )),
+        ],
+    )
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,113 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compare the incremental ``RiskMetricsCumulative.update`` against recomputing
+the cumulative metrics from the full history of returns on every update, for
+a long daily run and for a year of minute emission.
+
+Usage::
+
+    $ python -m benchmarks.bench_risk [num_years] [minutes_per_day]
+"""
+from __future__ import print_function
+import sys
+
+import numpy as np
+import pandas as pd
+
+from zipline.finance.risk import RiskMetricsCumulative
+from zipline.finance.trading import TradingEnvironment
+from zipline.utils.factory import create_simulation_parameters
+
+from .utils import best_of, report
+
+
+class FullRecomputeRiskMetrics(RiskMetricsCumulative):
+    """
+    Reference implementation which recomputes the history-dependent metrics
+    from scratch after every update, the way ``update`` used to.
+    """
+
+    def update(self, dt, algorithm_returns, benchmark_returns, leverage):
+        super(FullRecomputeRiskMetrics, self).update(
+            dt, algorithm_returns, benchmark_returns, leverage,
+        )
+        dt_loc = self.latest_dt_loc
+        self.algorithm_cumulative_returns[dt_loc] = \
+            self.calculate_cumulative_returns(self.algorithm_returns)
+        self.benchmark_cumulative_returns[dt_loc] = \
+            self.calculate_cumulative_returns(self.benchmark_returns)
+        self.algorithm_volatility[dt_loc] = \
+            self.calculate_volatility(self.algorithm_returns)
+        self.benchmark_volatility[dt_loc] = \
+            self.calculate_volatility(self.benchmark_returns)
+        self.beta[dt_loc] = self.calculate_beta()
+        self.downside_risk[dt_loc] = self.calculate_downside_risk()
+
+
+def run(cls, sim_params, env, returns, updates_per_day):
+    metrics = cls(sim_params, env, create_first_day_stats=True)
+    for dt, (algo, bench) in zip(sim_params.trading_days, returns):
+        for _ in range(updates_per_day):
+            metrics.update(dt, algo, bench, 1.0)
+
+
+def bench(env, sim_params, updates_per_day, title):
+    rand = np.random.RandomState(0)
+    returns = rand.normal(0, 0.01, (len(sim_params.trading_days), 2))
+    num_updates = len(returns) * updates_per_day
+    report(
+        title,
+        [
+            ('full recompute', best_of(
+                lambda: run(FullRecomputeRiskMetrics,
+                            sim_params, env, returns, updates_per_day),
+                repeat=1,
+            )),
+            ('incremental', best_of(
+                lambda: run(RiskMetricsCumulative,
+                            sim_params, env, returns, updates_per_day),
+                repeat=1,
+            )),
+        ],
+        unit=('updates', num_updates),
+    )
+
+
+def main(num_years=20, minutes_per_day=390):
+    env = TradingEnvironment()
+    start = pd.Timestamp('1994-01-03', tz='UTC')
+    daily = create_simulation_parameters(
+        start=start,
+        end=start + pd.DateOffset(years=num_years),
+        env=env,
+    )
+    bench(env, daily, 1, 'Daily updates, {0} days'.format(
+        len(daily.trading_days),
+    ))
+
+    minute = create_simulation_parameters(
+        start=start,
+        end=start + pd.DateOffset(years=1),
+        env=env,
+        emission_rate='minute',
+    )
+    bench(env, minute, minutes_per_day, 'Minute emission, {0} days'.format(
+        len(minute.trading_days),
+    ))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,100 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compare dispatching scheduled functions from compiled trigger times against
+evaluating their rules on every minute.
+
+Usage::
+
+    $ python -m benchmarks.bench_schedule_function [num_days] [num_events]
+"""
+from __future__ import print_function
+from collections import namedtuple
+import sys
+
+import pandas as pd
+
+from zipline.finance.trading import TradingEnvironment
+from zipline.utils.events import (
+    AfterOpen,
+    BeforeClose,
+    Event,
+    EventManager,
+    NDaysBeforeLastTradingDayOfMonth,
+    NthTradingDayOfMonth,
+    NthTradingDayOfWeek,
+    make_eventrule,
+)
+
+from .utils import best_of, report
+
+
+def make_rules(num_events):
+    date_rules = [
+        lambda: NthTradingDayOfWeek(0),
+        lambda: NthTradingDayOfMonth(1),
+        lambda: NDaysBeforeLastTradingDayOfMonth(0),
+    ]
+    time_rules = [
+        lambda: AfterOpen(minutes=30),
+        lambda: BeforeClose(minutes=15),
+    ]
+    return [
+        make_eventrule(
+            date_rules[i % len(date_rules)](),
+            time_rules[i % len(time_rules)](),
+        )
+        for i in range(num_events)
+    ]
+
+
+def dispatch(env, sessions, minutes, num_events, compiled):
+    em = EventManager()
+    for rule in make_rules(num_events):
+        em.add_event(Event(rule, lambda context, data: None))
+    if compiled:
+        em.compile(sessions, env)
+
+    context = namedtuple('FakeAlgo', ['trading_environment'])(env)
+    for minute in minutes:
+        em.handle_data(context, None, minute)
+
+
+def main(num_days=21, num_events=12):
+    env = TradingEnvironment()
+    sessions = env.days_in_range(
+        pd.Timestamp('2014-01-01', tz='UTC'),
+        pd.Timestamp('2016-01-01', tz='UTC'),
+    )[:num_days]
+    minutes = list(env.minutes_for_days_in_range(sessions[0], sessions[-1]))
+
+    report(
+        '{0} scheduled functions, {1} days of minutes'.format(
+            num_events, num_days,
+        ),
+        [
+            ('evaluate rules', best_of(
+                lambda: dispatch(env, sessions, minutes, num_events, False),
+            )),
+            ('compiled', best_of(
+                lambda: dispatch(env, sessions, minutes, num_events, True),
+            )),
+        ],
+        unit=('minutes', len(minutes)),
+    )
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
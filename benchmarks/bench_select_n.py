@@ -0,0 +1,79 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compare selecting the top N assets and percentile ranges of a factor by
+partitioning each day's values against the sort-based implementations.
+
+Usage::
+
+    $ python -m benchmarks.bench_select_n [num_sids] [num_days] [N]
+"""
+from __future__ import print_function
+import sys
+
+import numpy as np
+
+from zipline.lib.rank import (
+    masked_between_percentiles_2d,
+    masked_rankdata_2d,
+    masked_select_n_2d,
+)
+
+from .utils import best_of, report
+
+
+def sorted_percentiles(data, mask, min_percentile, max_percentile):
+    data = data.copy()
+    data[~mask] = np.nan
+    lower = np.nanpercentile(data, min_percentile, axis=1, keepdims=True)
+    upper = np.nanpercentile(data, max_percentile, axis=1, keepdims=True)
+    return (lower <= data) & (data <= upper)
+
+
+def main(num_sids=8000, num_days=4000, N=500):
+    rand = np.random.RandomState(0)
+    data = rand.randn(num_days, num_sids)
+    data[rand.rand(num_days, num_sids) < 0.05] = np.nan
+    mask = rand.rand(num_days, num_sids) < 0.9
+
+    title = '{0} sids x {1} days'.format(num_sids, num_days)
+    report(
+        'top {0}, {1}'.format(N, title),
+        [
+            ('rank <= N', best_of(
+                lambda: masked_rankdata_2d(
+                    data, mask, np.nan, 'ordinal', False,
+                ) <= N,
+            )),
+            ('partition', best_of(
+                lambda: masked_select_n_2d(data, mask, np.nan, N, False),
+            )),
+        ],
+    )
+    report(
+        'percentile_between(10, 90), {0}'.format(title),
+        [
+            ('nanpercentile', best_of(
+                lambda: sorted_percentiles(data, mask, 10.0, 90.0),
+            )),
+            ('partition', best_of(
+                lambda: masked_between_percentiles_2d(data, mask, 10.0, 90.0),
+            )),
+        ],
+    )
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,107 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compare TradingEnvironment's array-based calendar navigation against the
+equivalent lookups on its DatetimeIndex and DataFrame of opens and closes.
+
+Usage::
+
+    $ python -m benchmarks.bench_trading_calendar [num_days]
+"""
+from __future__ import print_function
+import datetime
+import sys
+
+import numpy as np
+import pandas as pd
+
+from zipline.finance.trading import TradingEnvironment
+
+from .utils import best_of, report
+
+
+def stepping_next_trading_day(env, dt):
+    dt = env.normalize_date(dt)
+    while dt <= env.last_trading_day:
+        dt += datetime.timedelta(days=1)
+        if dt in env.trading_days:
+            return dt
+
+
+def get_loc_open_and_close(env, day):
+    row = env.open_and_closes.iloc[
+        env.open_and_closes.index.get_loc(day.date())
+    ]
+    return row[0], row[1]
+
+
+def date_range_minutes(env, start, end):
+    return pd.DatetimeIndex(
+        np.concatenate([
+            env.market_minutes_for_day(day)
+            for day in env.days_in_range(start, end)
+        ]),
+        tz='UTC',
+    )
+
+
+def main(num_days=250):
+    env = TradingEnvironment()
+    days = env.days_in_range(
+        pd.Timestamp('2010-01-01', tz='UTC'),
+        pd.Timestamp('2016-01-01', tz='UTC'),
+    )[:num_days]
+    unit = ('days', len(days))
+
+    report(
+        'next_trading_day',
+        [
+            ('step and test membership', best_of(
+                lambda: [stepping_next_trading_day(env, d) for d in days],
+            )),
+            ('searchsorted', best_of(
+                lambda: [env.next_trading_day(d) for d in days],
+            )),
+        ],
+        unit=unit,
+    )
+    report(
+        'get_open_and_close',
+        [
+            ('get_loc + iloc', best_of(
+                lambda: [get_loc_open_and_close(env, d) for d in days],
+            )),
+            ('searchsorted', best_of(
+                lambda: [env.get_open_and_close(d) for d in days],
+            )),
+        ],
+        unit=unit,
+    )
+    report(
+        'minutes_for_days_in_range',
+        [
+            ('date_range per day', best_of(
+                lambda: date_range_minutes(env, days[0], days[-1]),
+            )),
+            ('vectorized', best_of(
+                lambda: env.minutes_for_days_in_range(days[0], days[-1]),
+            )),
+        ],
+        unit=unit,
+    )
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,60 @@
+#
+# Copyright 2016 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import print_function
+import timeit
+
+
+def best_of(f, repeat=3, number=1):
+    """
+    Return the best wall-clock time, in seconds, of ``number`` calls to ``f``
+    over ``repeat`` trials.
+    """
+    return min(timeit.repeat(f, repeat=repeat, number=number)) / number
+
+
+def report(title, timings, unit=None):
+    """
+    Print a table of timings, along with each entry's speedup relative to the
+    first entry.
+
+    Parameters
+    ----------
+    title : str
+        Heading for the table.
+    timings : list of (str, float)
+        Pairs of (label, seconds).
+    unit : (str, int), optional
+        A (name, count) pair used to report a throughput column, e.g.
+        ``('events', 1000000)``.
+    """
+    print(title)
+    print('-' * len(title))
+    baseline = timings[0][1]
+    width = max(len(label) for label, _ in timings)
+    for label, seconds in timings:
+        line = '{label:<{width}}  {seconds:>10.4f}s  {speedup:>7.2f}x'.format(
+            label=label,
+            width=width,
+            seconds=seconds,
+            speedup=baseline / seconds,
+        )
+        if unit is not None:
+            name, count = unit
+            line += '  {rate:>14,.0f} {name}/s'.format(
+                rate=count / seconds,
+                name=name,
+            )
+        print(line)
+    print()
@@ -87,6 +87,7 @@ ext_modules = [
     Extension('zipline.lib._int64window', ['zipline/lib/_int64window.pyx']),
     Extension('zipline.lib._uint8window', ['zipline/lib/_uint8window.pyx']),
     Extension('zipline.lib.rank', ['zipline/lib/rank.pyx']),
+    Extension('zipline.lib.rolling', ['zipline/lib/rolling.pyx']),
     Extension('zipline.data._equities', ['zipline/data/_equities.pyx']),
     Extension('zipline.data._adjustments', ['zipline/data/_adjustments.pyx']),
 ]
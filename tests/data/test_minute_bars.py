@@ -13,12 +13,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from datetime import timedelta
+from multiprocessing.pool import ThreadPool
 import os
 
 from unittest import TestCase
 
-from numpy import nan, array
-from numpy.testing import assert_almost_equal
+from numpy import nan, arange, array, empty
+from numpy.testing import assert_almost_equal, assert_array_equal
 from pandas import (
     DataFrame,
     DatetimeIndex,
@@ -32,6 +33,9 @@ from zipline.data.minute_bars import (
     BcolzMinuteBarWriter,
     BcolzMinuteBarReader,
     BcolzMinuteOverlappingData,
+    MinutePositionIndex,
+    MmapMinuteBarReader,
+    MmapMinuteBarWriter,
     US_EQUITIES_MINUTES_PER_DAY,
 )
 from zipline.finance.trading import TradingEnvironment
@@ -545,3 +549,239 @@ class BcolzMinuteBarTestCase(TestCase):
         for i, col in enumerate(columns):
             for j, sid in enumerate(sids):
                 assert_almost_equal(data[sid][col], arrays[i][j])
+
+    def test_load_raw_window(self):
+        start_minute = self.market_opens[TEST_CALENDAR_START]
+        minutes = [start_minute,
+                   start_minute + Timedelta('1 min'),
+                   start_minute + Timedelta('2 min')]
+        sids = [1, 2, 3]
+        data = {}
+        for sid in sids:
+            data[sid] = DataFrame(
+                data={
+                    'open': [sid + 15.0, nan, sid + 15.1],
+                    'high': [sid + 17.0, nan, sid + 17.1],
+                    'low': [sid + 11.0, nan, sid + 11.1],
+                    'close': [sid + 14.0, nan, sid + 14.1],
+                    'volume': [sid + 1000, 0, sid + 1001],
+                },
+                index=minutes)
+            self.writer.write(sid, data[sid])
+
+        reader = BcolzMinuteBarReader(self.dest)
+        columns = ['volume', 'close', 'open']
+
+        out = empty((len(columns), len(sids), len(minutes)))
+        pool = ThreadPool(2)
+        try:
+            result = reader.load_raw_window(
+                columns, minutes[0], minutes[-1], sids, out=out, pool=pool,
+            )
+        finally:
+            pool.close()
+            pool.join()
+
+        self.assertIs(result, out)
+        for i, col in enumerate(columns):
+            for j, sid in enumerate(sids):
+                assert_almost_equal(data[sid][col], out[i, j])
+
+        with self.assertRaises(ValueError):
+            reader.load_raw_window(
+                columns, minutes[0], minutes[-1], sids, out=empty((1, 1, 1)),
+            )
+
+
+class MmapMinuteBarTestCase(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.env = TradingEnvironment()
+        all_market_opens = cls.env.open_and_closes.market_open
+        indexer = all_market_opens.index.slice_indexer(
+            start=TEST_CALENDAR_START,
+            end=TEST_CALENDAR_STOP
+        )
+        cls.market_opens = all_market_opens[indexer]
+        cls.test_calendar_start = cls.market_opens.index[0]
+        cls.test_calendar_stop = cls.market_opens.index[-1]
+
+    def setUp(self):
+        self.dir_ = TempDirectory()
+        self.dir_.create()
+        self.dest = self.dir_.getpath('minute_bars')
+        os.makedirs(self.dest)
+        self.writer = MmapMinuteBarWriter(
+            TEST_CALENDAR_START,
+            self.dest,
+            self.market_opens,
+            US_EQUITIES_MINUTES_PER_DAY,
+        )
+
+    def tearDown(self):
+        self.dir_.cleanup()
+
+    def make_data(self, minutes, offset=0.0):
+        count = len(minutes)
+        return DataFrame(
+            data={
+                'open': arange(count) + 10.0 + offset,
+                'high': arange(count) + 20.0 + offset,
+                'low': arange(count) + 30.0 + offset,
+                'close': arange(count) + 40.0 + offset,
+                'volume': arange(count) + 50.0 + offset,
+            },
+            index=minutes,
+        )
+
+    def test_minute_position_index(self):
+        market_opens = self.market_opens.values.astype('datetime64[ns]')
+        index = MinutePositionIndex(
+            market_opens.view('i8'), US_EQUITIES_MINUTES_PER_DAY,
+        )
+
+        first_open = self.market_opens[0]
+        second_open = self.market_opens[1]
+        minutes = [
+            first_open,
+            first_open + Timedelta('389 min'),
+            second_open,
+            second_open + Timedelta('5 min'),
+        ]
+        expected = [0, 389, 390, 395]
+        for minute, position in zip(minutes, expected):
+            self.assertEqual(index.position(minute.value), position)
+        assert_array_equal(
+            index.positions(DatetimeIndex(minutes).asi8), expected,
+        )
+
+        not_minutes = [
+            # Before the open.
+            first_open - Timedelta('1 min'),
+            # After the last minute slot of the day.
+            first_open + Timedelta('390 min'),
+            # A weekend.
+            Timestamp('2015-06-06 15:00', tz='UTC'),
+            # Before and after the calendar.
+            Timestamp('2015-05-01 15:00', tz='UTC'),
+            Timestamp('2015-08-03 15:00', tz='UTC'),
+        ]
+        for minute in not_minutes:
+            with self.assertRaises(KeyError):
+                index.position(minute.value)
+            with self.assertRaises(KeyError):
+                index.positions(array([minute.value]))
+
+    def test_write_and_get_value(self):
+        minute_0 = self.market_opens[self.test_calendar_start]
+        minutes = DatetimeIndex([minute_0, minute_0 + timedelta(minutes=1)])
+        sid = 1
+        data = self.make_data(minutes)
+        self.writer.write(sid, data)
+
+        reader = MmapMinuteBarReader(self.dest)
+        for minute in minutes:
+            for field in data.columns:
+                self.assertEqual(
+                    data.loc[minute, field],
+                    reader.get_value(sid, minute, field),
+                )
+
+        # A minute with no trade.
+        empty_minute = minute_0 + timedelta(minutes=2)
+        assert_almost_equal(nan, reader.get_value(sid, empty_minute, 'close'))
+        self.assertEqual(0, reader.get_value(sid, empty_minute, 'volume'))
+
+        # A minute after the last written session.
+        after = self.market_opens[self.test_calendar_start + 1]
+        assert_almost_equal(nan, reader.get_value(sid, after, 'close'))
+        self.assertEqual(0, reader.get_value(sid, after, 'volume'))
+
+    def test_write_on_multiple_days_with_pad(self):
+        tds = self.market_opens.index
+        days = tds[tds.slice_indexer(
+            start=self.test_calendar_start + 1,
+            end=self.test_calendar_start + 3
+        )]
+        minutes = DatetimeIndex([
+            self.market_opens[days[0]] + timedelta(minutes=60),
+            self.market_opens[days[1]] + timedelta(minutes=120),
+        ])
+        sid = 1
+        data = self.make_data(minutes)
+        self.writer.write(sid, data)
+
+        self.assertEqual(
+            days[1], self.writer.last_date_in_output_for_sid(sid),
+        )
+
+        reader = MmapMinuteBarReader(self.dest)
+        for minute in minutes:
+            for field in data.columns:
+                self.assertEqual(
+                    data.loc[minute, field],
+                    reader.get_value(sid, minute, field),
+                )
+
+        # The first day was padded with no trades.
+        first_minute = self.market_opens[self.test_calendar_start]
+        assert_almost_equal(nan, reader.get_value(sid, first_minute, 'open'))
+
+    def test_no_overwrite(self):
+        minute = self.market_opens[TEST_CALENDAR_START]
+        sid = 1
+        data = self.make_data(DatetimeIndex([minute]))
+        self.writer.write(sid, data)
+
+        with self.assertRaises(BcolzMinuteOverlappingData):
+            self.writer.write(sid, data)
+
+    def test_pad_data(self):
+        sid = 1
+        self.assertIs(self.writer.last_date_in_output_for_sid(sid), NaT)
+
+        day = self.test_calendar_start + 2
+        self.writer.pad(sid, day)
+        self.assertEqual(day, self.writer.last_date_in_output_for_sid(sid))
+
+        minute = self.market_opens[self.test_calendar_start + 3]
+        data = self.make_data(DatetimeIndex([minute]))
+        self.writer.write(sid, data)
+
+        reader = MmapMinuteBarReader(self.dest)
+        self.assertEqual(10.0, reader.get_value(sid, minute, 'open'))
+
+    def test_unadjusted_minutes_matches_bcolz(self):
+        start_minute = self.market_opens[TEST_CALENDAR_START]
+        minutes = DatetimeIndex([
+            start_minute,
+            start_minute + Timedelta('1 min'),
+            start_minute + Timedelta('2 min'),
+        ])
+        sids = [1, 2]
+
+        bcolz_dest = self.dir_.getpath('bcolz_minute_bars')
+        os.makedirs(bcolz_dest)
+        bcolz_writer = BcolzMinuteBarWriter(
+            TEST_CALENDAR_START,
+            bcolz_dest,
+            self.market_opens,
+            US_EQUITIES_MINUTES_PER_DAY,
+        )
+        for sid in sids:
+            data = self.make_data(minutes, offset=sid)
+            data.iloc[1] = [nan, nan, nan, nan, 0]
+            self.writer.write(sid, data)
+            bcolz_writer.write(sid, data)
+
+        columns = ['open', 'high', 'low', 'close', 'volume']
+        result = MmapMinuteBarReader(self.dest).unadjusted_window(
+            columns, minutes[0], minutes[-1], sids,
+        )
+        expected = BcolzMinuteBarReader(bcolz_dest).unadjusted_window(
+            columns, minutes[0], minutes[-1], sids,
+        )
+        for res, exp in zip(result, expected):
+            self.assertEqual(res.dtype, exp.dtype)
+            assert_array_equal(res, exp)
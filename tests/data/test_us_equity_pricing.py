@@ -18,8 +18,10 @@ from nose_parameterized import parameterized
 from numpy import (
     arange,
     datetime64,
+    nan,
 )
 from numpy.testing import (
+    assert_almost_equal,
     assert_array_equal,
 )
 from pandas import (
@@ -321,3 +323,30 @@ class BcolzDailyBarTestCase(TestCase):
 
         close = reader.spot_price(zero_sid, zero_day, 'close')
         self.assertEqual(-1, close)
+
+    def test_spot_prices_matches_spot_price(self):
+        table = self.writer.write(self.dest, self.trading_days, self.assets)
+        reader = BcolzDailyBarReader(table)
+
+        # Write a zero into the data so that we cover the -1 sentinel.
+        zero_day = Timestamp('2015-06-02', tz='UTC')
+        reader._spot_col('close')[reader.sid_day_index(1, zero_day)] = 0
+
+        columns = ['open', 'close', 'volume']
+        sids = list(reversed(self.assets))
+        for day in self.trading_days:
+            result = reader.spot_prices(sids, day, columns)
+            self.assertEqual(result.shape, (len(columns), len(sids)))
+            for i, column in enumerate(columns):
+                for j, sid in enumerate(sids):
+                    try:
+                        expected = reader.spot_price(sid, day, column)
+                    except NoDataOnDate:
+                        expected = nan
+                    assert_almost_equal(result[i, j], expected)
+
+    def test_spot_prices_unknown_sid(self):
+        table = self.writer.write(self.dest, self.trading_days, self.assets)
+        reader = BcolzDailyBarReader(table)
+        with self.assertRaises(KeyError):
+            reader.spot_prices([1, 100], TEST_QUERY_START, ['close'])
@@ -13,7 +13,8 @@ from numpy import (
     where,
 )
 from numpy.testing import assert_array_equal
-from six.moves import zip_longest
+from six import itervalues
+from six.moves import zip, zip_longest
 
 from zipline.errors import WindowLengthNotPositive, WindowLengthTooLong
 from zipline.lib.adjustment import (
@@ -21,7 +22,12 @@ from zipline.lib.adjustment import (
     Float64Multiply,
     Float64Overwrite,
 )
-from zipline.lib.adjusted_array import AdjustedArray, NOMASK
+from zipline.lib.adjusted_array import (
+    AdjustedArray,
+    NOMASK,
+    SharedWindowBuffer,
+    window_region,
+)
 from zipline.testing import check_arrays, parameter_space
 from zipline.utils.numpy_utils import (
     coerce_to_dtype,
@@ -317,6 +323,89 @@ class AdjustedArrayTestCase(TestCase):
                 self.assertEqual(yielded.dtype, data.dtype)
                 assert_array_equal(yielded, expected_yield)
 
+    @parameterized.expand(
+        chain(
+            _gen_multiplicative_adjustment_cases(float64_dtype),
+            _gen_overwrite_adjustment_cases(datetime64ns_dtype),
+        )
+    )
+    def test_shared_window_buffer(self,
+                                  name,
+                                  data,
+                                  lookback,
+                                  adjustments,
+                                  missing_value,
+                                  expected):
+        array = AdjustedArray(data, NOMASK, adjustments, missing_value)
+        buffer = SharedWindowBuffer(array)
+
+        # Anchor windows of every length on the same row, as the pipeline
+        # engine does for terms consuming the same input.
+        lengths = range(1, lookback + 1)
+        shared = zip(*[buffer.traverse(n, offset=lookback - n)
+                       for n in lengths])
+        private = zip(*[array.traverse(n, offset=lookback - n)
+                        for n in lengths])
+        for shared_windows, private_windows in zip_longest(shared, private):
+            for yielded, expected_yield in zip_longest(shared_windows,
+                                                       private_windows):
+                self.assertEqual(yielded.dtype, data.dtype)
+                assert_array_equal(yielded, expected_yield)
+
+        self.assertEqual(buffer.nbytes, data.nbytes)
+        self.assertEqual(
+            buffer.adjustments_applied,
+            sum(map(len, itervalues(adjustments))),
+        )
+
+    @parameterized.expand(
+        chain(
+            _gen_multiplicative_adjustment_cases(float64_dtype),
+            _gen_overwrite_adjustment_cases(datetime64ns_dtype),
+        )
+    )
+    def test_shared_window_buffer_blocks(self,
+                                         name,
+                                         data,
+                                         lookback,
+                                         adjustments,
+                                         missing_value,
+                                         expected):
+        array = AdjustedArray(data, NOMASK, adjustments, missing_value)
+        window_iter = array.shared_window_buffer().traverse(lookback)
+
+        remaining = len(expected)
+        blocks = []
+        while remaining:
+            block_size = window_iter.block_size(remaining)
+            self.assertGreater(block_size, 0)
+            block = window_iter.next_block(block_size)
+            self.assertEqual(block.dtype, data.dtype)
+            self.assertEqual(block.shape[:2], (block_size, lookback))
+            region = window_region(block)
+            self.assertEqual(len(region), block_size + lookback - 1)
+            for i, window in enumerate(block):
+                assert_array_equal(window, region[i:i + lookback])
+            # Check each block before the buffer is adjusted again.
+            blocks.append([window.copy() for window in block])
+            remaining -= block_size
+
+        for yielded, expected_yield in zip_longest(chain(*blocks), expected):
+            assert_array_equal(yielded, expected_yield)
+
+    def test_shared_window_buffer_out_of_order(self):
+        data = arange(30, dtype=float).reshape(6, 5)
+        adjustments = {2: [Float64Multiply(0, 1, 0, 0, 2.0)]}
+        buffer = SharedWindowBuffer(
+            AdjustedArray(data, NOMASK, adjustments, float('nan')),
+        )
+        ahead = buffer.traverse(4)
+        behind = buffer.traverse(2)
+
+        next(ahead)
+        with self.assertRaises(ValueError):
+            next(behind)
+
     @parameter_space(
         dtype=[float64_dtype, int64_dtype, datetime64ns_dtype],
         missing_value=[0, 10000],
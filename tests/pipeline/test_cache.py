@@ -0,0 +1,119 @@
+"""
+Tests for zipline.pipeline.cache.
+"""
+from unittest import TestCase
+
+from numpy import arange, array, full, nan, ones
+from numpy.testing import assert_array_equal
+from pandas import date_range, Int64Index
+from testfixtures import TempDirectory
+
+from zipline.pipeline import Factor
+from zipline.pipeline.cache import TermCache
+from zipline.utils.numpy_utils import float64_dtype
+
+
+class SomeFactor(Factor):
+    dtype = float64_dtype
+    inputs = ()
+    window_length = 0
+
+
+class SomeOtherFactor(Factor):
+    dtype = float64_dtype
+    inputs = ()
+    window_length = 0
+
+
+class TermCacheTestCase(TestCase):
+
+    def setUp(self):
+        self.tempdir = TempDirectory()
+        self.dates = date_range('2014-01-02', periods=10, freq='D', tz='UTC')
+        self.assets = Int64Index([1, 2, 3])
+        self.values = arange(30, dtype=float).reshape(10, 3)
+        self.mask = ones((10, 3), dtype=bool)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_keys(self):
+        cache = TermCache(self.tempdir.path, max_bytes=1000)
+        other_version = TermCache(
+            self.tempdir.path, max_bytes=1000, data_version='v2',
+        )
+        self.assertEqual(cache.key(SomeFactor()), cache.key(SomeFactor()))
+        self.assertNotEqual(
+            cache.key(SomeFactor()), cache.key(SomeOtherFactor()),
+        )
+        self.assertNotEqual(
+            cache.key(SomeFactor()), other_version.key(SomeFactor()),
+        )
+
+    def test_load_ranges(self):
+        term = SomeFactor()
+        cache = TermCache(self.tempdir.path, max_bytes=1000)
+        cache.store(term, self.dates[:6], self.assets, self.values[:6])
+
+        # A sub-range is served from the stored entry.
+        values, covered = cache.load(
+            term, self.dates[2:5], self.assets, self.mask[2:5],
+        )
+        assert_array_equal(values, self.values[2:5])
+        self.assertTrue(covered.all())
+
+        # Only the stored dates of an overlapping range are covered.
+        values, covered = cache.load(
+            term, self.dates[4:], self.assets, self.mask[4:],
+        )
+        assert_array_equal(covered, arange(4, 10) < 6)
+        assert_array_equal(values[:2], self.values[4:6])
+        self.assertTrue((values[2:] != values[2:]).all())
+
+        # Reopening the cache finds the same entry.
+        reopened = TermCache(self.tempdir.path, max_bytes=1000)
+        values, covered = reopened.load(
+            term, self.dates[:6], self.assets, self.mask[:6],
+        )
+        assert_array_equal(values, self.values[:6])
+        self.assertTrue(covered.all())
+
+    def test_load_new_assets(self):
+        term = SomeFactor()
+        cache = TermCache(self.tempdir.path, max_bytes=1000)
+        cache.store(term, self.dates, self.assets[:2], self.values[:, :2])
+
+        # Asset 3 only existed on the last two dates, so the other rows can be
+        # served with missing values for it.
+        mask = self.mask.copy()
+        mask[:8, 2] = False
+        values, covered = cache.load(term, self.dates, self.assets, mask)
+        assert_array_equal(covered, arange(10) < 8)
+        expected = full((8, 3), nan)
+        expected[:, :2] = self.values[:8, :2]
+        assert_array_equal(values[:8], expected)
+
+    def test_lru_eviction(self):
+        terms = [SomeFactor(), SomeOtherFactor(), -SomeFactor()]
+        # Room for two entries.
+        cache = TermCache(self.tempdir.path, max_bytes=self.values.nbytes * 2)
+
+        cache.store(terms[0], self.dates, self.assets, self.values)
+        cache.store(terms[1], self.dates, self.assets, self.values)
+        # Reading the first entry makes the second the least recently used.
+        cache.load(terms[0], self.dates, self.assets, self.mask)
+        cache.store(terms[2], self.dates, self.assets, self.values)
+
+        self.assertEqual(cache.nbytes, self.values.nbytes * 2)
+        for term, expect_cached in zip(terms, [True, False, True]):
+            _, covered = cache.load(term, self.dates, self.assets, self.mask)
+            self.assertEqual(covered.all(), expect_cached)
+
+        # Entries larger than the cache aren't stored.
+        cache.store(
+            terms[1],
+            self.dates,
+            Int64Index(arange(10)),
+            array([self.values] * 4).reshape(10, 12),
+        )
+        self.assertEqual(cache.nbytes, self.values.nbytes * 2)
@@ -5,6 +5,8 @@ from __future__ import division
 from collections import OrderedDict
 from unittest import TestCase
 from itertools import product
+import json
+import os
 
 from nose_parameterized import parameterized
 from numpy import (
@@ -51,6 +53,7 @@ from zipline.pipeline.loaders.frame import DataFrameLoader
 from zipline.pipeline.loaders.equity_pricing_loader import (
     USEquityPricingLoader,
 )
+from zipline.pipeline.cache import TermCache
 from zipline.pipeline.engine import SimplePipelineEngine
 from zipline.pipeline import CustomFactor
 from zipline.pipeline.factors import (
@@ -95,6 +98,28 @@ class AssetID(CustomFactor):
         out[:] = assets
 
 
+class MovingMax(SimpleMovingAverage):
+    """
+    Subclass of a factor with a `compute_all` that only overrides `compute`.
+    """
+    def compute(self, today, assets, out, data):
+        out[:] = data.max(axis=0)
+
+
+class RecordingLoader(object):
+    """
+    PipelineLoader that records the dates it's asked to load before
+    forwarding to another loader.
+    """
+    def __init__(self, loader):
+        self.loader = loader
+        self.loaded_dates = []
+
+    def load_adjusted_array(self, columns, dates, assets, mask):
+        self.loaded_dates.append(dates)
+        return self.loader.load_adjusted_array(columns, dates, assets, mask)
+
+
 def assert_multi_index_is_product(testcase, index, *levels):
     """Assert that a MultiIndex contains the product of `*levels`."""
     testcase.assertIsInstance(
@@ -227,6 +252,39 @@ class ConstantInputTestCase(TestCase):
 
             assert_frame_equal(result, expected_result)
 
+    def test_workspace_refcounting(self):
+        loader = self.loader
+        stats = []
+        engine = SimplePipelineEngine(
+            lambda column: loader,
+            self.dates,
+            self.asset_finder,
+            report_stats=stats.append,
+        )
+        num_dates = 5
+        dates = self.dates[10:10 + num_dates]
+
+        factor = AssetID()
+        for _ in range(5):
+            factor = factor.rank()
+
+        result = engine.run_pipeline(
+            Pipeline(columns={'f': factor}), dates[0], dates[-1],
+        )
+        check_arrays(
+            result['f'].unstack().values,
+            tile(array(self.asset_ids, dtype=float), (num_dates, 1)),
+        )
+
+        # Each intermediate should be released as soon as the next term in
+        # the chain is computed, so at most the root mask, one float64 input
+        # and the float64 term computed from it are held at once.
+        num_cells = num_dates * len(self.asset_ids)
+        self.assertEqual(
+            [s.peak_workspace_bytes for s in stats],
+            [num_cells * (1 + 8 + 8)],
+        )
+
     def test_single_factor(self):
         loader = self.loader
         assets = self.assets
@@ -626,6 +684,110 @@ class FrameInputTestCase(TestCase):
                 high_results = results.unstack()['high']
                 assert_frame_equal(high_results, high_base.iloc[iloc_bounds])
 
+    def test_shared_window_buffers(self):
+        dates, asset_ids = self.dates, self.asset_ids
+        high = USEquityPricing.high
+        apply_idxs = [8, 12, 16]
+
+        adjustments = DataFrame.from_records(
+            [
+                dict(
+                    kind=MULTIPLY,
+                    sid=asset_ids[1],
+                    value=2.0,
+                    start_date=None,
+                    end_date=dates[idx - 1],
+                    apply_date=dates[idx],
+                )
+                for idx in apply_idxs
+            ]
+        )
+        # Pre-apply inverse of adjustments to the baseline.
+        high_base = DataFrame(self.make_frame(30.0))
+        for idx in apply_idxs:
+            high_base.iloc[:idx, 1] /= 2.0
+
+        loader = DataFrameLoader(high, high_base, adjustments)
+        stats = []
+        engine = SimplePipelineEngine(
+            lambda column: loader,
+            self.dates,
+            self.asset_finder,
+            report_stats=stats.append,
+        )
+        factors = {
+            'sma_%d' % window_length: SimpleMovingAverage(
+                inputs=[high],
+                window_length=window_length,
+            )
+            for window_length in (1, 3, 5)
+        }
+        start, stop = 5, 20
+
+        results = engine.run_pipeline(
+            Pipeline(columns=factors), dates[start], dates[stop],
+        )
+        for name in factors:
+            assert_frame_equal(
+                results.unstack()[name],
+                high_base.iloc[start:stop + 1],
+            )
+
+        engine.run_pipeline(
+            Pipeline(columns={'sma_5': factors['sma_5']}),
+            dates[start],
+            dates[stop],
+        )
+        shared, alone = stats
+
+        # All three factors should be served from a single copy of `high`,
+        # with each adjustment applied once, exactly as if we had only
+        # computed the longest window.
+        num_rows = stop - start + 1 + 4
+        self.assertEqual(
+            shared.window_buffer_bytes,
+            num_rows * len(asset_ids) * 8,
+        )
+        self.assertEqual(shared.window_buffer_bytes, alone.window_buffer_bytes)
+        self.assertEqual(shared.adjustments_applied, len(apply_idxs))
+        self.assertEqual(shared.adjustments_applied, alone.adjustments_applied)
+
+    def test_subclass_overriding_compute(self):
+        dates = self.dates
+        high = USEquityPricing.high
+
+        # Strictly increasing data, so that the max of each window is its
+        # last row, which differs from the window's mean.
+        high_base = self.make_frame(
+            arange(len(dates) * len(self.assets), dtype=float).reshape(
+                len(dates), len(self.assets),
+            ),
+        )
+        loader = DataFrameLoader(high, high_base)
+        engine = SimplePipelineEngine(
+            lambda column: loader,
+            self.dates,
+            self.asset_finder,
+        )
+        start, stop = 5, 20
+
+        results = engine.run_pipeline(
+            Pipeline(
+                columns={
+                    'max': MovingMax(inputs=[high], window_length=5),
+                    'sma': SimpleMovingAverage(inputs=[high], window_length=5),
+                },
+            ),
+            dates[start],
+            dates[stop],
+        ).unstack()
+        assert_frame_equal(results['max'], high_base.iloc[start:stop + 1])
+        # The mean of each window is its middle row.
+        assert_frame_equal(
+            results['sma'],
+            high_base.shift(2).iloc[start:stop + 1],
+        )
+
 
 class SyntheticBcolzTestCase(TestCase):
 
@@ -795,6 +957,170 @@ class SyntheticBcolzTestCase(TestCase):
 
         assert_frame_equal(expected, result)
 
+    @parameterized.expand([
+        (1, None),
+        (7, None),
+        (7, 3),
+        (1000, 2),
+    ])
+    def test_run_chunked_pipeline(self, chunksize, workers):
+        engine = SimplePipelineEngine(
+            lambda column: self.pipeline_loader,
+            self.env.trading_days,
+            self.finder,
+        )
+        window_length = 5
+        dates = date_range(
+            self.first_asset_start + self.trading_day,
+            self.last_asset_end,
+            freq=self.trading_day,
+        )
+        dates_to_test = dates[window_length:]
+
+        pipeline = Pipeline(
+            columns={
+                'sma': SimpleMovingAverage(
+                    inputs=(USEquityPricing.close,),
+                    window_length=window_length,
+                ),
+                'close': USEquityPricing.close.latest,
+            },
+        )
+
+        expected = engine.run_pipeline(
+            pipeline, dates_to_test[0], dates_to_test[-1],
+        )
+        result = engine.run_chunked_pipeline(
+            pipeline,
+            dates_to_test[0],
+            dates_to_test[-1],
+            chunksize=chunksize,
+            workers=workers,
+        )
+        assert_frame_equal(result, expected)
+
+        with self.assertRaises(ValueError):
+            engine.run_chunked_pipeline(
+                pipeline, dates_to_test[0], dates_to_test[-1], chunksize=0,
+            )
+
+    def test_term_cache(self):
+        engine = SimplePipelineEngine(
+            lambda column: self.pipeline_loader,
+            self.env.trading_days,
+            self.finder,
+        )
+        window_length = 5
+        dates = date_range(
+            self.first_asset_start + self.trading_day,
+            self.last_asset_end,
+            freq=self.trading_day,
+        )
+        dates_to_test = dates[window_length:]
+        mid = len(dates_to_test) // 2
+
+        pipeline = Pipeline(
+            columns={
+                'sma': SimpleMovingAverage(
+                    inputs=(USEquityPricing.close,),
+                    window_length=window_length,
+                ),
+                'close': USEquityPricing.close.latest,
+            },
+        )
+
+        recording_loader = RecordingLoader(self.pipeline_loader)
+        loaded_dates = recording_loader.loaded_dates
+        with TempDirectory() as tempdir:
+            cached_engine = SimplePipelineEngine(
+                lambda column: recording_loader,
+                self.env.trading_days,
+                self.finder,
+                term_cache=TermCache(tempdir.path, max_bytes=10 ** 7),
+            )
+
+            def check(start, end):
+                assert_frame_equal(
+                    cached_engine.run_pipeline(pipeline, start, end),
+                    engine.run_pipeline(pipeline, start, end),
+                )
+
+            # Nothing is cached yet.
+            check(dates_to_test[0], dates_to_test[mid])
+            self.assertEqual(len(loaded_dates), 1)
+
+            # A sub-range is read entirely from the cache.
+            del loaded_dates[:]
+            check(dates_to_test[2], dates_to_test[mid - 2])
+            self.assertEqual(loaded_dates, [])
+
+            # Only the dates after the first range are computed, even though
+            # assets have started trading since.
+            del loaded_dates[:]
+            check(dates_to_test[0], dates_to_test[-1])
+            self.assertEqual(len(loaded_dates), 1)
+            self.assertEqual(
+                loaded_dates[0][window_length - 1], dates_to_test[mid + 1],
+            )
+            self.assertEqual(loaded_dates[0][-1], dates_to_test[-1])
+
+            # The whole range is now cached.
+            del loaded_dates[:]
+            check(dates_to_test[0], dates_to_test[-1])
+            self.assertEqual(loaded_dates, [])
+
+    def test_term_cache_chunked_workers(self):
+        window_length = 5
+        dates = date_range(
+            self.first_asset_start + self.trading_day,
+            self.last_asset_end,
+            freq=self.trading_day,
+        )
+        dates_to_test = dates[window_length:]
+        mid = len(dates_to_test) // 2
+
+        pipeline = Pipeline(
+            columns={
+                'sma': SimpleMovingAverage(
+                    inputs=(USEquityPricing.close,),
+                    window_length=window_length,
+                ),
+                'close': USEquityPricing.close.latest,
+            },
+        )
+
+        with TempDirectory() as tempdir:
+            engine = SimplePipelineEngine(
+                lambda column: self.pipeline_loader,
+                self.env.trading_days,
+                self.finder,
+                term_cache=TermCache(tempdir.path, max_bytes=10 ** 7),
+            )
+            expected = engine.run_pipeline(
+                pipeline, dates_to_test[0], dates_to_test[-1],
+            )
+            engine.run_pipeline(pipeline, dates_to_test[0], dates_to_test[mid])
+            result = engine.run_chunked_pipeline(
+                pipeline,
+                dates_to_test[0],
+                dates_to_test[-1],
+                chunksize=7,
+                workers=2,
+            )
+            assert_frame_equal(result, expected)
+
+            # Every entry on disk is still tracked by the index, so that it
+            # counts against max_bytes.
+            index_path = os.path.join(tempdir.path, TermCache.INDEX_FILENAME)
+            with open(index_path) as fp:
+                indexed = set(json.load(fp)['entries'])
+            on_disk = {
+                name for name in os.listdir(tempdir.path)
+                if os.path.isdir(os.path.join(tempdir.path, name))
+            }
+            self.assertTrue(on_disk)
+            self.assertEqual(on_disk, indexed)
+
 
 class ParameterizedFactorTestCase(TestCase):
     @classmethod
@@ -6,8 +6,10 @@ from unittest import TestCase
 
 import blaze as bz
 from nose_parameterized import parameterized
+import numpy as np
 import pandas as pd
-from pandas.util.testing import assert_series_equal
+from pandas.util.testing import assert_frame_equal, assert_series_equal
+from six import iteritems
 
 from zipline.pipeline.common import (
     ANNOUNCEMENT_FIELD_NAME,
@@ -25,8 +27,12 @@ from zipline.pipeline.loaders.events import (
     WRONG_MANY_COL_DATA_FORMAT_ERROR,
     WRONG_SINGLE_COL_DATA_FORMAT_ERROR
 )
+from zipline.pipeline.loaders.utils import (
+    next_date_frame,
+    previous_event_frame,
+)
 from zipline.utils.memoize import lazyval
-from zipline.utils.numpy_utils import datetime64ns_dtype
+from zipline.utils.numpy_utils import NaTns, datetime64ns_dtype
 
 
 ABSTRACT_CONCRETE_LOADER_ERROR = 'abstract methods concrete_loader'
@@ -222,6 +228,162 @@ class EventLoaderTestCase(TestCase):
                                  infer_timestamps, loader)
 
 
+def naive_next_date_frame(dates, events_by_sid, event_date_field_name):
+    """
+    Reference implementation of `next_date_frame`, checking every date
+    against every event.
+    """
+    cols = {
+        equity: np.full_like(dates, NaTns) for equity in events_by_sid
+    }
+    raw_dates = dates.values
+    for equity, df in iteritems(events_by_sid):
+        event_dates = df[event_date_field_name]
+        data = cols[equity]
+        for knowledge_date, event_date in zip(event_dates.index.values,
+                                              event_dates.values):
+            date_mask = (
+                (knowledge_date <= raw_dates) &
+                (raw_dates <= event_date)
+            )
+            value_mask = (event_date <= data) | (data == NaTns)
+            data[date_mask & value_mask] = event_date
+
+    return pd.DataFrame(index=dates, data=cols)
+
+
+def naive_previous_event_frame(events_by_sid,
+                               date_index,
+                               missing_value,
+                               field_dtype,
+                               event_date_field,
+                               previous_return_field):
+    """
+    Reference implementation of `previous_event_frame`, filling in each sid's
+    events in turn.
+    """
+    sids = list(events_by_sid)
+    out = np.full(
+        (len(date_index), len(sids)),
+        missing_value,
+        dtype=field_dtype
+    )
+    d_n = date_index[-1].asm8
+    for col_idx, sid in enumerate(sids):
+        df = events_by_sid[sid]
+        df = df[df[event_date_field] <= d_n]
+        index_dates = np.maximum(df.index.values, df[event_date_field].values)
+        out[
+            date_index.searchsorted(index_dates), col_idx
+        ] = df[previous_return_field]
+
+    frame = pd.DataFrame(out, index=date_index, columns=sids)
+    frame.ffill(inplace=True)
+    return frame
+
+
+class EventFrameTestCase(TestCase):
+
+    dates = pd.date_range('2014-01-01', '2014-03-31', tz='UTC')
+
+    def make_events(self, seed, num_sids=10, max_events=8):
+        """
+        Make random events, including events learned out of order, events
+        learned after they occur and sids without events.
+        """
+        rand = np.random.RandomState(seed)
+        raw_dates = self.dates.tz_localize(None).values
+        events_by_sid = {}
+        for sid in range(num_sids):
+            num_events = rand.randint(0, max_events)
+            event_dates = rand.choice(
+                pd.date_range('2013-12-01', '2014-04-30').values,
+                num_events,
+            )
+            knowledge_dates = rand.choice(raw_dates, num_events)
+            events_by_sid[sid] = pd.DataFrame(
+                {
+                    ANNOUNCEMENT_FIELD_NAME: event_dates,
+                    'value': rand.randn(num_events),
+                },
+                index=pd.DatetimeIndex(knowledge_dates),
+            )
+        return events_by_sid
+
+    @parameterized.expand([(seed,) for seed in range(10)])
+    def test_next_date_frame(self, seed):
+        events_by_sid = self.make_events(seed)
+        assert_frame_equal(
+            next_date_frame(
+                self.dates,
+                events_by_sid,
+                ANNOUNCEMENT_FIELD_NAME,
+            ),
+            naive_next_date_frame(
+                self.dates,
+                events_by_sid,
+                ANNOUNCEMENT_FIELD_NAME,
+            ),
+        )
+
+    @parameterized.expand([(seed,) for seed in range(10)])
+    def test_previous_event_frame(self, seed):
+        events_by_sid = self.make_events(seed)
+        for missing_value, dtype, field in ((NaTns, datetime64ns_dtype,
+                                             ANNOUNCEMENT_FIELD_NAME),
+                                            (np.nan, np.float64, 'value')):
+            assert_frame_equal(
+                previous_event_frame(
+                    events_by_sid,
+                    self.dates,
+                    missing_value,
+                    dtype,
+                    ANNOUNCEMENT_FIELD_NAME,
+                    field,
+                ),
+                naive_previous_event_frame(
+                    events_by_sid,
+                    self.dates,
+                    missing_value,
+                    dtype,
+                    ANNOUNCEMENT_FIELD_NAME,
+                    field,
+                ),
+            )
+
+    def test_next_date_frame_learned_out_of_order(self):
+        events_by_sid = {
+            0: pd.DataFrame(
+                {
+                    ANNOUNCEMENT_FIELD_NAME: pd.to_datetime([
+                        '2014-01-20',
+                        '2014-01-10',
+                    ]),
+                },
+                index=pd.to_datetime(['2014-01-01', '2014-01-05']),
+            ),
+        }
+        result = next_date_frame(
+            self.dates,
+            events_by_sid,
+            ANNOUNCEMENT_FIELD_NAME,
+        )
+        expected = pd.Series(
+            pd.NaT,
+            index=self.dates,
+            dtype=datetime64ns_dtype,
+        )
+        expected['2014-01-01':'2014-01-04'] = pd.Timestamp('2014-01-20')
+        expected['2014-01-05':'2014-01-10'] = pd.Timestamp('2014-01-10')
+        expected['2014-01-11':'2014-01-20'] = pd.Timestamp('2014-01-20')
+        assert_series_equal(result[0], expected, check_names=False)
+
+    def test_no_events(self):
+        result = next_date_frame(self.dates, {}, ANNOUNCEMENT_FIELD_NAME)
+        self.assertEqual(len(result.columns), 0)
+        self.assertTrue(result.index.equals(self.dates))
+
+
 class BlazeEventDataSetLoaderNoConcreteLoader(BlazeEventsLoader):
     def __init__(self,
                  expr,
@@ -13,14 +13,22 @@ from numpy import (
     nan,
     ones,
 )
+from numpy.lib.stride_tricks import as_strided
 from numpy.random import randn, seed
 
 from zipline.errors import UnknownRankMethod
 from zipline.lib.rank import masked_rankdata_2d
 from zipline.pipeline import Factor, Filter, TermGraph
+from zipline.pipeline.data import USEquityPricing
 from zipline.pipeline.factors import (
+    AverageDollarVolume,
+    EWMA,
+    EWMSTD,
+    MaxDrawdown,
     Returns,
     RSI,
+    SimpleMovingAverage,
+    VWAP,
 )
 from zipline.testing import (
     check_allclose,
@@ -354,6 +362,101 @@ class FactorTestCase(BasePipelineTestCase):
 
         check_allclose(expected, out)
 
+    @parameterized.expand([
+        ('%s_%s' % (name, 'strided' if strided else 'copied'),
+         factor,
+         strided)
+        for (name, factor), strided in product(
+            [
+                ('returns', Returns(window_length=10)),
+                ('rsi', RSI()),
+                ('sma', SimpleMovingAverage(
+                    inputs=[USEquityPricing.close], window_length=10,
+                )),
+                ('vwap', VWAP(window_length=10)),
+                ('adv', AverageDollarVolume(window_length=10)),
+                ('ewma', EWMA.from_span(
+                    inputs=[USEquityPricing.close], window_length=10, span=5,
+                )),
+                ('ewmstd', EWMSTD.from_span(
+                    inputs=[USEquityPricing.close], window_length=10, span=5,
+                )),
+                ('max_drawdown', MaxDrawdown(
+                    inputs=[USEquityPricing.close], window_length=10,
+                )),
+            ],
+            (False, True),
+        )
+    ])
+    def test_compute_all(self, name, factor, strided):
+        window_length = factor.window_length
+        num_dates, num_assets = 8, 4
+        dates = arange(num_dates).astype('datetime64[D]')
+        assets = arange(num_assets)
+
+        seed(100)  # Seed so we get deterministic results.
+        inputs = [
+            abs(randn(num_dates + window_length - 1, num_assets))
+            for _ in factor.inputs
+        ]
+        inputs[0][3, 1] = nan
+        # The first windows for this asset are all nan.
+        inputs[0][:window_length + 2, 3] = nan
+
+        if strided:
+            # Views onto the input rows, as produced by the engine, which
+            # can be passed to the kernels in zipline.lib.rolling.
+            def stack(data):
+                return as_strided(
+                    data,
+                    shape=(num_dates, window_length, num_assets),
+                    strides=(data.strides[0],) + data.strides,
+                )
+        else:
+            def stack(data):
+                return array([
+                    data[i:i + window_length] for i in range(num_dates)
+                ])
+
+        expected = empty((num_dates, num_assets))
+        for i, date in enumerate(dates):
+            factor.compute(
+                date,
+                assets,
+                expected[i],
+                *(data[i:i + window_length] for data in inputs),
+                **factor.params
+            )
+
+        out = empty((num_dates, num_assets))
+        factor.compute_all(
+            dates,
+            assets,
+            out,
+            *(stack(data) for data in inputs),
+            **factor.params
+        )
+        check_allclose(expected, out)
+
+    def test_max_drawdown(self):
+        drawdown = MaxDrawdown(
+            inputs=[USEquityPricing.close],
+            window_length=5,
+        )
+        data = array([
+            [1.0, nan, nan, 5.0, 4.0],
+            [3.0, 2.0, nan, 4.0, 2.0],
+            [2.0, nan, nan, 5.0, 6.0],
+            [4.0, 1.0, nan, 4.0, 4.0],
+            [1.0, 2.0, nan, 3.0, 6.0],
+        ])
+        out = empty(5)
+        drawdown.compute(None, arange(5), out, data)
+
+        # The last column has two drawdowns of the same size, of which the
+        # first is reported.
+        check_allclose(out, array([3.0, 1.0, nan, 2.0 / 3.0, 1.0]))
+
     def gen_ranking_cases():
         seeds = range(int(1e4), int(1e5), int(1e4))
         methods = ('ordinal', 'average')
@@ -23,7 +23,7 @@ from numpy.random import randn, seed as random_seed
 
 from zipline.errors import BadPercentileBounds
 from zipline.pipeline import Filter, Factor, TermGraph
-from zipline.testing import check_arrays
+from zipline.testing import check_arrays, parameter_space
 from zipline.utils.numpy_utils import float64_dtype
 from .base import BasePipelineTestCase, with_default_shape
 
@@ -178,6 +178,69 @@ class FilterTestCase(BasePipelineTestCase):
             expected = rowwise_rank(data) < c
             check_arrays(result, expected)
 
+    @parameter_space(N=[0, 1, 3, 10, 25], masked=[True, False])
+    def test_top_and_bottom_match_rank(self, N, masked):
+        # Rounding produces ties, which should be broken in column order.
+        data = self.randn_data(seed=10).round()
+        data[::2, 1] = nan
+        data[3] = nan
+
+        mask_data = ones_like(data, dtype=bool)
+        mask_data[1::2, 2] = False
+        mask = Mask()
+        kwargs = {'mask': mask} if masked else {}
+
+        graph = TermGraph(
+            {
+                'top': self.f.top(N, **kwargs),
+                'bottom': self.f.bottom(N, **kwargs),
+                'top_rank': self.f.rank(ascending=False, **kwargs) <= N,
+                'bottom_rank': self.f.rank(ascending=True, **kwargs) <= N,
+            }
+        )
+        results = self.run_graph(
+            graph,
+            initial_workspace={self.f: data, mask: mask_data},
+        )
+        check_arrays(results['top'], results['top_rank'])
+        check_arrays(results['bottom'], results['bottom_rank'])
+
+    @parameter_space(
+        min_percentile=[0.0, 10.0, 33.3, 50.0],
+        max_percentile=[66.6, 90.0, 100.0],
+    )
+    def test_percentile_between_matches_nanpercentile(self,
+                                                      min_percentile,
+                                                      max_percentile):
+        data = self.randn_data(seed=11).round(1)
+        data[::3, 4] = nan
+        data[5] = nan
+        mask_data = self.randn_data(seed=12) > -1.0
+
+        results = self.run_graph(
+            TermGraph(
+                {
+                    'between': self.f.percentile_between(
+                        min_percentile,
+                        max_percentile,
+                    ),
+                }
+            ),
+            initial_workspace={self.f: data},
+            mask=self.build_mask(mask_data),
+        )
+
+        masked_data = data.copy()
+        masked_data[~mask_data] = nan
+        lower = nanpercentile(
+            masked_data, min_percentile, axis=1, keepdims=True,
+        )
+        upper = nanpercentile(
+            masked_data, max_percentile, axis=1, keepdims=True,
+        )
+        expected = (lower <= masked_data) & (masked_data <= upper)
+        check_arrays(results['between'], expected)
+
     def test_percentile_between(self):
 
         quintiles = range(5)
@@ -34,6 +34,7 @@ from pandas import (
     Int64Index,
     Timestamp,
 )
+from six.moves import zip_longest
 from testfixtures import TempDirectory
 from toolz.curried.operator import getitem
 
@@ -43,6 +44,7 @@ from zipline.pipeline.loaders.synthetic import (
     SyntheticDailyBarWriter,
 )
 from zipline.data.us_equity_pricing import (
+    BcolzCumulativeAdjustmentReader,
     BcolzDailyBarReader,
     SQLiteAdjustmentReader,
     SQLiteAdjustmentWriter,
@@ -279,6 +281,8 @@ class USEquityPricingLoaderTestCase(TestCase):
         writer = SQLiteAdjustmentWriter(cls.db_path, cls.calendar_days,
                                         daily_bar_reader)
         writer.write(SPLITS, MERGERS, DIVIDENDS)
+        cls.factors_path = cls.test_data_dir.getpath('adjustments.bcolz')
+        writer.write_cumulative_factors(cls.factors_path)
 
         cls.assets = TEST_QUERY_ASSETS
         cls.asset_info = EQUITY_INFO
@@ -561,3 +565,34 @@ class USEquityPricingLoaderTestCase(TestCase):
             highs.traverse(windowlen + 1)
         with self.assertRaises(WindowLengthTooLong):
             volumes.traverse(windowlen + 1)
+
+    def test_read_with_cumulative_adjustments(self):
+        columns = [USEquityPricing.high, USEquityPricing.volume]
+        query_days = self.calendar_days_between(
+            TEST_QUERY_START,
+            TEST_QUERY_STOP
+        )
+        assets = Int64Index(arange(1, 7))
+        mask = ones((len(query_days), 6), dtype=bool)
+
+        baseline_reader = BcolzDailyBarReader(self.bcolz_path)
+        expected_results = USEquityPricingLoader(
+            baseline_reader,
+            SQLiteAdjustmentReader(self.db_path),
+        ).load_adjusted_array(columns, query_days, assets, mask)
+        results = USEquityPricingLoader(
+            baseline_reader,
+            BcolzCumulativeAdjustmentReader(self.factors_path),
+        ).load_adjusted_array(columns, query_days, assets, mask)
+
+        # Cumulative factors should produce the same windows as applying
+        # each adjustment in turn.
+        for column in columns:
+            for windowlen in range(1, len(query_days) + 1):
+                for expected, window in zip_longest(
+                        expected_results[column].traverse(windowlen),
+                        results[column].traverse(windowlen)):
+                    assert_allclose(expected, window)
+
+        with self.assertRaises(WindowLengthTooLong):
+            results[columns[0]].traverse(windowlen + 1)
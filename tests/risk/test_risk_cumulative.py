@@ -134,3 +134,67 @@ class TestRisk(unittest.TestCase):
                 self.cumulative_metrics_06.max_drawdowns[dt_loc],
                 value,
                 err_msg="Mismatch at %s" % (dt,))
+
+    def test_incremental_update_matches_full_recompute(self):
+        metrics = risk.RiskMetricsCumulative(
+            self.sim_params, env=self.env, create_first_day_stats=True,
+        )
+        for dt, returns in answer_key.RETURNS_DATA.iterrows():
+            metrics.update(dt,
+                           returns['Algorithm Returns'],
+                           returns['Benchmark Returns'],
+                           0.0)
+            dt_loc = metrics.latest_dt_loc
+            expected = {
+                'algorithm_cumulative_returns':
+                metrics.calculate_cumulative_returns(
+                    metrics.algorithm_returns),
+                'benchmark_cumulative_returns':
+                metrics.calculate_cumulative_returns(
+                    metrics.benchmark_returns),
+                'algorithm_volatility':
+                metrics.calculate_volatility(metrics.algorithm_returns),
+                'benchmark_volatility':
+                metrics.calculate_volatility(metrics.benchmark_returns),
+                'beta': metrics.calculate_beta(),
+                'downside_risk': metrics.calculate_downside_risk(),
+            }
+            for name, value in expected.items():
+                np.testing.assert_almost_equal(
+                    getattr(metrics, name)[dt_loc],
+                    value,
+                    decimal=10,
+                    err_msg="Mismatch in %s at %s" % (name, dt))
+
+    def test_repeated_updates_per_day(self):
+        # Minute emission updates the same day many times; only the last
+        # update of each day should contribute to later days.
+        metrics = risk.RiskMetricsCumulative(self.sim_params, env=self.env)
+        for i, (dt, returns) in enumerate(answer_key.RETURNS_DATA.iterrows()):
+            algo, bench = (returns['Algorithm Returns'],
+                           returns['Benchmark Returns'])
+            metrics.update(dt, algo * 2 + 0.01, bench - 0.01, 0.0)
+            metrics.update(dt, -algo, bench * 3, 0.0)
+            if i == 100:
+                # The running state is rebuilt after a state round trip.
+                state = metrics.__getstate__()
+                metrics = risk.RiskMetricsCumulative.__new__(
+                    risk.RiskMetricsCumulative)
+                metrics.__setstate__(state)
+            metrics.update(dt, algo, bench, 0.0)
+
+        for name in ('algorithm_cumulative_returns',
+                     'benchmark_cumulative_returns',
+                     'algorithm_volatility',
+                     'benchmark_volatility',
+                     'beta',
+                     'alpha',
+                     'sharpe',
+                     'downside_risk',
+                     'sortino',
+                     'information'):
+            np.testing.assert_almost_equal(
+                getattr(metrics, name),
+                getattr(self.cumulative_metrics_06, name),
+                decimal=10,
+                err_msg="Mismatch in %s" % name)
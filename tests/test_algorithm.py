@@ -726,6 +726,33 @@ class TestTransformAlgorithm(TestCase):
         algo.run(self.df)
         assert isinstance(algo.sources[0], DataFrameSource)
 
+    def test_columnar_df_source_matches_events(self):
+        for algo_class, instant_fill in ((TestOrderAlgorithm, False),
+                                         (TestOrderInstantAlgorithm, True)):
+            results = []
+            for columnar in (False, True):
+                algo = algo_class(
+                    sim_params=self.sim_params,
+                    env=self.env,
+                    instant_fill=instant_fill,
+                )
+                results.append(
+                    algo.run(DataFrameSource(self.df, columnar=columnar))
+                )
+            # Orders and transactions carry random ids, so compare the
+            # columns that summarize them.
+            columns = [
+                'capital_used',
+                'ending_cash',
+                'pnl',
+                'portfolio_value',
+                'returns',
+            ]
+            np.testing.assert_array_equal(
+                results[0][columns].values,
+                results[1][columns].values,
+            )
+
     def test_panel_as_input(self):
         algo = TestRegisterTransformAlgorithm(
             sim_params=self.sim_params,
@@ -18,6 +18,8 @@ Tests for the zipline.assets package
 """
 from contextlib import contextmanager
 from datetime import datetime, timedelta
+import json
+import os
 import pickle
 import sys
 from types import GetSetDescriptorType
@@ -30,8 +32,9 @@ from pandas.tseries.tools import normalize_date
 from pandas.util.testing import assert_frame_equal
 
 from nose_parameterized import parameterized
-from numpy import full, int32, int64
+from numpy import full, int32, int64, memmap
 import sqlalchemy as sa
+from testfixtures import TempDirectory
 
 from zipline.assets import (
     Asset,
@@ -39,6 +42,8 @@ from zipline.assets import (
     Future,
     AssetFinder,
     AssetFinderCachedEquities,
+    AssetFinderPreloaded,
+    AssetFinderSnapshot,
 )
 from six import itervalues, integer_types
 from toolz import valmap
@@ -48,7 +53,12 @@ from zipline.assets.futures import (
     FutureChain,
     month_to_cme_code
 )
+from zipline.assets.asset_db_snapshot import (
+    META_FILENAME,
+    read_asset_db_snapshot,
+)
 from zipline.assets.asset_writer import (
+    AssetDBWriterFromDataFrame,
     check_version_info,
     write_version_info,
     _futures_defaults,
@@ -65,6 +75,7 @@ from zipline.errors import (
     FutureContractsNotFound,
     MultipleSymbolsFound,
     RootSymbolNotFound,
+    AssetDBSnapshotVersionError,
     AssetDBVersionError,
     SidAssignmentError,
     SidsNotFound,
@@ -821,6 +832,64 @@ class AssetFinderTestCase(TestCase):
         self.assertEqual(len(ad_contracts), 6)
         self.assertEqual(ad_contracts[5].sid, 5)
 
+    def test_lookup_future_chain_missing_dates(self):
+        def contract(symbol, notice_date, expiration_date):
+            return {
+                'symbol': symbol,
+                'root_symbol': 'AD',
+                'notice_date': notice_date,
+                'expiration_date': expiration_date,
+                'start_date': pd.Timestamp('2015-01-01', tz='UTC'),
+            }
+
+        metadata = {
+            0: contract(
+                'ADZ15',
+                pd.Timestamp('2015-12-14', tz='UTC'),
+                pd.Timestamp('2015-12-16', tz='UTC'),
+            ),
+            # Only an expiration date.
+            1: contract('ADH16', None, pd.Timestamp('2016-03-14', tz='UTC')),
+            # Only a notice date, which ties with sid 0's.
+            2: contract('ADM16', pd.Timestamp('2015-12-14', tz='UTC'), None),
+            # Neither date, so this is never in a chain.
+            3: contract('ADU16', None, None),
+            4: {
+                'symbol': 'CDZ15',
+                'root_symbol': 'CD',
+                'notice_date': pd.Timestamp('2015-12-14', tz='UTC'),
+                'expiration_date': pd.Timestamp('2015-12-16', tz='UTC'),
+            },
+        }
+        self.env.write_data(futures_data=metadata)
+        finder = self.asset_finder_type(self.env.engine)
+
+        def chain_sids(as_of_date):
+            return [
+                c.sid for c in finder.lookup_future_chain('AD', as_of_date)
+            ]
+
+        self.assertEqual(chain_sids(pd.NaT), [1, 3, 0, 2])
+        self.assertEqual(
+            chain_sids(pd.Timestamp('2015-06-01', tz='UTC')),
+            [0, 2, 1],
+        )
+        self.assertEqual(
+            chain_sids(pd.Timestamp('2015-12-14', tz='UTC')),
+            [0, 2, 1],
+        )
+        self.assertEqual(
+            chain_sids(pd.Timestamp('2015-12-15', tz='UTC')),
+            [1],
+        )
+        self.assertEqual(chain_sids(pd.Timestamp('2017', tz='UTC')), [])
+        self.assertEqual(
+            [c.sid for c in finder.lookup_future_chain('CD', pd.NaT)],
+            [4],
+        )
+        with self.assertRaises(RootSymbolNotFound):
+            finder.lookup_future_chain('XX', pd.NaT)
+
     def test_map_identifier_index_to_sids(self):
         # Build an empty finder and some Assets
         dt = pd.Timestamp('2014-01-01', tz='UTC')
@@ -856,7 +925,7 @@ class AssetFinderTestCase(TestCase):
         )
 
         self.env.write_data(equities_df=frame)
-        finder = self.env.asset_finder
+        finder = self.asset_finder_type(self.env.engine)
 
         all_dates = pd.date_range(
             start=first_start,
@@ -902,6 +971,17 @@ class AssetFinderTestCase(TestCase):
             result = finder.lifetimes(dates, include_start_date=False)
             assert_frame_equal(result, expected_no_start)
 
+            # Consecutive subindices overlap, so these reuse rows computed
+            # for the previous dates.
+            for include_start_date, expected in ((True, expected_with_start),
+                                                 (False, expected_no_start)):
+                result = finder.lifetimes(
+                    dates,
+                    include_start_date=include_start_date,
+                    alive_only=True,
+                )
+                assert_frame_equal(result, expected.loc[:, expected.any()])
+
     def test_sids(self):
         # Ensure that the sids property of the AssetFinder is functioning
         self.env.write_data(equities_identifiers=[1, 2, 3])
@@ -929,7 +1009,9 @@ class AssetFinderTestCase(TestCase):
             ([0, 2, 3], [7, 10]),
             (list(equities.index), list(futures.index)),
         ]
-        with tmp_asset_finder(equities=equities, futures=futures) as finder:
+        with tmp_asset_finder(finder_cls=self.asset_finder_type,
+                              equities=equities,
+                              futures=futures) as finder:
             for equity_sids, future_sids in queries:
                 results = finder.group_by_type(equity_sids + future_sids)
                 self.assertEqual(
@@ -962,7 +1044,9 @@ class AssetFinderTestCase(TestCase):
             fail_sids = equity_sids
             success_sids = future_sids
 
-        with tmp_asset_finder(equities=equities, futures=futures) as finder:
+        with tmp_asset_finder(finder_cls=self.asset_finder_type,
+                              equities=equities,
+                              futures=futures) as finder:
             # Run twice to exercise caching.
             lookup = getattr(finder, lookup_name)
             for _ in range(2):
@@ -996,7 +1080,9 @@ class AssetFinderTestCase(TestCase):
             years=[2014],
         )
 
-        with tmp_asset_finder(equities=equities, futures=futures) as finder:
+        with tmp_asset_finder(finder_cls=self.asset_finder_type,
+                              equities=equities,
+                              futures=futures) as finder:
             all_sids = finder.sids
             self.assertEqual(len(all_sids), len(equities) + len(futures))
             queries = [
@@ -1065,6 +1151,180 @@ class AssetFinderCachedEquitiesTestCase(AssetFinderTestCase):
         self.asset_finder_type = AssetFinderCachedEquities
 
 
+class AssetFinderPreloadedTestCase(AssetFinderTestCase):
+
+    def setUp(self):
+        self.env = TradingEnvironment(load=noop_load)
+        self.asset_finder_type = AssetFinderPreloaded
+
+    def test_no_queries_after_preload(self):
+        equities = make_simple_equity_info(
+            range(5),
+            start_date=pd.Timestamp('2014-01-01', tz='UTC'),
+            end_date=pd.Timestamp('2015-01-01', tz='UTC'),
+            symbols=['A', 'B', 'C', 'D', 'E.F'],
+        )
+        futures = make_commodity_future_info(
+            first_sid=6,
+            root_symbols=['CL'],
+            years=[2014],
+        )
+        with tmp_asset_finder(finder_cls=AssetFinderPreloaded,
+                              equities=equities,
+                              futures=futures) as finder:
+            queries = []
+
+            def record_query(conn, cursor, statement, *args):
+                queries.append(statement)
+
+            sa.event.listen(
+                finder.engine,
+                'before_cursor_execute',
+                record_query,
+            )
+            as_of = pd.Timestamp('2014-06-01', tz='UTC')
+            results = finder.retrieve_all([0, 6, 4])
+            self.assertEqual([0, 6, 4], list(map(int, results)))
+            self.assertEqual(
+                [Equity, Future, Equity],
+                list(map(type, results)),
+            )
+            self.assertEqual(finder.lookup_symbol('C', as_of).sid, 2)
+            self.assertEqual(finder.lookup_symbol('E_F', as_of).sid, 4)
+            self.assertEqual(
+                finder.lookup_symbol('EF', as_of, fuzzy=True).sid,
+                4,
+            )
+            matches, missing = finder.lookup_generic(['A', 1, 'ZZZ'], as_of)
+            self.assertEqual([0, 1], list(map(int, matches)))
+            self.assertEqual(['ZZZ'], missing)
+            finder.lifetimes(
+                pd.date_range('2014-01-01', periods=5, tz='UTC'),
+                include_start_date=True,
+            )
+            self.assertEqual(
+                [c.sid for c in finder.lookup_future_chain('CL', as_of)],
+                [
+                    c.sid for c in finder.lookup_future_chain('CL', pd.NaT)
+                    if c.notice_date >= as_of
+                ],
+            )
+            with self.assertRaises(SidsNotFound):
+                finder.retrieve_all([100])
+            self.assertEqual(queries, [])
+
+
+class AssetFinderSnapshotTestCase(TestCase):
+
+    def setUp(self):
+        self.tmp = TempDirectory()
+        self.snapshot_path = self.tmp.getpath('snapshot')
+        self.equities = make_simple_equity_info(
+            range(5),
+            start_date=pd.Timestamp('2014-01-01', tz='UTC'),
+            end_date=pd.Timestamp('2015-01-01', tz='UTC'),
+            symbols=['A', 'B', 'C', 'D', 'E.F'],
+        )
+        self.futures = make_commodity_future_info(
+            first_sid=6,
+            root_symbols=['CL'],
+            years=[2014],
+        )
+        self.engine = sa.create_engine('sqlite://')
+        AssetDBWriterFromDataFrame(
+            equities=self.equities,
+            futures=self.futures,
+        ).write_all(self.engine, snapshot_path=self.snapshot_path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_matches_database(self):
+        queries = []
+
+        def record_query(conn, cursor, statement, *args):
+            queries.append(statement)
+
+        sa.event.listen(self.engine, 'before_cursor_execute', record_query)
+        finder = AssetFinderSnapshot(self.engine, self.snapshot_path)
+
+        sids = list(self.equities.index) + list(self.futures.index)
+        results = finder.retrieve_all(sids)
+        as_of = pd.Timestamp('2014-06-01', tz='UTC')
+        by_symbol = finder.lookup_symbol('E_F', as_of)
+        dates = pd.date_range('2013-12-30', periods=10, tz='UTC')
+        lifetimes = finder.lifetimes(dates, include_start_date=False)
+        self.assertEqual(queries, [])
+        self.assertEqual(finder.sids, tuple(sids))
+
+        expected_finder = AssetFinder(self.engine)
+        expected = expected_finder.retrieve_all(sids)
+        self.assertEqual(
+            [asset.to_dict() for asset in results],
+            [asset.to_dict() for asset in expected],
+        )
+        self.assertEqual(
+            by_symbol.to_dict(),
+            expected_finder.lookup_symbol('E_F', as_of).to_dict(),
+        )
+        assert_frame_equal(
+            lifetimes,
+            expected_finder.lifetimes(dates, include_start_date=False),
+        )
+
+        # Methods without an in-memory implementation fall back to the
+        # database.
+        symbol = self.futures.symbol.iloc[0]
+        self.assertEqual(
+            finder.lookup_future_symbol(symbol),
+            expected_finder.lookup_future_symbol(symbol),
+        )
+
+    def test_columns_stay_mapped(self):
+        equities = read_asset_db_snapshot(self.snapshot_path)['equities']
+        for column in (equities['sid'],
+                       equities['end_date'],
+                       equities.codes('symbol')):
+            self.assertIsInstance(column, memmap)
+
+        # Text is decoded on demand.
+        self.assertEqual(equities.string('symbol', 4), 'E.F')
+        self.assertEqual(
+            equities.codes('symbol')[4],
+            equities.code('symbol', 'E.F'),
+        )
+        self.assertIsNone(equities.code('symbol', 'ZZZ'))
+        self.assertEqual(equities.code('symbol', None), -1)
+
+    def test_rewrite(self):
+        AssetDBWriterFromDataFrame(
+            equities=self.equities.iloc[:2],
+        ).write_all(
+            sa.create_engine('sqlite://'),
+            snapshot_path=self.snapshot_path,
+        )
+        finder = AssetFinderSnapshot(self.engine, self.snapshot_path)
+        self.assertEqual(finder.sids, (0, 1))
+
+        # Resetting our caches reads the tables from the database.
+        finder._reset_caches()
+        self.assertEqual(
+            finder.sids,
+            tuple(self.equities.index) + tuple(self.futures.index),
+        )
+
+    def test_version_mismatch(self):
+        meta_path = os.path.join(self.snapshot_path, META_FILENAME)
+        with open(meta_path) as f:
+            meta = json.load(f)
+        meta['snapshot_version'] += 1
+        with open(meta_path, 'w') as f:
+            json.dump(meta, f)
+
+        with self.assertRaises(AssetDBSnapshotVersionError):
+            AssetFinderSnapshot(self.engine, self.snapshot_path)
+
+
 class TestFutureChain(TestCase):
 
     @classmethod
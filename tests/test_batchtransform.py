@@ -21,6 +21,7 @@ from unittest import TestCase
 import pytz
 import numpy as np
 import pandas as pd
+import pandas.util.testing as tm
 
 from zipline.algorithm import TradingAlgorithm
 from zipline.finance.trading import TradingEnvironment
@@ -31,6 +32,7 @@ from zipline.test_algorithms import (
 )
 from zipline.testing import setup_logger, teardown_logger
 from zipline.transforms import batch_transform
+from zipline.utils.data import BarWindow
 import zipline.utils.factory as factory
 from zipline.utils.tradingcalendar import trading_days
 
@@ -57,6 +59,30 @@ class BatchTransformAlgorithmSetSid(TradingAlgorithm):
             deepcopy(self.batch_transform.handle_data(data)))
 
 
+@batch_transform
+def return_panel(data):
+    if isinstance(data, BarWindow):
+        return data.as_panel()
+    return data
+
+
+class BatchTransformAlgorithmBothBackends(TradingAlgorithm):
+    """
+    Runs the same batch transform with and without ``panel=True``.
+    """
+    def initialize(self, **kwargs):
+        self.panel_history = []
+        self.array_history = []
+        self.panel_transform = return_panel(panel=True, **kwargs)
+        self.array_transform = return_panel(panel=False, **kwargs)
+
+    def handle_data(self, data):
+        self.panel_history.append(
+            deepcopy(self.panel_transform.handle_data(data)))
+        self.array_history.append(
+            deepcopy(self.array_transform.handle_data(data)))
+
+
 class DifferentSidSource(DataSource):
     def __init__(self):
         self.dates = pd.date_range('1990-01-01', periods=180, tz='utc')
@@ -295,3 +321,83 @@ class TestBatchTransform(TestCase):
                 # 1990-01-08 - window now full
                 expected_item
             ])
+
+
+class TestBarWindowBackend(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.env = TradingEnvironment()
+        cls.env.write_data(equities_identifiers=[0])
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.env
+
+    def setUp(self):
+        setup_logger(self)
+
+    def tearDown(self):
+        teardown_logger(self)
+
+    def check_backends(self, algo):
+        self.assertEqual(len(algo.panel_history), len(algo.array_history))
+        computed = 0
+        for expected, result in zip(algo.panel_history, algo.array_history):
+            if expected is None:
+                self.assertIsNone(result)
+                continue
+            computed += 1
+            expected = expected.reindex(
+                items=sorted(expected.items),
+                minor_axis=sorted(expected.minor_axis),
+            )
+            tm.assert_panel_equal(
+                result.reindex(
+                    items=expected.items,
+                    minor_axis=expected.minor_axis,
+                ),
+                expected,
+            )
+        self.assertGreater(computed, 0)
+
+    def test_daily(self):
+        sim_params = factory.create_simulation_parameters(
+            start=datetime(1990, 1, 1, tzinfo=pytz.utc),
+            end=datetime(1990, 1, 8, tzinfo=pytz.utc),
+            env=self.env,
+        )
+        source, _ = factory.create_test_df_source(sim_params, self.env)
+        algo = BatchTransformAlgorithmBothBackends(
+            sim_params=sim_params,
+            env=self.env,
+            refresh_period=1,
+            window_length=3,
+            compute_only_full=False,
+        )
+        algo.run(source)
+        self.check_backends(algo)
+
+    def test_minute_downsample(self):
+        sim_params = factory.create_simulation_parameters(
+            start=pd.Timestamp('1990-01-03', tz='UTC'),
+            end=pd.Timestamp('1990-01-08', tz='UTC'),
+            env=self.env,
+        )
+        sim_params.emission_rate = 'daily'
+        sim_params.data_frequency = 'minute'
+        source, _ = factory.create_test_df_source(
+            sim_params=sim_params,
+            env=self.env,
+            bars='minute',
+        )
+        algo = BatchTransformAlgorithmBothBackends(
+            sim_params=sim_params,
+            env=self.env,
+            refresh_period=1,
+            window_length=2,
+            bars='minute',
+            downsample=True,
+        )
+        algo.run(source)
+        self.check_backends(algo)
@@ -28,6 +28,7 @@ import pandas as pd
 import pytz
 from six.moves import range
 
+from zipline.errors import NoFurtherDataError
 from zipline.finance.blotter import Blotter
 from zipline.finance.execution import MarketOrder, LimitOrder
 from zipline.finance.trading import TradingEnvironment
@@ -412,6 +413,86 @@ class TradingEnvironmentTestCase(TestCase):
         for workday in workdays:
             self.assertTrue(self.env.is_trading_day(workday))
 
+    def test_navigation(self):
+        env = self.env
+        offset = env.trading_days.searchsorted(
+            pd.Timestamp('2008-10-01', tz='UTC'),
+        )
+        trading_days = list(env.trading_days[offset:offset + 150])
+
+        # Cover weekends, holidays and an early close, at various times of
+        # day.
+        days = pd.date_range('2008-11-20', '2009-01-10', tz='UTC')
+        for dt in (day + pd.Timedelta(hours=h) for day in days
+                   for h in (0, 15, 23)):
+            day = dt.normalize()
+            later = [d for d in trading_days if d > day]
+            earlier = [d for d in trading_days if d < day]
+
+            self.assertEqual(env.is_trading_day(dt), day in trading_days)
+            self.assertEqual(env.next_trading_day(dt), later[0])
+            self.assertEqual(env.previous_trading_day(dt), earlier[-1])
+            self.assertEqual(
+                env.next_open_and_close(dt),
+                tuple(env.open_and_closes.loc[later[0]]),
+            )
+            self.assertEqual(
+                env.previous_open_and_close(dt),
+                tuple(env.open_and_closes.loc[earlier[-1]]),
+            )
+            self.assertEqual(
+                env.get_index(dt),
+                offset + len(earlier) - (day not in trading_days),
+            )
+            self.assertEqual(
+                env.trading_day_distance(days[0], dt),
+                len(earlier) - trading_days.index(days[0]),
+            )
+            if day in trading_days:
+                self.assertEqual(
+                    env.get_open_and_close(dt),
+                    tuple(env.open_and_closes.loc[day]),
+                )
+            else:
+                with self.assertRaises(KeyError):
+                    env.get_open_and_close(dt)
+
+        first, last = env.first_trading_day, env.last_trading_day
+        self.assertIsNone(env.previous_trading_day(first))
+        self.assertIsNone(env.next_trading_day(last))
+        with self.assertRaises(NoFurtherDataError):
+            env.previous_open_and_close(first)
+        with self.assertRaises(NoFurtherDataError):
+            env.next_open_and_close(last)
+
+    def test_minutes_for_days_in_range(self):
+        start = pd.Timestamp('2008-11-26 15:00', tz='UTC')
+        end = pd.Timestamp('2008-12-02 12:00', tz='UTC')
+        minutes = self.env.minutes_for_days_in_range(start, end)
+
+        expected = pd.DatetimeIndex(
+            np.concatenate([
+                self.env.market_minutes_for_day(day)
+                for day in self.env.days_in_range(
+                    start.normalize(),
+                    end.normalize(),
+                )
+            ]),
+            tz='UTC',
+        )
+        # The day after Thanksgiving is an early close.
+        self.assertEqual(len(minutes), 390 * 3 + 210)
+        self.assertTrue((minutes == expected).all())
+
+        # Ranges without trading days have no minutes.
+        self.assertEqual(
+            len(self.env.minutes_for_days_in_range(
+                pd.Timestamp('2008-11-29', tz='UTC'),
+                pd.Timestamp('2008-11-30', tz='UTC'),
+            )),
+            0,
+        )
+
     def test_simulation_parameters(self):
         env = SimulationParameters(
             period_start=datetime(2008, 1, 1, tzinfo=pytz.utc),
@@ -35,7 +35,10 @@ from zipline.finance.trading import (
     TradingEnvironment,
 )
 from zipline.history import history
-from zipline.history.history_container import HistoryContainer
+from zipline.history.history_container import (
+    HistoryContainer,
+    RingBufferHistoryContainer,
+)
 from zipline.protocol import BarData
 from zipline.sources import RandomWalkSource, DataFrameSource
 from zipline.testing import subtest
@@ -44,6 +47,8 @@ import zipline.utils.factory as factory
 
 class TestHistoryContainer(TestCase):
 
+    container_class = HistoryContainer
+
     @classmethod
     def setUpClass(cls):
         cls.env = TradingEnvironment()
@@ -86,7 +91,7 @@ class TestHistoryContainer(TestCase):
             # Sanity check on test input.
             self.assertEqual(len(expected[spec.key_str]), len(updates))
 
-        container = HistoryContainer(
+        container = self.container_class(
             {spec.key_str: spec for spec in specs}, sids, dt, 'minute',
             env=self.env,
         )
@@ -133,7 +138,7 @@ class TestHistoryContainer(TestCase):
         initial_dt = pd.Timestamp(
             '2013-06-28 9:31AM', tz='US/Eastern').tz_convert('UTC')
 
-        container = HistoryContainer(
+        container = self.container_class(
             specs, initial_sids, initial_dt, 'minute', env=self.env,
         )
 
@@ -176,7 +181,7 @@ class TestHistoryContainer(TestCase):
         initial_dt = pd.Timestamp(
             '2013-06-28 9:31AM', tz='US/Eastern').tz_convert('UTC')
 
-        container = HistoryContainer(
+        container = self.container_class(
             specs, initial_sids, initial_dt, 'minute', env=self.env,
         )
 
@@ -291,6 +296,11 @@ class TestHistoryContainer(TestCase):
         self.assertEqual(prices[1].ix[2], 20)
 
 
+class TestRingBufferHistoryContainer(TestHistoryContainer):
+
+    container_class = RingBufferHistoryContainer
+
+
 class TestHistoryAlgo(TestCase):
 
     @classmethod
@@ -432,6 +442,48 @@ def handle_data(context, data):
         self.assertEquals(139.36946942498648, last_prices[oldest_dt])
         self.assertEquals(180.15661995395106, last_prices[newest_dt])
 
+    def test_ring_buffer_history_container_matches(self):
+        algo_text = """
+from zipline.api import history
+
+def initialize(context):
+    context.history_trace = []
+
+def handle_data(context, data):
+    context.history_trace.append((
+        history(bar_count=3, frequency='1d', field='price'),
+        history(bar_count=3, frequency='1d', field='volume', ffill=False),
+        history(bar_count=15, frequency='1m', field='high'),
+        history(bar_count=1, frequency='1m', field='low'),
+    ))
+""".strip()
+
+        start = pd.Timestamp('2006-03-20', tz='UTC')
+        end = pd.Timestamp('2006-03-22', tz='UTC')
+
+        sim_params = factory.create_simulation_parameters(
+            start=start, end=end)
+
+        def run(container_class):
+            np.random.seed(123)
+            algo = TradingAlgorithm(
+                script=algo_text,
+                data_frequency='minute',
+                sim_params=sim_params,
+                env=TestHistoryAlgo.env,
+                history_container_class=container_class,
+            )
+            algo.run(RandomWalkSource(start=start, end=end))
+            return algo.history_trace
+
+        expected_trace = run(HistoryContainer)
+        trace = run(RingBufferHistoryContainer)
+
+        self.assertEqual(len(trace), len(expected_trace))
+        for frames, expected_frames in zip(trace, expected_trace):
+            for frame, expected in zip(frames, expected_frames):
+                assert_frame_equal(frame, expected)
+
     @parameterized.expand([
         ('daily',),
         ('minute',),
@@ -1341,6 +1393,8 @@ def handle_data(context, data):
 
 class TestHistoryContainerResize(TestCase):
 
+    container_class = HistoryContainer
+
     @classmethod
     def setUpClass(cls):
         cls.env = TradingEnvironment()
@@ -1384,7 +1438,7 @@ class TestHistoryContainerResize(TestCase):
             tz='UTC',
         )
 
-        container = HistoryContainer(
+        container = self.container_class(
             specs, initial_sids, initial_dt, data_frequency, env=self.env,
         )
 
@@ -1456,7 +1510,7 @@ class TestHistoryContainerResize(TestCase):
             tz='UTC',
         )
 
-        container = HistoryContainer(
+        container = self.container_class(
             specs, initial_sids, initial_dt, data_frequency, env=self.env
         )
 
@@ -1522,7 +1576,7 @@ class TestHistoryContainerResize(TestCase):
             tz='UTC',
         )
 
-        container = HistoryContainer(
+        container = self.container_class(
             specs, initial_sids, initial_dt, data_frequency, env=self.env,
         )
 
@@ -1562,3 +1616,8 @@ class TestHistoryContainerResize(TestCase):
         for n in reversed(hst.index):
             self.assertEqual(dt, n)
             dt = back(dt)
+
+
+class TestRingBufferHistoryContainerResize(TestHistoryContainerResize):
+
+    container_class = RingBufferHistoryContainer
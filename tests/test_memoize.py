@@ -1,9 +1,11 @@
 """
 Tests for zipline.utils.memoize.
 """
+import sys
+from types import ModuleType
 from unittest import TestCase
 
-from zipline.utils.memoize import remember_last
+from zipline.utils.memoize import lazy_module_attributes, remember_last
 
 
 class TestRememberLast(TestCase):
@@ -32,3 +34,40 @@ class TestRememberLast(TestCase):
         # Calling the old value should still increment the counter.
         self.assertEqual((func(1), call_count[0]), (1, 3))
         self.assertEqual((func(1), call_count[0]), (1, 3))
+
+
+class TestLazyModuleAttributes(TestCase):
+
+    def setUp(self):
+        self.name = 'zipline_test_lazy_module'
+        module = sys.modules[self.name] = ModuleType(self.name)
+        module.eager = 'eager'
+        module.get_lazy = lambda: sys.modules[self.name].lazy
+        self.call_count = call_count = [0]
+
+        def load_lazy():
+            call_count[0] += 1
+            return 'lazy'
+
+        self.module = lazy_module_attributes(self.name, lazy=load_lazy)
+
+    def tearDown(self):
+        del sys.modules[self.name]
+
+    def test_lazy_module_attributes(self):
+        module = self.module
+        self.assertIs(sys.modules[self.name], module)
+        self.assertEqual(module.eager, 'eager')
+        self.assertIn('lazy', dir(module))
+        self.assertEqual(self.call_count[0], 0)
+
+        self.assertEqual(module.lazy, 'lazy')
+        self.assertEqual(self.call_count[0], 1)
+
+        # The value should be remembered.
+        self.assertEqual(module.get_lazy(), 'lazy')
+        self.assertEqual(module.lazy, 'lazy')
+        self.assertEqual(self.call_count[0], 1)
+
+        with self.assertRaises(AttributeError):
+            module.missing
@@ -2437,6 +2437,66 @@ class TestPerformanceTracker(unittest.TestCase):
 
         check_perf_tracker_serialization(tracker)
 
+    def test_minute_benchmark_returns_since_open(self):
+        day_1 = datetime(2013, 3, 1)
+        day_2 = datetime(2013, 3, 4)
+
+        def minute(day, hour, minute):
+            return self.env.exchange_dt_in_utc(
+                day.replace(hour=hour, minute=minute),
+            )
+
+        sim_params = SimulationParameters(
+            period_start=minute(day_1, 9, 31),
+            period_end=minute(day_2, 16, 0),
+            emission_rate='minute',
+            env=self.env,
+        )
+        tracker = perf.PerformanceTracker(sim_params, env=self.env)
+        risk_metrics = tracker.cumulative_risk_metrics
+
+        bars = [
+            (minute(day_1, 9, 31), 0.01),
+            (minute(day_1, 9, 32), np.nan),
+            (minute(day_1, 9, 33), -0.02),
+            (minute(day_2, 9, 31), None),
+            (minute(day_2, 9, 32), 0.03),
+            (minute(day_2, 9, 33), 0.01),
+        ]
+        expected = [
+            0.01,
+            0.01,
+            1.01 * 0.98 - 1,
+            # No benchmark yet on the second day.
+            0.0,
+            0.03,
+            1.03 * 1.01 - 1,
+        ]
+        for (dt, returns), expected_returns in zip(bars, expected):
+            tracker.set_date(dt)
+            if returns is not None:
+                tracker.process_benchmark(Event({
+                    'dt': dt,
+                    'returns': returns,
+                    'type': zp.DATASOURCE_TYPE.BENCHMARK,
+                }))
+            tracker.handle_minute_close(dt)
+            np.testing.assert_almost_equal(
+                risk_metrics.benchmark_returns_cont[
+                    risk_metrics.latest_dt_loc
+                ],
+                expected_returns,
+            )
+
+        with self.assertRaises(AssertionError):
+            tracker.process_benchmark(Event({
+                'dt': minute(day_2, 8, 0),
+                'returns': 0.01,
+                'type': zp.DATASOURCE_TYPE.BENCHMARK,
+            }))
+
+        check_perf_tracker_serialization(tracker)
+
     def test_close_position_event(self):
         pt = perf.PositionTracker(asset_finder=self.env.asset_finder)
         dt = pd.Timestamp("1984/03/06 3:00PM")
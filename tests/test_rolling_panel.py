@@ -22,7 +22,11 @@ import numpy as np
 import pandas as pd
 import pandas.util.testing as tm
 
-from zipline.utils.data import MutableIndexRollingPanel, RollingPanel
+from zipline.utils.data import (
+    MutableIndexRollingPanel,
+    RollingBarWindow,
+    RollingPanel,
+)
 from zipline.finance.trading import TradingEnvironment
 
 
@@ -228,3 +232,68 @@ class TestMutableIndexRollingPanel(unittest.TestCase):
 
             expected_minor.append(add_item)
             expected_items.append(add_item)
+
+
+class TestRollingBarWindow(unittest.TestCase):
+
+    def test_basics(self, window=10):
+        fields = ['bar', 'baz', 'foo']
+        sids = ['A', 'B', 'C', 'D']
+
+        rbw = RollingBarWindow(window, fields, sids, cap_multiple=2)
+
+        dates = pd.date_range('2000-01-01', periods=30, tz='utc')
+
+        major_deque = deque(maxlen=window)
+
+        frames = {}
+
+        for date in dates:
+            frame = pd.DataFrame(np.random.randn(3, 4), index=fields,
+                                 columns=sids)
+
+            rbw.append(date, fields, sids, frame.to_dict())
+
+            frames[date] = frame
+            major_deque.append(date)
+
+            result = rbw.window().as_panel()
+            expected = pd.Panel(frames, items=list(major_deque),
+                                major_axis=fields, minor_axis=sids)
+
+            tm.assert_panel_equal(result, expected.swapaxes(0, 1))
+
+    def test_new_fields_and_sids(self):
+        dates = pd.date_range('2000-01-01', periods=4, tz='utc')
+        rbw = RollingBarWindow(3)
+
+        rbw.append(dates[0], ['a'], [1], {1: {'a': 1.0}})
+        rbw.append(dates[1], ['a', 'b'], [1, 2], {1: {'a': 2.0, 'b': 3.0}})
+        rbw.append(dates[2], ['a', 'b'], [2, 3], {2: {'a': 4.0}})
+        rbw.append(dates[3], ['b'], [3], {3: {'b': 5.0}})
+
+        self.assertEqual(rbw.fields, ['a', 'b'])
+        self.assertEqual(rbw.sids, [1, 2, 3])
+        nan = np.nan
+        np.testing.assert_array_equal(
+            rbw.values,
+            [[[2.0, nan, nan],
+              [nan, 4.0, nan],
+              [nan, nan, nan]],
+             [[3.0, nan, nan],
+              [nan, nan, nan],
+              [nan, nan, 5.0]]],
+        )
+        np.testing.assert_array_equal(rbw.dates, dates[1:].asi8)
+
+        window = rbw.window(sids=[3, 1])
+        self.assertEqual(window.sids, [1, 3])
+        self.assertIn('b', window)
+        self.assertNotIn('c', window)
+        np.testing.assert_array_equal(
+            window['b'],
+            [[3.0, nan],
+             [nan, nan],
+             [nan, 5.0]],
+        )
+        self.assertTrue(window.dates.equals(dates[1:]))
@@ -12,12 +12,16 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from itertools import groupby
+from operator import attrgetter
+
 import numpy as np
 import pandas as pd
 import pytz
 
 
 from six import integer_types
+from six.moves import filter
 
 from unittest import TestCase
 
@@ -28,6 +32,8 @@ from zipline.sources import (DataFrameSource,
 from zipline.utils import tradingcalendar as calendar_nyse
 from zipline.assets import AssetFinder
 from zipline.finance.trading import TradingEnvironment
+from zipline.gens.composites import date_sorted_sources, dt_aligned_snapshots
+from zipline.protocol import DATASOURCE_TYPE, Event
 
 
 class TestDataFrameSource(TestCase):
@@ -48,6 +54,38 @@ class TestDataFrameSource(TestCase):
         assert 1 not in [event.sid for event in source], \
             "DataFrameSource should only stream selected sid 0, not sid 1."
 
+    def test_columnar_df_source(self):
+        dates = pd.date_range('1/1/2000', periods=3, freq='B', tz='UTC')
+        df = pd.DataFrame(np.random.randn(3, 3),
+                          index=dates,
+                          columns=[4, 5, 6])
+        # Can't be forward filled, so should be filtered.
+        df.loc[dates[0], 4] = np.nan
+        df.loc[dates[:2], 6] = np.nan
+        # Should be forward filled.
+        df.loc[dates[2], 5] = np.nan
+
+        events = list(DataFrameSource(df))
+        snapshots = list(DataFrameSource(df, columnar=True))
+
+        self.assertEqual(len(snapshots), len(dates))
+        expected_trades = []
+        for dt, snapshot in zip(dates, snapshots):
+            self.assertEqual(snapshot.type, DATASOURCE_TYPE.TRADE_SNAPSHOT)
+            self.assertEqual(snapshot.dt, dt)
+            expected_trades.extend(snapshot.trades())
+
+        self.assertEqual(
+            [event.__dict__ for event in events],
+            [trade.__dict__ for trade in expected_trades],
+        )
+
+        # Trades can be materialized for a subset of sids.
+        self.assertEqual(
+            [trade.sid for trade in snapshots[-1].trades({5, 7})],
+            [5],
+        )
+
     def test_panel_source(self):
         source, panel = factory.create_test_panel_source(source_type=5)
         assert isinstance(source.start, pd.lib.Timestamp)
@@ -126,6 +164,90 @@ class TestDataFrameSource(TestCase):
         self.assertRaises(StopIteration, next, source)
 
 
+class TestDtAlignedSnapshots(TestCase):
+
+    def setUp(self):
+        dates = pd.date_range('1/3/2000', periods=6, freq='B', tz='UTC')
+        self.df_1 = pd.DataFrame(
+            np.random.randn(4, 2),
+            index=dates[:4],
+            columns=[1, 2],
+        )
+        self.df_1.loc[dates[0], 2] = np.nan
+        self.df_2 = pd.DataFrame(
+            np.random.randn(4, 1),
+            index=dates[2:],
+            columns=[3],
+        )
+        self.benchmark = [
+            Event({
+                'dt': dt,
+                'returns': 0.01,
+                'type': DATASOURCE_TYPE.BENCHMARK,
+                'source_id': 'benchmarks',
+            })
+            for dt in dates[1:]
+        ]
+
+    def expected_snapshots(self, benchmark, source_filter=None, **kwargs):
+        date_sorted = date_sorted_sources(
+            DataFrameSource(self.df_1, **kwargs),
+            DataFrameSource(self.df_2, **kwargs),
+        )
+        if source_filter is not None:
+            date_sorted = filter(source_filter, date_sorted)
+        return [
+            (dt, list(events)) for dt, events in groupby(
+                date_sorted_sources(benchmark, date_sorted),
+                attrgetter('dt'),
+            )
+        ]
+
+    def check(self, source_filter=None, **kwargs):
+        result = dt_aligned_snapshots(
+            [
+                DataFrameSource(self.df_1, **kwargs),
+                DataFrameSource(self.df_2, **kwargs),
+            ],
+            self.benchmark,
+            source_filter,
+        )
+        self.assertIsNotNone(result)
+        self.assertEqual(
+            list(result),
+            self.expected_snapshots(self.benchmark, source_filter, **kwargs),
+        )
+
+    def test_matches_date_sorted_sources(self):
+        self.check()
+
+    def test_matches_date_sorted_sources_columnar(self):
+        self.check(columnar=True)
+
+    def test_source_filter(self):
+        self.check(source_filter=lambda event: event.sid != 1)
+
+    def test_fallback(self):
+        walk = RandomWalkSource(
+            start=pd.Timestamp('2000-01-03', tz='UTC'),
+            end=pd.Timestamp('2000-01-10', tz='UTC'),
+            freq='daily',
+        )
+        self.assertIsNone(
+            dt_aligned_snapshots([walk], self.benchmark),
+        )
+
+        unsorted = list(reversed(self.benchmark))
+        self.assertIsNone(
+            dt_aligned_snapshots([DataFrameSource(self.df_1)], unsorted),
+        )
+
+        unsorted_df = self.df_1.iloc[::-1]
+        self.assertIsNone(
+            dt_aligned_snapshots([DataFrameSource(unsorted_df)], []),
+        )
+
+
 class TestRandomWalkSource(TestCase):
     def test_minute(self):
         np.random.seed(123)
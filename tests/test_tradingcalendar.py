@@ -13,7 +13,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+from testfixtures import TempDirectory
+
 from zipline.utils import tradingcalendar
 from zipline.utils import tradingcalendar_lse
 from zipline.utils import tradingcalendar_tse
@@ -263,3 +269,67 @@ If NYE falls on a weekend, {0} the Tuesday after is the first trading day.
         friday_after = datetime.datetime(2013, 7, 5, tzinfo=pytz.utc)
         self.assertIn(wednesday_before, early_closes)
         self.assertNotIn(friday_after, early_closes)
+
+    def test_calendar_cache(self):
+        with TempDirectory() as tmp:
+            path = os.path.join(tmp.path, 'cache', 'calendar.npz')
+            computed = tradingcalendar.load_calendar_arrays(path)
+            self.assertTrue(os.path.exists(path))
+            cached = tradingcalendar.load_calendar_arrays(path)
+
+            # Unreadable caches should be recomputed.
+            with open(path, 'wb') as f:
+                f.write(b'garbage')
+            recomputed = tradingcalendar.load_calendar_arrays(path)
+
+            # Caches computed for a different end date are replaced.
+            with open(path, 'wb') as f:
+                np.savez(f, end=np.int64(0), **computed)
+            extended = tradingcalendar.load_calendar_arrays(path)
+            written = np.load(path)
+            try:
+                self.assertEqual(written['end'], tradingcalendar.end.value)
+            finally:
+                written.close()
+
+        for arrays in cached, recomputed, extended:
+            self.assertEqual(sorted(arrays), sorted(computed))
+            for name in computed:
+                np.testing.assert_array_equal(arrays[name], computed[name])
+
+        np.testing.assert_array_equal(
+            computed['trading_days'],
+            tradingcalendar.get_trading_days(
+                tradingcalendar.start,
+                tradingcalendar.end,
+                tradingcalendar.trading_day,
+            ).asi8,
+        )
+        np.testing.assert_array_equal(
+            computed['non_trading_days'],
+            tradingcalendar.get_non_trading_days(
+                tradingcalendar.start,
+                tradingcalendar.end,
+            ).asi8,
+        )
+        np.testing.assert_array_equal(
+            computed['early_closes'],
+            tradingcalendar.get_early_closes(
+                tradingcalendar.start,
+                tradingcalendar.end,
+            ).asi8,
+        )
+
+    def test_open_and_closes(self):
+        # Span an early close and both DST transitions.
+        days = tradingcalendar.trading_days
+        days = days[days.slice_indexer('2013-03-01', '2013-12-31')]
+        expected = tradingcalendar.get_open_and_closes(
+            days,
+            tradingcalendar.early_closes,
+            tradingcalendar.get_open_and_close,
+        )
+        pd.util.testing.assert_frame_equal(
+            tradingcalendar.open_and_closes.loc[days],
+            expected,
+        )
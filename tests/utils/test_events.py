@@ -47,6 +47,9 @@ from zipline.utils.events import (
     _build_time,
     EventManager,
     Event,
+    CompiledEvent,
+    compile_rule,
+    make_eventrule,
     MAX_MONTH_RANGE,
     MAX_WEEK_RANGE,
 )
@@ -403,3 +406,114 @@ class TestStatefulRules(RuleTestCase):
             rule.should_trigger(m, env=self.env)
 
         self.assertEqual(rule.count, 1)
+
+
+class TestCompiledRules(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.env = TradingEnvironment()
+        # Includes the half day after Thanksgiving and a month end.
+        cls.sessions = cls.env.days_in_range(
+            pd.Timestamp('2014-11-24', tz='UTC'),
+            pd.Timestamp('2014-12-05', tz='UTC'),
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.env
+
+    @parameterized.expand([
+        ('Always', Always()),
+        ('Never', Never()),
+        ('AfterOpen', AfterOpen(hours=1, minutes=5)),
+        ('BeforeClose', BeforeClose(hours=1, minutes=5)),
+        ('NotHalfDay', NotHalfDay()),
+        ('NthTradingDayOfWeek', NthTradingDayOfWeek(1)),
+        ('NDaysBeforeLastTradingDayOfWeek',
+         NDaysBeforeLastTradingDayOfWeek(1)),
+        ('NthTradingDayOfMonth', NthTradingDayOfMonth(2)),
+        ('NDaysBeforeLastTradingDayOfMonth',
+         NDaysBeforeLastTradingDayOfMonth(1)),
+        ('ComposedRule', NthTradingDayOfWeek(0) & AfterOpen(minutes=30)),
+    ])
+    def test_compile_rule(self, name, rule):
+        triggers = compile_rule(rule, self.sessions.asi8, self.env)
+        self.assertEqual(len(triggers), len(self.sessions))
+
+        for day, trigger in zip(self.sessions, triggers):
+            minutes = self.env.market_minutes_for_day(day)
+            self.assertEqual(
+                list(minutes.asi8 >= trigger),
+                [rule.should_trigger(m, self.env) for m in minutes],
+                msg='%s on %s' % (name, day.date()),
+            )
+
+    def test_uncompilable_rules(self):
+        class Custom(StatelessRule):
+            def should_trigger(self, dt, env):
+                return dt.minute == 0
+
+        class CustomAfterOpen(AfterOpen):
+            def should_trigger(self, dt, env):
+                return dt.minute == 0
+
+        sessions = self.sessions.asi8
+        self.assertIsNone(compile_rule(Custom(), sessions, self.env))
+        self.assertIsNone(
+            compile_rule(CustomAfterOpen(), sessions, self.env),
+        )
+        self.assertIsNone(
+            compile_rule(Custom() & AfterOpen(), sessions, self.env),
+        )
+        self.assertIsNone(
+            compile_rule(
+                ComposedRule(Always(), AfterOpen(), lambda *args: True),
+                sessions,
+                self.env,
+            ),
+        )
+
+    def test_compiled_dispatch(self):
+        class OnTheHour(StatelessRule):
+            def should_trigger(self, dt, env):
+                return dt.minute == 0
+
+        def make_rules():
+            return [
+                make_eventrule(NthTradingDayOfWeek(0), AfterOpen(minutes=30)),
+                make_eventrule(
+                    Always(),
+                    BeforeClose(minutes=10),
+                    half_days=False,
+                ),
+                BeforeClose(minutes=5),
+                OncePerDay(OnTheHour()),
+            ]
+
+        context = namedtuple('FakeAlgo', ['trading_environment'])(self.env)
+        minutes = self.env.minutes_for_days_in_range(
+            self.sessions[0],
+            self.sessions[-1],
+        )
+
+        results = []
+        for compiled in False, True:
+            fired = []
+            em = EventManager()
+            for i, rule in enumerate(make_rules()):
+                em.add_event(Event(
+                    rule,
+                    partial(lambda i, context, dt: fired.append((i, dt)), i),
+                ))
+            if compiled:
+                em.compile(self.sessions, self.env)
+                self.assertEqual(
+                    [type(d) for d in em._dispatchers],
+                    [CompiledEvent] * 3 + [Event],
+                )
+            for m in minutes:
+                em.handle_data(context, m, m)
+            results.append(fired)
+
+        self.assertTrue(results[0])
+        self.assertEqual(results[0], results[1])
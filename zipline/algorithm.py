@@ -74,7 +74,10 @@ from zipline.finance.slippage import (
 )
 from zipline.assets import Asset, Future
 from zipline.assets.futures import FutureChain
-from zipline.gens.composites import date_sorted_sources
+from zipline.gens.composites import (
+    date_sorted_sources,
+    dt_aligned_snapshots,
+)
 from zipline.gens.tradesimulation import AlgorithmSimulator
 from zipline.pipeline.engine import (
     NoOpPipelineEngine,
@@ -172,6 +175,8 @@ class TradingAlgorithm(object):
         return the actual context manager that will be entered.
     history_container_class : type, optional
         The type of history container to use. default: HistoryContainer
+        ``RingBufferHistoryContainer`` trades some bookkeeping for less
+        per-bar pandas overhead in minute simulations.
     platform : str, optional
         The platform the simulation is running on. This can be queried for
         in the simulation with ``get_environment``. This allows algorithms
@@ -439,6 +444,16 @@ class TradingAlgorithm(object):
         else:
             benchmark_return_source = self.benchmark_return_source
 
+        # Sources that know their datetimes up front can be merged without
+        # comparing every event.
+        snapshots = dt_aligned_snapshots(
+            self.sources,
+            benchmark_return_source,
+            source_filter,
+        )
+        if snapshots is not None:
+            return snapshots
+
         date_sorted = date_sorted_sources(*self.sources)
 
         if source_filter:
@@ -465,6 +480,13 @@ class TradingAlgorithm(object):
             self.initialize(*self.initialize_args, **self.initialize_kwargs)
             self.initialized = True
 
+        # Scheduled functions are registered in initialize, so their rules can
+        # now be compiled over the simulation's sessions.
+        self.event_manager.compile(
+            sim_params.trading_days,
+            self.trading_environment,
+        )
+
         if self.perf_tracker is None:
             # HACK: When running with the `run` method, we set perf_tracker to
             # None so that it will be overwritten here.
@@ -23,7 +23,9 @@ from ._assets import (
 from .assets import (
     AssetFinder,
     AssetConvertible,
-    AssetFinderCachedEquities
+    AssetFinderCachedEquities,
+    AssetFinderPreloaded,
+    AssetFinderSnapshot,
 )
 
 __all__ = [
@@ -32,6 +34,8 @@ __all__ = [
     'Future',
     'AssetFinder',
     'AssetFinderCachedEquities',
+    'AssetFinderPreloaded',
+    'AssetFinderSnapshot',
     'AssetConvertible',
     'make_asset_array',
     'CACHE_FILE_TEMPLATE'
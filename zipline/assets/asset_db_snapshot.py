@@ -0,0 +1,320 @@
+"""
+Binary snapshots of the asset tables of an assets database.
+
+A snapshot is a directory holding the ``asset_router``, ``equities`` and
+``futures_contracts`` tables as one ``.npy`` file per column, along with a
+``meta.json`` file describing the tables.  Integer columns, such as sids and
+dates, are stored as int64 and floating point columns as float64, with nan
+for missing values.  Text columns are stored as a sorted table of the
+column's distinct strings, encoded as UTF-8, and an int32 code per row
+indexing into that table, with -1 for missing values.
+
+Columns are memory-mapped when a snapshot is read, and stay mapped: text
+is only decoded when an asset is built or a symbol is looked up.  Processes
+reading the same snapshot therefore read it from the pages they share in the
+OS's page cache, instead of each querying the database and holding its own
+copy of the tables.
+"""
+import json
+import os
+import shutil
+from uuid import uuid4
+
+import numpy as np
+import sqlalchemy as sa
+from six import text_type
+
+from zipline.assets.asset_db_schema import (
+    ASSET_DB_VERSION,
+    generate_asset_db_metadata,
+)
+from zipline.errors import AssetDBSnapshotVersionError, AssetDBVersionError
+
+
+# Increment this version number any time the layout of snapshots changes.
+SNAPSHOT_VERSION = 1
+
+# The tables stored in a snapshot.
+snapshot_table_names = ('asset_router', 'equities', 'futures_contracts')
+
+# Columns which are stored as int64 nanoseconds, with NaT for missing values.
+_int64_columns = frozenset({
+    'sid',
+    'start_date',
+    'end_date',
+    'first_traded',
+    'notice_date',
+    'expiration_date',
+    'auto_close_date',
+})
+
+META_FILENAME = 'meta.json'
+
+_NAT = np.iinfo(np.int64).min
+
+
+class AssetTable(object):
+    """
+    An asset table sorted by sid, stored column by column.
+
+    Sids and dates are stored as int64, with NaT for missing dates, and other
+    numeric columns as float64, with nan for missing values.  Text columns
+    are stored as a sorted array of the column's distinct strings, encoded as
+    UTF-8, and an int32 code per row indexing into that array, with -1 for
+    missing values.  Strings are only decoded when a row is read with `row`
+    or a value is looked up with `code`.
+
+    Parameters
+    ----------
+    length : int
+        The number of rows in the table.
+    columns : dict[str -> np.ndarray]
+        Map from the name of each numeric column to its values.
+    strings : dict[str -> (np.ndarray[bytes], np.ndarray[int32])]
+        Map from the name of each text column to its encoded strings and
+        codes.
+    """
+    def __init__(self, length, columns, strings):
+        self._length = length
+        self._columns = columns
+        self._strings = strings
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, name):
+        """
+        The values of the numeric column `name`.
+        """
+        return self._columns[name]
+
+    def codes(self, name):
+        """
+        The code of each row of the text column `name`.
+        """
+        return self._strings[name][1]
+
+    def num_codes(self, name):
+        """
+        The number of distinct codes used by the text column `name`.
+        """
+        return len(self._strings[name][0])
+
+    def code(self, name, value):
+        """
+        The code of `value` in the text column `name`: -1 if `value` is None,
+        or None if no row has that value.
+        """
+        if value is None:
+            return -1
+        encoded, codes = self._strings[name]
+        value = text_type(value).encode('utf-8')
+        code = encoded.searchsorted(value)
+        if code == len(encoded) or encoded[code] != value:
+            return None
+        return int(code)
+
+    def string(self, name, row):
+        """
+        The decoded value of the text column `name` at `row`.
+        """
+        encoded, codes = self._strings[name]
+        code = codes[row]
+        return None if code == -1 else encoded[code].decode('utf-8')
+
+    def row(self, row):
+        """
+        The values of `row` as a dict, with text decoded and missing values
+        as None.  Sids and dates are left as int64.
+        """
+        out = {}
+        for name, column in self._columns.items():
+            value = column[row]
+            if column.dtype == np.float64:
+                value = None if np.isnan(value) else float(value)
+            out[name] = value
+        for name in self._strings:
+            out[name] = self.string(name, row)
+        return out
+
+
+def read_asset_table(table):
+    """
+    Read an asset table into an AssetTable sorted by sid.
+
+    Parameters
+    ----------
+    table : sa.Table
+        A table with a ``sid`` column, bound to an assets database.
+
+    Returns
+    -------
+    table : AssetTable
+        The rows of `table`.
+    """
+    names = table.c.keys()
+    rows = sa.select(table.c).order_by(table.c.sid).execute().fetchall()
+    columns = {}
+    strings = {}
+    for i, name in enumerate(names):
+        values = [row[i] for row in rows]
+        if name in _int64_columns:
+            columns[str(name)] = np.array(
+                [_NAT if value is None else value for value in values],
+                dtype=np.int64,
+            )
+        elif isinstance(table.c[name].type, (sa.Float, sa.Integer)):
+            columns[str(name)] = np.array(
+                [np.nan if value is None else value for value in values],
+                dtype=np.float64,
+            )
+        else:
+            strings[str(name)] = _encode_strings(values)
+    return AssetTable(len(rows), columns, strings)
+
+
+def write_asset_db_snapshot(bind, path):
+    """
+    Write a snapshot of the asset tables of an assets database.
+
+    Parameters
+    ----------
+    bind : sa.engine.Engine or sa.engine.Connection
+        The assets database to snapshot.
+    path : str
+        Directory in which to write the snapshot.  Any existing snapshot at
+        `path` is replaced.
+
+    Raises
+    ------
+    AssetDBVersionError
+        If the database isn't at the current ASSET_DB_VERSION.
+    """
+    metadata = generate_asset_db_metadata(bind=bind)
+    version_info = metadata.tables['version_info']
+    db_version = sa.select((version_info.c.version,)).scalar() or 0
+    if db_version != ASSET_DB_VERSION:
+        raise AssetDBVersionError(
+            db_version=db_version,
+            expected_version=ASSET_DB_VERSION,
+        )
+
+    tmp_path = '%s.%s' % (path.rstrip(os.sep), uuid4().hex)
+    os.makedirs(tmp_path)
+    try:
+        tables = {}
+        for table_name in snapshot_table_names:
+            table = read_asset_table(metadata.tables[table_name])
+            columns = {}
+            for name, values in table._columns.items():
+                if name in _int64_columns:
+                    columns[name] = 'int64'
+                else:
+                    columns[name] = 'float64'
+                _save(tmp_path, table_name, name, values)
+            for name, (encoded, codes) in table._strings.items():
+                columns[name] = 'string'
+                _save(tmp_path, table_name, name + '.strings', encoded)
+                _save(tmp_path, table_name, name + '.codes', codes)
+            tables[table_name] = {'length': len(table), 'columns': columns}
+
+        with open(os.path.join(tmp_path, META_FILENAME), 'w') as f:
+            json.dump(
+                {
+                    'snapshot_version': SNAPSHOT_VERSION,
+                    'asset_db_version': db_version,
+                    'tables': tables,
+                },
+                f,
+            )
+
+        if os.path.exists(path):
+            shutil.rmtree(path)
+        os.rename(tmp_path, path)
+    except Exception:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        raise
+
+
+def read_asset_db_snapshot(path):
+    """
+    Read the tables of a snapshot written by `write_asset_db_snapshot`.
+
+    Parameters
+    ----------
+    path : str
+        Directory holding the snapshot.
+
+    Returns
+    -------
+    tables : dict[str -> AssetTable]
+        Map from table name to an AssetTable whose arrays are memory-mapped
+        from the snapshot's files.
+
+    Raises
+    ------
+    AssetDBSnapshotVersionError
+        If the snapshot was written by a different version of zipline.
+    """
+    with open(os.path.join(path, META_FILENAME)) as f:
+        meta = json.load(f)
+
+    if (meta['snapshot_version'] != SNAPSHOT_VERSION or
+            meta['asset_db_version'] != ASSET_DB_VERSION):
+        raise AssetDBSnapshotVersionError(
+            path=path,
+            snapshot_version=meta['snapshot_version'],
+            db_version=meta['asset_db_version'],
+            expected_snapshot_version=SNAPSHOT_VERSION,
+            expected_db_version=ASSET_DB_VERSION,
+        )
+
+    tables = {}
+    for table_name, table in meta['tables'].items():
+        columns = {}
+        strings = {}
+        for name, kind in table['columns'].items():
+            if kind == 'string':
+                strings[str(name)] = (
+                    _load(path, table_name, name + '.strings'),
+                    _load(path, table_name, name + '.codes'),
+                )
+            else:
+                columns[str(name)] = _load(path, table_name, name)
+        tables[str(table_name)] = AssetTable(
+            table['length'],
+            columns,
+            strings,
+        )
+    return tables
+
+
+def _column_path(path, table_name, name):
+    return os.path.join(path, '%s.%s.npy' % (table_name, name))
+
+
+def _save(path, table_name, name, array):
+    np.save(_column_path(path, table_name, name), array)
+
+
+def _load(path, table_name, name):
+    return np.load(_column_path(path, table_name, name), mmap_mode='r')
+
+
+def _encode_strings(values):
+    """
+    Encode an array of strings and Nones as a sorted table of the distinct
+    strings, encoded as UTF-8, and the index of each value in that table.
+    """
+    strings = sorted({v for v in values if v is not None})
+    positions = {s: i for i, s in enumerate(strings)}
+    codes = np.array(
+        [-1 if v is None else positions[v] for v in values],
+        dtype=np.int32,
+    )
+    encoded = np.array(
+        [text_type(s).encode('utf-8') for s in strings] or [b''],
+        dtype=bytes,
+    )
+    return encoded, codes
+
@@ -32,6 +32,7 @@ from zipline.assets.asset_db_schema import (
     asset_db_table_names,
     ASSET_DB_VERSION,
 )
+from zipline.assets.asset_db_snapshot import write_asset_db_snapshot
 
 SQLITE_MAX_VARIABLE_NUMBER = 999
 
@@ -259,7 +260,8 @@ class AssetDBWriter(with_metaclass(ABCMeta)):
 
     def write_all(self,
                   engine,
-                  allow_sid_assignment=True):
+                  allow_sid_assignment=True,
+                  snapshot_path=None):
         """ Write pre-supplied data to SQLite.
 
         Parameters
@@ -270,6 +272,10 @@ class AssetDBWriter(with_metaclass(ABCMeta)):
             If True then the class can assign sids where necessary.
         constraints : bool, optional
             If True then create SQL ForeignKey and PrimaryKey constraints.
+        snapshot_path : str, optional
+            If given, also write a snapshot of the database's asset tables to
+            this directory once the data is written, which can be opened with
+            ``AssetFinderSnapshot``.
 
         """
         self.allow_sid_assignment = allow_sid_assignment
@@ -285,6 +291,8 @@ class AssetDBWriter(with_metaclass(ABCMeta)):
             self._write_root_symbols(data.root_symbols, txn)
             self._write_futures(data.futures, txn)
             self._write_equities(data.equities, txn)
+            if snapshot_path is not None:
+                write_asset_db_snapshot(txn, snapshot_path)
 
     def _write_df_to_table(self, df, tbl, bind):
         df.to_sql(
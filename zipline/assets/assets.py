@@ -45,6 +45,11 @@ from zipline.assets.asset_writer import (
 from zipline.assets.asset_db_schema import (
     ASSET_DB_VERSION
 )
+from zipline.assets.asset_db_snapshot import (
+    read_asset_db_snapshot,
+    read_asset_table,
+    snapshot_table_names,
+)
 from zipline.utils.control_flow import invert
 
 log = Logger('assets.py')
@@ -103,14 +108,13 @@ class AssetFinder(object):
     def __init__(self, engine):
 
         self.engine = engine
-        metadata = sa.MetaData(bind=engine)
-        metadata.reflect(only=asset_db_table_names)
-        for table_name in asset_db_table_names:
-            setattr(self, table_name, metadata.tables[table_name])
-
-        # Check the version info of the db for compatibility
-        check_version_info(self.version_info, ASSET_DB_VERSION)
+        self._reflect_tables()
+        self._init_caches()
 
+    def _init_caches(self):
+        """
+        Create our empty asset and lifetime caches.
+        """
         # Cache for lookup of assets by sid, the objects in the asset lookup
         # may be shared with the results from equity and future lookup caches.
         #
@@ -119,10 +123,29 @@ class AssetFinder(object):
         #
         # The caches are read through, i.e. accessing an asset through
         # retrieve_asset will populate the cache on first retrieval.
-        self._caches = (self._asset_cache, self._asset_type_cache) = {}, {}
+        self._caches = (
+            self._asset_cache,
+            self._asset_type_cache,
+            self._future_chain_timelines,
+        ) = {}, {}, {}
 
         # Populated on first call to `lifetimes`.
         self._asset_lifetimes = None
+        self._lifetimes_index = None
+        self._previous_lifetimes = {}
+
+    def _reflect_tables(self):
+        """
+        Reflect the tables of our database onto attributes of self, and check
+        that the database is at the current ASSET_DB_VERSION.
+        """
+        metadata = sa.MetaData(bind=self.engine)
+        metadata.reflect(only=asset_db_table_names)
+        for table_name in asset_db_table_names:
+            setattr(self, table_name, metadata.tables[table_name])
+
+        # Check the version info of the db for compatibility
+        check_version_info(self.version_info, ASSET_DB_VERSION)
 
     def _reset_caches(self):
         """
@@ -585,86 +608,57 @@ class AssetFinder(object):
         RootSymbolNotFound
             Raised when a future chain could not be found for the given
             root symbol.
-        """
 
-        fc_cols = self.futures_contracts.c
+        Notes
+        -----
+        The contracts of a root symbol are read once, the first time its
+        chain is looked up, and sorted by the date on which each one leaves
+        the chain.  Later lookups, for any date, binary search those dates.
+        """
+        timeline = self._future_chain_timelines.get(root_symbol)
+        if timeline is None:
+            sids, notice_dates, expiration_dates = self._future_chain_dates(
+                root_symbol,
+            )
+            if not len(sids):
+                raise RootSymbolNotFound(root_symbol=root_symbol)
+            sids = sids.tolist()
+            contracts = self.retrieve_futures_contracts(sids)
+            timeline = self._future_chain_timelines[root_symbol] = (
+                _FutureChainTimeline(
+                    [contracts[sid] for sid in sids],
+                    notice_dates,
+                    expiration_dates,
+                )
+            )
 
         if as_of_date is pd.NaT:
-            # If the as_of_date is NaT, get all contracts for this
-            # root symbol.
-            sids = list(map(
-                itemgetter('sid'),
-                sa.select((fc_cols.sid,)).where(
-                    (fc_cols.root_symbol == root_symbol),
-                ).order_by(
-                    fc_cols.notice_date.asc(),
-                ).execute().fetchall()))
-        else:
-            as_of_date = as_of_date.value
-
-            sids = list(map(
-                itemgetter('sid'),
-                sa.select((fc_cols.sid,)).where(
-                    (fc_cols.root_symbol == root_symbol) &
-
-                    # Filter to contracts that are still valid. If both
-                    # exist, use the one that comes first in time (i.e.
-                    # the lower value). If either notice_date or
-                    # expiration_date is NaT, use the other. If both are
-                    # NaT, the contract cannot be included in any chain.
-                    sa.case(
-                        [
-                            (
-                                fc_cols.notice_date == pd.NaT.value,
-                                fc_cols.expiration_date >= as_of_date
-                            ),
-                            (
-                                fc_cols.expiration_date == pd.NaT.value,
-                                fc_cols.notice_date >= as_of_date
-                            )
-                        ],
-                        else_=(
-                            sa.func.min(
-                                fc_cols.notice_date,
-                                fc_cols.expiration_date
-                            ) >= as_of_date
-                        )
-                    )
-                ).order_by(
-                    # If both dates exist sort using minimum of
-                    # expiration_date and notice_date
-                    # else if one is NaT use the other.
-                    sa.case(
-                        [
-                            (
-                                fc_cols.expiration_date == pd.NaT.value,
-                                fc_cols.notice_date
-                            ),
-                            (
-                                fc_cols.notice_date == pd.NaT.value,
-                                fc_cols.expiration_date
-                            )
-                        ],
-                        else_=(
-                            sa.func.min(
-                                fc_cols.notice_date,
-                                fc_cols.expiration_date
-                            )
-                        )
-                    ).asc()
-                ).execute().fetchall()
-            ))
+            return timeline.all_contracts()
+        return timeline.as_of(as_of_date.value)
 
-        if not sids:
-            # Check if root symbol exists.
-            count = sa.select((sa.func.count(fc_cols.sid),)).where(
-                fc_cols.root_symbol == root_symbol,
-            ).scalar()
-            if count == 0:
-                raise RootSymbolNotFound(root_symbol=root_symbol)
-
-        contracts = self.retrieve_futures_contracts(sids)
-        return [contracts[sid] for sid in sids]
+    def _future_chain_dates(self, root_symbol):
+        """
+        Read the sids, notice dates and expiration dates of the contracts of
+        `root_symbol`, ordered by sid, as int64 arrays.
+        """
+        fc_cols = self.futures_contracts.c
+        rows = sa.select((
+            fc_cols.sid,
+            fc_cols.notice_date,
+            fc_cols.expiration_date,
+        )).where(
+            fc_cols.root_symbol == root_symbol,
+        ).order_by(
+            fc_cols.sid,
+        ).execute().fetchall()
+        columns = np.array(
+            [
+                [pd.NaT.value if value is None else value for value in row]
+                for row in rows
+            ],
+            dtype=np.int64,
+        ).reshape(len(rows), 3)
+        return columns[:, 0], columns[:, 1], columns[:, 2]
 
     @property
     def sids(self):
@@ -837,7 +831,7 @@ class AssetFinder(object):
             ('end', '<i8'),
         ])
 
-    def lifetimes(self, dates, include_start_date):
+    def lifetimes(self, dates, include_start_date, alive_only=False):
         """
         Compute a DataFrame representing asset lifetimes for the specified date
         range.
@@ -854,6 +848,10 @@ class AssetFinder(object):
             this date?"  For many financial metrics, (e.g. daily close), data
             isn't available for an asset until the end of the asset's first
             day.
+        alive_only : bool, optional
+            Whether to only return columns for assets that existed on at least
+            one of `dates`.  These columns are sorted by sid.  Default is
+            False.
 
         Returns
         -------
@@ -864,6 +862,16 @@ class AssetFinder(object):
             False, then lifetimes.loc[date, asset] will be false when date ==
             asset.start_date.
 
+        Notes
+        -----
+        With `alive_only`, assets that can't have existed on any of `dates`
+        are found by binary searching the assets' start dates, so the mask is
+        only built for the remaining assets.  Rows for dates that were also
+        passed to the previous call with `alive_only` and the same
+        `include_start_date` are copied from its result, so consecutive
+        pipeline chunks, which overlap by the length of their trailing
+        windows, only compute the rows for their new dates.
+
         See Also
         --------
         numpy.putmask
@@ -877,15 +885,93 @@ class AssetFinder(object):
             self._asset_lifetimes = self._compute_asset_lifetimes()
         lifetimes = self._asset_lifetimes
 
-        raw_dates = dates.asi8[:, None]
-        if include_start_date:
-            mask = lifetimes.start <= raw_dates
-        else:
-            mask = lifetimes.start < raw_dates
-        mask &= (raw_dates <= lifetimes.end)
+        if alive_only:
+            return self._alive_lifetimes(lifetimes, dates, include_start_date)
 
+        mask = _lifetimes_mask(lifetimes, dates.asi8, include_start_date)
         return pd.DataFrame(mask, index=dates, columns=lifetimes.sid)
 
+    def _alive_lifetimes(self, lifetimes, dates, include_start_date):
+        """
+        Compute ``lifetimes(dates, include_start_date, alive_only=True)``,
+        reusing rows of the previous result where we can.
+        """
+        previous = self._previous_lifetimes.get(include_start_date)
+        if previous is not None and previous[0] is lifetimes:
+            previous_frame = previous[1]
+            previous_rows = previous_frame.index.get_indexer(dates)
+            previous_sids = previous_frame.columns.values
+        else:
+            previous_frame = None
+            previous_rows = np.full(len(dates), -1, dtype=np.int64)
+            previous_sids = np.array([], dtype=np.int64)
+        reused = previous_rows != -1
+
+        new_sids, new_mask = self._alive_mask(
+            lifetimes,
+            dates.asi8[~reused],
+            include_start_date,
+        )
+
+        # An asset that is only in one of the two results didn't exist on any
+        # of the other result's dates, so it is False on those rows.
+        sids = np.union1d(previous_sids, new_sids)
+        mask = np.zeros((len(dates), len(sids)), dtype=bool)
+        if reused.any():
+            mask[np.ix_(reused, sids.searchsorted(previous_sids))] = (
+                previous_frame.values[previous_rows[reused]]
+            )
+        mask[np.ix_(~reused, sids.searchsorted(new_sids))] = new_mask
+
+        alive = mask.any(axis=0)
+        result = pd.DataFrame(mask[:, alive], index=dates, columns=sids[alive])
+        self._previous_lifetimes[include_start_date] = lifetimes, result
+        return result
+
+    def _alive_mask(self, lifetimes, raw_dates, include_start_date):
+        """
+        Compute the lifetimes mask of the assets that existed on at least one
+        of `raw_dates`.
+
+        Returns
+        -------
+        sids : np.ndarray[int64]
+            The sorted sids of the assets that existed on any of `raw_dates`.
+        mask : np.ndarray[bool]
+            Array of shape ``(len(raw_dates), len(sids))``.
+        """
+        if not len(raw_dates):
+            return np.array([], dtype=np.int64), np.zeros((0, 0), dtype=bool)
+
+        index = self._lifetimes_index
+        if index is None or index[0] is not lifetimes:
+            by_start = np.argsort(lifetimes.start, kind='mergesort')
+            index = self._lifetimes_index = (
+                lifetimes,
+                by_start,
+                lifetimes.start[by_start],
+            )
+        _, by_start, sorted_starts = index
+
+        # Assets that started after our last date, or on it if we're not
+        # including start dates, can't have existed on any of our dates.
+        candidates = by_start[:sorted_starts.searchsorted(
+            raw_dates.max(),
+            side='right' if include_start_date else 'left',
+        )]
+        candidates = candidates[lifetimes.end[candidates] >= raw_dates.min()]
+        candidates = candidates[
+            np.argsort(lifetimes.sid[candidates], kind='mergesort')
+        ]
+
+        mask = _lifetimes_mask(
+            lifetimes[candidates],
+            raw_dates,
+            include_start_date,
+        )
+        alive = mask.any(axis=0)
+        return lifetimes.sid[candidates][alive], mask[:, alive]
+
 
 class AssetConvertible(with_metaclass(ABCMeta)):
     """
@@ -908,6 +994,20 @@ class NotAssetConvertible(ValueError):
     pass
 
 
+def _lifetimes_mask(lifetimes, raw_dates, include_start_date):
+    """
+    Compute a mask of shape ``(len(raw_dates), len(lifetimes))`` which is True
+    where an asset in `lifetimes` existed on a date in `raw_dates`.
+    """
+    raw_dates = raw_dates[:, None]
+    if include_start_date:
+        mask = lifetimes.start <= raw_dates
+    else:
+        mask = lifetimes.start < raw_dates
+    mask &= (raw_dates <= lifetimes.end)
+    return mask
+
+
 class AssetFinderCachedEquities(AssetFinder):
     """
     An extension to AssetFinder that loads all equities from equities table
@@ -1001,6 +1101,409 @@ class AssetFinderCachedEquities(AssetFinder):
         return candidates
 
 
+class AssetFinderPreloaded(AssetFinder):
+    """
+    An extension to AssetFinder that reads the equities, futures contracts
+    and asset router tables into memory when it is created, and serves
+    `retrieve_all`, `lookup_symbol`, `lookup_generic` and `lifetimes` from
+    those copies without querying the database.
+
+    Each table is held as an AssetTable sorted by sid, with dates stored as
+    int64 nanoseconds and text stored as integer codes.  Equities are also
+    indexed by the codes of their fuzzy symbol and of their (company_symbol,
+    share_class_symbol) pair.  Asset objects are only built when they are
+    first requested.
+
+    Assets written to the database after the finder is created aren't
+    visible until `_reset_caches` is called.
+    """
+
+    def __init__(self, engine):
+        super(AssetFinderPreloaded, self).__init__(engine)
+        self._preload(self._read_asset_tables())
+
+    def _reset_caches(self):
+        super(AssetFinderPreloaded, self)._reset_caches()
+        self._asset_lifetimes = None
+        self._preload(self._read_asset_tables())
+
+    def _read_asset_tables(self):
+        """
+        Read the asset tables from our database.
+
+        Returns
+        -------
+        tables : dict[str -> AssetTable]
+            Map from table name to the output of `read_asset_table`.
+        """
+        return {
+            table_name: read_asset_table(getattr(self, table_name))
+            for table_name in snapshot_table_names
+        }
+
+    def _preload(self, tables):
+        """
+        Store the output of `_read_asset_tables` and build our symbol indexes.
+        """
+        self._router = router = tables['asset_router']
+        self._router_sids = router['sid']
+
+        self._equities_table = equities = tables['equities']
+        self._futures_table = tables['futures_contracts']
+
+        # Candidates for a symbol are ordered by descending start date, with
+        # descending end date as a tie-breaker, as in our SQL queries.
+        order_by = (-equities['end_date'], -equities['start_date'])
+        self._fuzzy_index = _SymbolIndex(
+            equities.codes('fuzzy_symbol'),
+            order_by,
+        )
+        # Rows are keyed on a combination of the codes of their company and
+        # share class symbols.  Missing symbols have code -1, so that they
+        # match lookups for None, as in SQL.
+        self._num_share_classes = equities.num_codes('share_class_symbol')
+        self._split_index = _SymbolIndex(
+            (equities.codes('company_symbol').astype(np.int64) + 1) *
+            (self._num_share_classes + 1) +
+            equities.codes('share_class_symbol') + 1,
+            order_by,
+        )
+
+    def _split_key(self, company_symbol, share_class_symbol):
+        """
+        The key of (`company_symbol`, `share_class_symbol`) in our split
+        index, or None if no equity has those symbols.
+        """
+        equities = self._equities_table
+        company = equities.code('company_symbol', company_symbol)
+        share_class = equities.code('share_class_symbol', share_class_symbol)
+        if company is None or share_class is None:
+            return None
+        return (company + 1) * (self._num_share_classes + 1) + share_class + 1
+
+    @property
+    def sids(self):
+        return tuple(self._router_sids.tolist())
+
+    def _future_chain_dates(self, root_symbol):
+        futures = self._futures_table
+        code = futures.code('root_symbol', root_symbol)
+        if code is None:
+            rows = np.array([], dtype=np.int64)
+        else:
+            rows = np.flatnonzero(futures.codes('root_symbol') == code)
+        return (
+            futures['sid'][rows],
+            futures['notice_date'][rows],
+            futures['expiration_date'][rows],
+        )
+
+    def lookup_asset_types(self, sids):
+        """
+        Retrieve asset types for a list of sids.
+
+        Parameters
+        ----------
+        sids : list[int]
+
+        Returns
+        -------
+        types : dict[sid -> str or None]
+            Asset types for the provided sids.
+        """
+        sids = list(sids)
+        rows, found = _find_sids(self._router_sids, sids)
+        router = self._router
+        return {
+            sid: router.string('asset_type', row) if ok else None
+            for sid, row, ok in zip(sids, rows, found)
+        }
+
+    def _retrieve_assets(self, sids, asset_tbl, asset_type):
+        """
+        Build the assets in `sids` from our copy of `asset_tbl`.
+
+        This, rather than AssetFinder._retrieve_assets, is the only method
+        of `AssetFinderPreloaded` that writes Assets into self._asset_cache.
+        """
+        # Fastpath for empty request.
+        if not sids:
+            return {}
+
+        if asset_type is Equity:
+            table = self._equities_table
+        else:
+            table = self._futures_table
+
+        cache = self._asset_cache
+        hits = {}
+        misses = []
+        sids = list(sids)
+        rows, found = _find_sids(table['sid'], sids)
+        for sid, row, ok in zip(sids, rows, found):
+            if not ok:
+                misses.append(sid)
+                continue
+            try:
+                asset = cache[sid]
+            except KeyError:
+                asset = cache[sid] = _build_asset(asset_type, table.row(row))
+            hits[sid] = asset
+
+        if misses:
+            if asset_type == Equity:
+                raise EquitiesNotFound(sids=tuple(set(misses)))
+            else:
+                raise FutureContractsNotFound(sids=tuple(set(misses)))
+        return hits
+
+    def _active_candidates(self, rows, ad_value):
+        equities = self._equities_table
+        active = (
+            (equities['start_date'][rows] <= ad_value) &
+            (ad_value <= equities['end_date'][rows])
+        )
+        return equities['sid'][rows[active]].tolist()
+
+    def _fuzzy_rows(self, fuzzy_symbol):
+        # Rows with no fuzzy symbol aren't indexed, so they never match.
+        return self._fuzzy_index.rows(
+            self._equities_table.code('fuzzy_symbol', fuzzy_symbol),
+        )
+
+    def _get_fuzzy_candidates(self, fuzzy_symbol):
+        rows = self._fuzzy_rows(fuzzy_symbol)
+        return self._equities_table['sid'][rows].tolist()
+
+    def _get_fuzzy_candidates_in_range(self, fuzzy_symbol, ad_value):
+        return self._active_candidates(
+            self._fuzzy_rows(fuzzy_symbol),
+            ad_value,
+        )
+
+    def _get_split_candidates(self, company_symbol, share_class_symbol):
+        rows = self._split_index.rows(
+            self._split_key(company_symbol, share_class_symbol),
+        )
+        return self._equities_table['sid'][rows].tolist()
+
+    def _get_split_candidates_in_range(self,
+                                       company_symbol,
+                                       share_class_symbol,
+                                       ad_value):
+        return self._active_candidates(
+            self._split_index.rows(
+                self._split_key(company_symbol, share_class_symbol),
+            ),
+            ad_value,
+        )
+
+    def _resolve_no_matching_candidates(self,
+                                        company_symbol,
+                                        share_class_symbol,
+                                        ad_value):
+        equities = self._equities_table
+        rows = self._split_index.rows(
+            self._split_key(company_symbol, share_class_symbol),
+        )
+        rows = rows[equities['start_date'][rows] <= ad_value]
+        rows = rows[np.argsort(-equities['end_date'][rows], kind='mergesort')]
+        return equities['sid'][rows].tolist()
+
+    def _get_best_candidate(self, candidates):
+        return self._retrieve_equity(candidates[0])
+
+    def _get_equities_from_candidates(self, candidates):
+        results = self.retrieve_equities(candidates)
+        return [results[sid] for sid in candidates]
+
+    def _compute_asset_lifetimes(self):
+        """
+        Compute a recarray of asset lifetimes from our copy of the equities.
+        """
+        equities = self._equities_table
+        start = equities['start_date'].copy()
+        end = equities['end_date'].copy()
+        start[start == _NAT] = 0  # convert missing starts to 0
+        end[end == _NAT] = np.iinfo(int).max  # convert missing end to INTMAX
+        lifetimes = np.recarray(
+            shape=(len(equities),),
+            dtype=[
+                ('sid', '<i8'),
+                ('start', '<i8'),
+                ('end', '<i8'),
+            ],
+        )
+        lifetimes.sid = equities['sid']
+        lifetimes.start = start
+        lifetimes.end = end
+        return lifetimes
+
+
+class AssetFinderSnapshot(AssetFinderPreloaded):
+    """
+    An AssetFinderPreloaded which reads its asset tables from a snapshot
+    written by `write_asset_db_snapshot`, e.g. by passing ``snapshot_path``
+    to ``AssetDBWriter.write_all``, instead of from the database.
+
+    Opening a snapshot doesn't touch the database at all.  The database's
+    tables are only reflected if a method without an in-memory
+    implementation, such as `lookup_future_chain`, is called.
+
+    Parameters
+    ----------
+    engine : str or SQLAlchemy.engine
+        An engine with a connection to the asset database from which the
+        snapshot was taken.
+    snapshot_path : str
+        Directory holding the snapshot.
+
+    Notes
+    -----
+    The snapshot is not checked against the database.  If the database is
+    rewritten, the snapshot must be rewritten too.  After `_reset_caches`,
+    which is called when assets are written to the database, the tables are
+    read from the database instead.
+    """
+
+    def __init__(self, engine, snapshot_path):
+        self.engine = engine
+        self.snapshot_path = snapshot_path
+        self._init_caches()
+        self._preload(read_asset_db_snapshot(snapshot_path))
+
+    def __getattr__(self, name):
+        # Reflect the database's tables the first time one is needed.
+        if name in asset_db_table_names:
+            self._reflect_tables()
+            return getattr(self, name)
+        raise AttributeError(
+            "%r object has no attribute %r" % (type(self).__name__, name)
+        )
+
+
+_NAT = pd.NaT.value
+
+
+def _find_sids(sorted_sids, sids):
+    """
+    Find the positions of `sids` in `sorted_sids`.
+
+    Returns
+    -------
+    rows : np.ndarray[int64]
+        The position of each sid in `sorted_sids`, or 0 if it's missing.
+    found : np.ndarray[bool]
+        Whether each sid was found.
+    """
+    sids = np.array(sids, dtype='i8', ndmin=1)
+    if not len(sorted_sids):
+        return np.zeros(len(sids), dtype='i8'), np.zeros(len(sids), bool)
+    rows = sorted_sids.searchsorted(sids)
+    rows[rows == len(sorted_sids)] = 0
+    return rows, sorted_sids[rows] == sids
+
+
+def _build_asset(asset_type, row):
+    """
+    Construct an Asset of type `asset_type` from a row of an AssetTable, as
+    returned by `AssetTable.row`.
+    """
+    kwargs = {}
+    for name, value in row.items():
+        if name in _asset_timestamp_fields:
+            value = None if value == _NAT else pd.Timestamp(value, tz='UTC')
+        elif name == 'sid':
+            value = int(value)
+        kwargs[name] = value
+    return asset_type(**kwargs)
+
+
+class _SymbolIndex(object):
+    """
+    A sorted index from integer symbol codes to the rows of a table.
+
+    Parameters
+    ----------
+    codes : np.ndarray[int]
+        The code of each row's symbol, or -1 if the row has no symbol.
+    order_by : tuple[np.ndarray]
+        Keys, least significant first as for ``np.lexsort``, by which to
+        order the rows sharing a code.
+    """
+    def __init__(self, codes, order_by):
+        rows = np.flatnonzero(codes >= 0)
+        codes = np.asarray(codes[rows], dtype=np.int64)
+        order = np.lexsort(tuple(key[rows] for key in order_by) + (codes,))
+        self._rows = rows[order]
+        self._codes, self._starts = np.unique(codes[order], return_index=True)
+        self._stops = np.append(self._starts[1:], len(rows))
+
+    def rows(self, code):
+        """
+        The rows whose code is `code`, in order.  No rows match a `code` of
+        None.
+        """
+        if code is None:
+            return self._rows[:0]
+        i = self._codes.searchsorted(code)
+        if i == len(self._codes) or self._codes[i] != code:
+            return self._rows[:0]
+        return self._rows[self._starts[i]:self._stops[i]]
+
+
+class _FutureChainTimeline(object):
+    """
+    The contracts of a root symbol, sorted by the date on which each one
+    leaves the root symbol's chain.
+
+    A contract leaves the chain on the earlier of its notice date and its
+    expiration date.  If only one of them is known, that one is used, and if
+    neither is known the contract is never in the chain.
+
+    Parameters
+    ----------
+    contracts : list[Future]
+        The contracts of the root symbol, ordered by sid.
+    notice_dates : np.ndarray[int64]
+        The notice date of each contract, with NaT for missing dates.
+    expiration_dates : np.ndarray[int64]
+        The expiration date of each contract, with NaT for missing dates.
+    """
+    def __init__(self, contracts, notice_dates, expiration_dates):
+        array = np.empty(len(contracts), dtype=object)
+        array[:] = contracts
+
+        # Sorts are stable so that ties are broken by sid.
+        self._all_contracts = array[
+            np.argsort(notice_dates, kind='mergesort')
+        ].tolist()
+
+        int64_max = np.iinfo(np.int64).max
+        roll_dates = np.minimum(
+            np.where(notice_dates == _NAT, int64_max, notice_dates),
+            np.where(expiration_dates == _NAT, int64_max, expiration_dates),
+        )
+        roll_dates[roll_dates == int64_max] = _NAT
+        order = np.argsort(roll_dates, kind='mergesort')
+        self._roll_dates = roll_dates[order]
+        self._contracts = array[order]
+
+    def all_contracts(self):
+        """
+        Every contract of the root symbol, ordered by notice date.
+        """
+        return list(self._all_contracts)
+
+    def as_of(self, as_of_date_value):
+        """
+        The chain as of `as_of_date_value`: the contracts which haven't left
+        the chain before that date, ordered by the date on which they do.
+        """
+        start = self._roll_dates.searchsorted(as_of_date_value, side='left')
+        return self._contracts[start:].tolist()
+
+
 def was_active(reference_date_value, asset):
     """
     Whether or not `asset` was active at the time corresponding to
@@ -39,38 +39,34 @@ ctypedef object Int64Index_t
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-cpdef _compute_row_slices(dict asset_starts_absolute,
-                          dict asset_ends_absolute,
-                          dict asset_starts_calendar,
+cpdef _compute_row_slices(intp_t[:] asset_starts_absolute,
+                          intp_t[:] asset_ends_absolute,
+                          intp_t[:] asset_starts_calendar,
                           intp_t query_start,
-                          intp_t query_end,
-                          Int64Index_t requested_assets):
+                          intp_t query_end):
     """
     Core indexing functionality for loading raw data from bcolz.
 
     Parameters
     ----------
-    asset_starts_absolute : dict
-        Dictionary containing the index of the first row of each asset in the
-        bcolz file from which we will query.
+    asset_starts_absolute : ndarray[intp]
+        The index of the first row of each requested asset in the bcolz file
+        from which we will query.
 
-    asset_ends_absolute : dict
-        Dictionary containing the index of the last row of each asset in the
-        bcolz file from which we will query.
+    asset_ends_absolute : ndarray[intp]
+        The index of the last row of each requested asset in the bcolz file
+        from which we will query.
 
-    asset_starts_calendar : dict
-        Dictionary containing the index of in our calendar corresponding to the
-        start date of each asset
+    asset_starts_calendar : ndarray[intp]
+        The index in our calendar corresponding to the start date of each
+        requested asset.
 
     query_start : intp
     query_end : intp
         Start and end indices in our calendar of the dates for which we're
         querying.
 
-    requested_assets : pandas.Int64Index
-        The assets for which we want to load data.
-
-    For each asset in requested assets, computes three values:
+    For each requested asset, computes three values:
     1.) The index in the raw bcolz data of first row to load.
     2.) The index in the raw bcolz data of the last row to load.
     3.) The index in the dates of our query corresponding to the first row for
@@ -82,7 +78,7 @@ cpdef _compute_row_slices(dict asset_starts_absolute,
     first_rows, last_rows, offsets : 3-tuple of ndarrays
     """
     cdef:
-        intp_t nassets = len(requested_assets)
+        intp_t nassets = len(asset_starts_absolute)
 
         # For each sid, we need to compute the following:
         ndarray[dtype=intp_t, ndim=1] first_row_a = zeros(nassets, dtype=intp)
@@ -91,16 +87,19 @@ cpdef _compute_row_slices(dict asset_starts_absolute,
 
         # Loop variables.
         intp_t i
-        intp_t asset
         intp_t asset_start_data
         intp_t asset_end_data
         intp_t asset_start_calendar
         intp_t asset_end_calendar
 
-    for i, asset in enumerate(requested_assets):
-        asset_start_data = asset_starts_absolute[asset]
-        asset_end_data = asset_ends_absolute[asset]
-        asset_start_calendar = asset_starts_calendar[asset]
+    if not (nassets == len(asset_ends_absolute) ==
+            len(asset_starts_calendar)):
+        raise ValueError("Incompatible index arrays.")
+
+    for i in range(nassets):
+        asset_start_data = asset_starts_absolute[i]
+        asset_end_data = asset_ends_absolute[i]
+        asset_start_calendar = asset_starts_calendar[i]
         asset_end_calendar = (
             asset_start_calendar + (asset_end_data - asset_start_data)
         )
@@ -31,10 +31,7 @@ from .paths import (
     data_root,
 )
 
-from zipline.utils.tradingcalendar import (
-    trading_day as trading_day_nyse,
-    trading_days as trading_days_nyse,
-)
+from zipline.utils import tradingcalendar
 
 logger = logbook.Logger('Loader')
 
@@ -96,8 +93,8 @@ def has_data_for_dates(series_or_df, first_date, last_date):
     return (first <= first_date) and (last >= last_date)
 
 
-def load_market_data(trading_day=trading_day_nyse,
-                     trading_days=trading_days_nyse,
+def load_market_data(trading_day=None,
+                     trading_days=None,
                      bm_symbol='^GSPC'):
     """
     Load benchmark returns and treasury yield curves for the given calendar and
@@ -137,6 +134,11 @@ def load_market_data(trading_day=trading_day_nyse,
     '1month', '3month', '6month',
     '1year','2year','3year','5year','7year','10year','20year','30year'
     """
+    if trading_day is None:
+        trading_day = tradingcalendar.trading_day
+    if trading_days is None:
+        trading_days = tradingcalendar.trading_days
+
     first_date = trading_days[0]
     now = pd.Timestamp.utcnow()
 
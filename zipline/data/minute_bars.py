@@ -27,6 +27,15 @@ DEFAULT_EXPECTEDLEN = US_EQUITIES_MINUTES_PER_DAY * 252 * 15
 
 OHLC_RATIO = 1000
 
+OHLCV = ('open', 'high', 'low', 'close', 'volume')
+
+NANOS_IN_MINUTE = 60 * 1000000000
+NANOS_IN_DAY = 24 * 60 * NANOS_IN_MINUTE
+
+# Little-endian, so that files written on one machine can be mapped on another.
+MMAP_MINUTE_DTYPE = np.dtype('<u4')
+MMAP_MINUTE_FORMAT_VERSION = 1
+
 
 class BcolzMinuteOverlappingData(Exception):
     pass
@@ -614,6 +623,75 @@ class BcolzMinuteBarReader(object):
         """
         return self._minute_index.get_loc(minute_dt)
 
+    def load_raw_window(self, fields, start_dt, end_dt, sids, out=None,
+                        pool=None):
+        """
+        Read a window of minute data for many fields and sids at once.
+
+        Each (sid, field) slice is decompressed exactly once, straight into
+        a single output buffer, and the zero -> NaN and ohlc_ratio scaling
+        are applied to every sid of a field in one vectorized pass.
+
+        Parameters
+        ----------
+        fields : list of str
+           'open', 'high', 'low', 'close', or 'volume'
+        start_dt: Timestamp
+           Beginning of the window range.
+        end_dt: Timestamp
+           End of the window range.
+        sids : list of int
+           The asset identifiers in the window.
+        out : np.ndarray[float64], optional
+           A preallocated buffer of shape (fields, sids, minutes in range)
+           into which to write the result. If not supplied, a new array is
+           allocated.
+        pool : object, optional
+           An object with a ``map`` method, e.g. a
+           ``multiprocessing.pool.ThreadPool``, used to read sids
+           concurrently. blosc releases the GIL while decompressing, so a
+           thread pool allows reads to proceed in parallel. If not supplied,
+           sids are read serially.
+
+        Returns
+        -------
+        out : np.ndarray[float64]
+            Array of shape (fields, sids, minutes in range). Prices with no
+            trade are NaN; volumes with no trade are 0.
+        """
+        start_idx = self._find_position_of_minute(start_dt)
+        end_idx = self._find_position_of_minute(end_dt)
+
+        shape = (len(fields), len(sids), end_idx - start_idx + 1)
+        if out is None:
+            out = np.empty(shape, dtype=np.float64)
+        elif out.shape != shape:
+            raise ValueError(
+                "Expected output buffer of shape {0}, got {1}.".format(
+                    shape, out.shape,
+                )
+            )
+
+        def read_sid(j):
+            sid = sids[j]
+            for i, field in enumerate(fields):
+                carray = self._open_minute_file(field, sid)
+                out[i, j] = carray[start_idx:end_idx + 1]
+
+        if pool is None:
+            for j in range(len(sids)):
+                read_sid(j)
+        else:
+            pool.map(read_sid, range(len(sids)))
+
+        for i, field in enumerate(fields):
+            if field != 'volume':
+                values = out[i]
+                values[values == 0] = np.nan
+                values *= self._ohlc_inverse
+
+        return out
+
     def unadjusted_window(self, fields, start_dt, end_dt, sids):
         """
         Parameters
@@ -633,27 +711,612 @@ class BcolzMinuteBarReader(object):
             A list with an entry per field of ndarrays with shape
             (sids, minutes in range) with a dtype of float64, containing the
             values for the respective field over start and end dt range.
+
+        See Also
+        --------
+        BcolzMinuteBarReader.load_raw_window
         """
         # TODO: Handle early closes.
-        start_idx = self._find_position_of_minute(start_dt)
-        end_idx = self._find_position_of_minute(end_dt)
+        window = self.load_raw_window(fields, start_dt, end_dt, sids)
+        return [
+            window[i] if field != 'volume' else window[i].astype(np.uint32)
+            for i, field in enumerate(fields)
+        ]
+
+
+class MinutePositionIndex(object):
+    """
+    Arithmetic mapping from a trading minute to its position in a minute bar
+    file laid out as ``minutes_per_day`` slots per session.
+
+    The position of a minute is ``session offset * minutes_per_day + minutes
+    since that session's open``. The session offset is found with a single
+    array lookup keyed on the minute's UTC day, so no pandas index lookups
+    are needed. This relies on every session's minutes falling on the same
+    UTC day as its market open, which holds for US equities.
+
+    Parameters
+    ----------
+    market_opens : np.ndarray[int64]
+        The market open of each session, as nanoseconds since the epoch.
+    minutes_per_day : int
+        The number of minute slots allotted to each session.
+    """
+    def __init__(self, market_opens, minutes_per_day):
+        self.market_opens = market_opens = np.asarray(market_opens, 'i8')
+        self.minutes_per_day = minutes_per_day
+
+        epoch_days = market_opens // NANOS_IN_DAY
+        self._first_epoch_day = first_epoch_day = epoch_days[0]
+        # Session offset for each UTC day spanned by the sessions, or -1 for
+        # days without a session.
+        self._session_offsets = np.full(
+            epoch_days[-1] - first_epoch_day + 1, -1, dtype='i8',
+        )
+        self._session_offsets[epoch_days - first_epoch_day] = np.arange(
+            len(market_opens),
+        )
+
+    def position(self, dt):
+        """
+        Parameters
+        ----------
+        dt : int
+            A trading minute, as nanoseconds since the epoch.
+
+        Returns
+        -------
+        out : int
+            The position of ``dt`` in a minute bar file.
+
+        Raises
+        ------
+        KeyError
+            If ``dt`` is not a minute of any session.
+        """
+        day = dt // NANOS_IN_DAY - self._first_epoch_day
+        if 0 <= day < len(self._session_offsets):
+            session = self._session_offsets[day]
+            if session >= 0:
+                minute = (dt - self.market_opens[session]) // NANOS_IN_MINUTE
+                if 0 <= minute < self.minutes_per_day:
+                    return session * self.minutes_per_day + minute
+        raise KeyError(dt)
+
+    def positions(self, dts):
+        """
+        Vectorized version of ``position``.
+
+        Parameters
+        ----------
+        dts : np.ndarray[int64]
+            Trading minutes, as nanoseconds since the epoch.
+
+        Returns
+        -------
+        out : np.ndarray[int64]
+            The position of each minute in a minute bar file.
+
+        Raises
+        ------
+        KeyError
+            If any of ``dts`` is not a minute of any session.
+        """
+        dts = np.asarray(dts, dtype='i8')
+        days = dts // NANOS_IN_DAY - self._first_epoch_day
+        in_range = (days >= 0) & (days < len(self._session_offsets))
+        sessions = np.where(
+            in_range,
+            self._session_offsets[np.where(in_range, days, 0)],
+            -1,
+        )
+        minutes = (dts - self.market_opens[sessions]) // NANOS_IN_MINUTE
+        valid = (
+            (sessions >= 0) & (minutes >= 0) &
+            (minutes < self.minutes_per_day)
+        )
+        if not valid.all():
+            raise KeyError(dts[~valid][0])
+        return sessions * self.minutes_per_day + minutes
+
+
+class MmapMinuteBarMetadata(object):
+
+    METADATA_FILENAME = 'metadata.json'
+
+    @classmethod
+    def metadata_path(cls, rootdir):
+        return os.path.join(rootdir, cls.METADATA_FILENAME)
+
+    @classmethod
+    def read(cls, rootdir):
+        path = cls.metadata_path(rootdir)
+        with open(path) as fp:
+            raw_data = json.load(fp)
+            version = raw_data['version']
+            if version != MMAP_MINUTE_FORMAT_VERSION:
+                raise ValueError(
+                    "Unsupported minute bar format version {0} in {1}; "
+                    "expected {2}.".format(
+                        version, path, MMAP_MINUTE_FORMAT_VERSION,
+                    )
+                )
+            first_trading_day = pd.Timestamp(
+                raw_data['first_trading_day'], tz='UTC')
+            market_opens = np.array(raw_data['market_opens'], dtype='i8')
+            return cls(
+                first_trading_day,
+                market_opens,
+                raw_data['minutes_per_day'],
+                raw_data['ohlc_ratio'],
+            )
+
+    def __init__(self,
+                 first_trading_day,
+                 market_opens,
+                 minutes_per_day,
+                 ohlc_ratio):
+        """
+        Parameters:
+        -----------
+        first_trading_day : datetime-like
+            UTC midnight of the first day available in the dataset.
+        market_opens : np.ndarray[int64]
+            The market open of each session in the dataset, as nanoseconds
+            since the epoch.
+        minutes_per_day : int
+            The number of minute slots allotted to each session.
+        ohlc_ratio : int
+             The factor by which the pricing data is multiplied so that the
+             float data can be stored as an integer.
+        """
+        self.first_trading_day = first_trading_day
+        self.market_opens = market_opens
+        self.minutes_per_day = minutes_per_day
+        self.ohlc_ratio = ohlc_ratio
+
+    def write(self, rootdir):
+        """
+        Write the metadata to a JSON file in the rootdir.
+
+        Values contained in the metadata are:
+        version : int
+            The version of the on-disk format.
+        first_trading_day : string
+            'YYYY-MM-DD' formatted representation of the first trading day
+             available in the dataset.
+        market_opens : list of integers
+             nanosecond integer representation of each session's market
+             open.
+        minutes_per_day : int
+             The number of minute slots allotted to each session.
+        ohlc_ratio : int
+             The factor by which the pricing data is multiplied so that the
+             float data can be stored as an integer.
+        """
+        metadata = {
+            'version': MMAP_MINUTE_FORMAT_VERSION,
+            'first_trading_day': str(self.first_trading_day.date()),
+            'market_opens': self.market_opens.tolist(),
+            'minutes_per_day': self.minutes_per_day,
+            'ohlc_ratio': self.ohlc_ratio,
+        }
+        with open(self.metadata_path(rootdir), 'w+') as fp:
+            json.dump(metadata, fp)
+
+
+def _mmap_sid_path(rootdir, sid):
+    """
+    Path of the raw minute bar file for ``sid``.
+
+    e.g. 1 is formatted as <rootdir>/00/00/000001.u4
+    """
+    padded_sid = format(sid, '06')
+    return os.path.join(
+        rootdir,
+        padded_sid[0:2],
+        padded_sid[2:4],
+        "{0}.u4".format(padded_sid),
+    )
+
+
+class MmapMinuteBarWriter(object):
+    """
+    Class capable of writing minute OHLCV data to disk as raw, uncompressed
+    arrays suitable for memory-mapping.
+
+    Each sid's data is stored in a single file of little-endian uint32
+    values with shape (minutes, 5), where the columns are
+    (open, high, low, close, volume). As with ``BcolzMinuteBarWriter``, OHLC
+    values are multiplied by ``ohlc_ratio``, each session is allotted
+    ``minutes_per_day`` rows starting at its market open, and sessions
+    before an asset starts trading are filled with zeros.
+
+    Because the layout is fixed, the position of any minute can be computed
+    arithmetically with a ``MinutePositionIndex``; see
+    ``MmapMinuteBarReader``.
+
+    Parameters:
+    -----------
+    first_trading_day : datetime-like
+        The first trading day in the data set.
+    rootdir : string
+        Path to the root directory into which to write the metadata and sid
+        files.
+    market_opens : pd.Series
+        The market opens used as a starting point for each periodic span of
+        minutes in the index, indexed by the UTC midnight of each trading
+        day.
+    minutes_per_day : int
+        The number of minutes per each period.
+    ohlc_ratio : int
+        The ratio by which to multiply the pricing data to convert the
+        floats from floats to an integer to fit within the np.uint32.
+    """
+    def __init__(self,
+                 first_trading_day,
+                 rootdir,
+                 market_opens,
+                 minutes_per_day,
+                 ohlc_ratio=OHLC_RATIO):
+        self._rootdir = rootdir
+        self._first_trading_day = first_trading_day
+        self._market_opens = market_opens[
+            market_opens.index.slice_indexer(start=first_trading_day)]
+        self._trading_days = self._market_opens.index
+        self._minutes_per_day = minutes_per_day
+        self._ohlc_ratio = ohlc_ratio
+
+        market_open_nanos = self._market_opens.values.astype(
+            'datetime64[ns]',
+        ).view('i8')
+        self._position_index = MinutePositionIndex(
+            market_open_nanos, minutes_per_day,
+        )
+
+        metadata = MmapMinuteBarMetadata(
+            self._first_trading_day,
+            market_open_nanos,
+            self._minutes_per_day,
+            self._ohlc_ratio,
+        )
+        metadata.write(self._rootdir)
+
+    @property
+    def first_trading_day(self):
+        return self._first_trading_day
+
+    def sidpath(self, sid):
+        """
+        Parameters:
+        -----------
+        sid : int
+            Asset identifier.
+
+        Returns:
+        --------
+        out : string
+            Full path to the minute bar file for the given sid.
+        """
+        return _mmap_sid_path(self._rootdir, sid)
+
+    def _days_in_output(self, sid):
+        path = self.sidpath(sid)
+        if not os.path.exists(path):
+            return 0
+        row_nbytes = len(OHLCV) * MMAP_MINUTE_DTYPE.itemsize
+        return os.path.getsize(path) // (row_nbytes * self._minutes_per_day)
+
+    def last_date_in_output_for_sid(self, sid):
+        """
+        Parameters:
+        -----------
+        sid : int
+            Asset identifier.
+
+        Returns:
+        --------
+        out : pd.Timestamp
+            The midnight of the last date written in to the output for the
+            given sid.
+        """
+        num_days = self._days_in_output(sid)
+        if num_days == 0:
+            return pd.NaT
+        return self._trading_days[num_days - 1]
+
+    def _append(self, sid, rows):
+        path = self.sidpath(sid)
+        sid_containing_dirname = os.path.dirname(path)
+        if not os.path.exists(sid_containing_dirname):
+            # Other sids may have already created the containing directory.
+            os.makedirs(sid_containing_dirname)
+        with open(path, 'ab') as f:
+            f.write(rows.astype(MMAP_MINUTE_DTYPE).tobytes())
+
+    def pad(self, sid, date):
+        """
+        Fill sid container with empty data through the specified date.
+
+        Parameters:
+        -----------
+        sid : int
+            The asset identifier for the data being written.
+        date : datetime-like
+            The date used to calculate how many slots to be pad.
+            The padding is done through the date, i.e. after the padding is
+            done the `last_date_in_output_for_sid` will be equal to `date`
+        """
+        num_days = self._trading_days.searchsorted(date, side='right')
+        days_to_zerofill = num_days - self._days_in_output(sid)
+        if days_to_zerofill <= 0:
+            # No need to pad.
+            return
+        self._append(sid, np.zeros(
+            (days_to_zerofill * self._minutes_per_day, len(OHLCV)),
+            dtype=MMAP_MINUTE_DTYPE,
+        ))
+
+    def write(self, sid, df):
+        """
+        Write the OHLCV data for the given sid.
+
+        Parameters:
+        -----------
+        sid : int
+            The asset identifer for the data being written.
+        df : pd.DataFrame
+            DataFrame of market data with the following characteristics.
+            columns : ('open', 'high', 'low', 'close', 'volume')
+                open : float64
+                high : float64
+                low  : float64
+                close : float64
+                volume : float64|int64
+            index : DatetimeIndex of market minutes.
+        """
+        cols = {field: df[field].values for field in OHLCV}
+        self.write_cols(sid, df.index.values, cols)
+
+    def write_cols(self, sid, dts, cols):
+        """
+        Write the OHLCV data for the given sid.
 
-        results = []
+        Sessions between the last session already written and the first
+        session of ``dts`` are filled with zeros, as are any minutes of the
+        written sessions not present in ``dts``.
 
-        shape = (len(sids), (end_idx - start_idx + 1))
+        Parameters:
+        -----------
+        sid : int
+            The asset identifer for the data being written.
+        dts : datetime64 array
+            The dts corresponding to values in cols.
+        cols : dict of str -> np.array
+            dict of market data with the following characteristics.
+            keys are ('open', 'high', 'low', 'close', 'volume')
+                open : float64
+                high : float64
+                low  : float64
+                close : float64
+                volume : float64|int64
+        """
+        minutes_per_day = self._minutes_per_day
+        positions = self._position_index.positions(
+            np.asarray(dts).astype('datetime64[ns]').view('i8'),
+        )
 
-        for field in fields:
+        num_days = self._days_in_output(sid)
+        first_day = positions[0] // minutes_per_day
+        if num_days > first_day:
+            raise BcolzMinuteOverlappingData(dedent("""
+            Data with last_date={0} already includes input start={1} for
+            sid={2}""".strip()).format(
+                self._trading_days[num_days - 1],
+                self._trading_days[first_day],
+                sid,
+            ))
+
+        # Write from the end of the existing data through the end of the
+        # last input session, so that any padding happens in the same write.
+        start = num_days * minutes_per_day
+        end = (positions[-1] // minutes_per_day + 1) * minutes_per_day
+        rows = np.zeros((end - start, len(OHLCV)), dtype=MMAP_MINUTE_DTYPE)
+        offsets = positions - start
+
+        ohlc_ratio = self._ohlc_ratio
+        for i, field in enumerate(OHLCV):
             if field != 'volume':
-                out = np.full(shape, np.nan)
+                values = np.nan_to_num(cols[field] * ohlc_ratio)
             else:
-                out = np.zeros(shape, dtype=np.uint32)
+                values = cols[field]
+            rows[offsets, i] = values.astype(np.uint32)
 
-            for i, sid in enumerate(sids):
-                carray = self._open_minute_file(field, sid)
-                values = carray[start_idx:end_idx + 1]
-                where = values != 0
-                out[i, where] = values[where]
+        self._append(sid, rows)
+
+
+class MmapMinuteBarReader(object):
+    """
+    Reader for data written by MmapMinuteBarWriter.
+
+    Each sid's file is memory-mapped on first access, and minutes are
+    located with a ``MinutePositionIndex``, so ``get_value`` is a pointer
+    offset with no decompression and no pandas index lookup.
+
+    Note that each mapped sid holds an open file descriptor for the lifetime
+    of the reader.
+
+    Parameters:
+    -----------
+    rootdir : string
+        The root directory containing the metadata and sid files.
+    """
+    def __init__(self, rootdir):
+        self._rootdir = rootdir
+
+        metadata = MmapMinuteBarMetadata.read(rootdir)
+
+        self._first_trading_day = metadata.first_trading_day
+        self._position_index = MinutePositionIndex(
+            metadata.market_opens, metadata.minutes_per_day,
+        )
+        self._ohlc_inverse = 1.0 / metadata.ohlc_ratio
+        self._field_ixs = {field: i for i, field in enumerate(OHLCV)}
+        self._arrays = {}
+
+    def _open_minute_file(self, sid):
+        sid = int(sid)
+
+        try:
+            return self._arrays[sid]
+        except KeyError:
+            pass
+
+        path = _mmap_sid_path(self._rootdir, sid)
+        if os.path.getsize(path) == 0:
+            # mmap can't map empty files.
+            array = np.empty((0, len(OHLCV)), dtype=MMAP_MINUTE_DTYPE)
+        else:
+            array = np.memmap(
+                path, dtype=MMAP_MINUTE_DTYPE, mode='r',
+            ).reshape(-1, len(OHLCV))
+        self._arrays[sid] = array
+        return array
+
+    def _find_position_of_minute(self, minute_dt):
+        """
+        Return the position of the given minute in the list of every trading
+        minute since market open of the first trading day.
+
+        Parameters
+        ----------
+        minute_dt: pd.Timestamp
+            The minute whose position should be calculated.
+
+        Returns
+        -------
+        out : int
+        """
+        return self._position_index.position(minute_dt.value)
+
+    def get_value(self, sid, dt, field):
+        """
+        Retrieve the pricing info for the given sid, dt, and field.
+
+        Parameters:
+        -----------
+        sid : int
+            Asset identifier.
+        dt : pd.Timestamp
+            The datetime at which the trade occurred.
+        field : string
+            The type of pricing data to retrieve.
+            ('open', 'high', 'low', 'close', 'volume')
+
+        Returns:
+        --------
+        out : float|int
+
+        The market data for the given sid, dt, and field coordinates.
+
+        For OHLC:
+            Returns a float if a trade occurred at the given dt.
+            If no trade occurred, a np.nan is returned.
+
+        For volume:
+            Returns the integer value of the volume.
+            (A volume of 0 signifies no trades for the given dt.)
+        """
+        minute_pos = self._find_position_of_minute(dt)
+        array = self._open_minute_file(sid)
+        if minute_pos >= len(array):
+            value = 0
+        else:
+            value = array[minute_pos, self._field_ixs[field]]
+        if value == 0:
             if field != 'volume':
-                out *= self._ohlc_inverse
-            results.append(out)
-        return results
+                return np.nan
+            else:
+                return 0
+        if field != 'volume':
+            value *= self._ohlc_inverse
+        return value
+
+    def load_raw_window(self, fields, start_dt, end_dt, sids, out=None):
+        """
+        Read a window of minute data for many fields and sids at once.
+
+        Parameters
+        ----------
+        fields : list of str
+           'open', 'high', 'low', 'close', or 'volume'
+        start_dt: Timestamp
+           Beginning of the window range.
+        end_dt: Timestamp
+           End of the window range.
+        sids : list of int
+           The asset identifiers in the window.
+        out : np.ndarray[float64], optional
+           A preallocated buffer of shape (fields, sids, minutes in range)
+           into which to write the result.
+
+        Returns
+        -------
+        out : np.ndarray[float64]
+            Array of shape (fields, sids, minutes in range). Prices with no
+            trade are NaN; volumes with no trade are 0.
+        """
+        start_idx = self._find_position_of_minute(start_dt)
+        end_idx = self._find_position_of_minute(end_dt)
+
+        shape = (len(fields), len(sids), end_idx - start_idx + 1)
+        if out is None:
+            out = np.empty(shape, dtype=np.float64)
+        elif out.shape != shape:
+            raise ValueError(
+                "Expected output buffer of shape {0}, got {1}.".format(
+                    shape, out.shape,
+                )
+            )
+
+        field_ixs = [self._field_ixs[field] for field in fields]
+        for j, sid in enumerate(sids):
+            values = self._open_minute_file(sid)[start_idx:end_idx + 1]
+            count = len(values)
+            out[:, j, :count] = values[:, field_ixs].T
+            # Minutes after the last written session have no data.
+            out[:, j, count:] = 0
+
+        for i, field in enumerate(fields):
+            if field != 'volume':
+                values = out[i]
+                values[values == 0] = np.nan
+                values *= self._ohlc_inverse
+
+        return out
+
+    def unadjusted_window(self, fields, start_dt, end_dt, sids):
+        """
+        Parameters
+        ----------
+        fields : list of str
+           'open', 'high', 'low', 'close', or 'volume'
+        start_dt: Timestamp
+           Beginning of the window range.
+        end_dt: Timestamp
+           End of the window range.
+        sids : list of int
+           The asset identifiers in the window.
+
+        Returns
+        -------
+        list of np.ndarray
+            A list with an entry per field of ndarrays with shape
+            (sids, minutes in range) with a dtype of float64, containing the
+            values for the respective field over start and end dt range.
+        """
+        window = self.load_raw_window(fields, start_dt, end_dt, sids)
+        return [
+            window[i] if field != 'volume' else window[i].astype(np.uint32)
+            for i, field in enumerate(fields)
+        ]
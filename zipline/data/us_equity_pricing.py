@@ -27,8 +27,13 @@ from bcolz import (
 )
 from click import progressbar
 from numpy import (
+    add,
+    append,
+    arange,
     array,
+    asarray,
     int64,
+    intp,
     float64,
     floating,
     full,
@@ -36,9 +41,11 @@ from numpy import (
     integer,
     issubdtype,
     nan,
+    ones,
     uint32,
 )
 from pandas import (
+    concat,
     DataFrame,
     DatetimeIndex,
     read_csv,
@@ -104,6 +111,7 @@ SQLITE_STOCK_DIVIDEND_PAYOUT_COLUMN_DTYPES = {
     'payment_sid': integer,
     'ratio': float,
 }
+CUMULATIVE_ADJUSTMENT_COLUMNS = ['sid', 'loc', 'price', 'volume']
 UINT32_MAX = iinfo(uint32).max
 
 
@@ -370,24 +378,75 @@ class BcolzDailyBarReader(object):
 
         self._table = table
         self._calendar = DatetimeIndex(table.attrs['calendar'], tz='UTC')
-        self._first_rows = {
+
+        # The first_row, last_row and calendar_offset attributes are stored
+        # as parallel arrays aligned with the sorted array of sids, so that
+        # lookups for many sids at once can be vectorized.
+        first_rows = {
             int(asset_id): start_index
             for asset_id, start_index in iteritems(table.attrs['first_row'])
         }
-        self._last_rows = {
+        last_rows = {
             int(asset_id): end_index
             for asset_id, end_index in iteritems(table.attrs['last_row'])
         }
-        self._calendar_offsets = {
+        calendar_offsets = {
             int(id_): offset
             for id_, offset in iteritems(table.attrs['calendar_offset'])
         }
+        self._sids = sids = array(sorted(first_rows), dtype=int64)
+        self._first_rows = array([first_rows[s] for s in sids], dtype=intp)
+        self._last_rows = array([last_rows[s] for s in sids], dtype=intp)
+        self._calendar_offsets = array(
+            [calendar_offsets[s] for s in sids],
+            dtype=intp,
+        )
         # Cache of fully read np.array for the carrays in the daily bar table.
         # raw_array does not use the same cache, but it could.
         # Need to test keeping the entire array in memory for the course of a
         # process first.
         self._spot_cols = {}
 
+    def _sid_indices(self, sids):
+        """
+        Compute the positions of ``sids`` in the reader's sid-aligned
+        first_row, last_row and calendar_offset arrays.
+
+        Parameters
+        ----------
+        sids : iterable[int]
+            The asset identifiers to look up.
+
+        Returns
+        -------
+        indices : np.array[intp]
+
+        Raises
+        ------
+        KeyError
+            If any of ``sids`` is not in the table.
+        """
+        sids = asarray(sids, dtype=int64)
+        if not len(self._sids):
+            if len(sids):
+                raise KeyError(sids[0])
+            return sids.astype(intp)
+        indices = self._sids.searchsorted(sids)
+        # Clip so that sids past the end compare against a real entry.
+        found = self._sids.take(indices, mode='clip') == sids
+        if not found.all():
+            raise KeyError(sids[~found][0])
+        return indices
+
+    def _sid_index(self, sid):
+        """
+        Scalar version of ``_sid_indices``.
+        """
+        i = self._sids.searchsorted(sid)
+        if i == len(self._sids) or self._sids[i] != sid:
+            raise KeyError(sid)
+        return i
+
     def _compute_slices(self, start_idx, end_idx, assets):
         """
         Compute the raw row indices to load for each asset on a query for the
@@ -419,15 +478,15 @@ class BcolzDailyBarReader(object):
             of a query.  Otherwise, offset[i] will be equal to the number of
             entries in `dates` for which the asset did not yet exist.
         """
+        indices = self._sid_indices(assets)
         # The core implementation of the logic here is implemented in Cython
         # for efficiency.
         return _compute_row_slices(
-            self._first_rows,
-            self._last_rows,
-            self._calendar_offsets,
+            self._first_rows.take(indices),
+            self._last_rows.take(indices),
+            self._calendar_offsets.take(indices),
             start_idx,
             end_idx,
-            assets,
         )
 
     def load_raw_arrays(self, columns, start_date, end_date, assets):
@@ -487,18 +546,46 @@ class BcolzDailyBarReader(object):
             or after the date range of the equity.
         """
         day_loc = self._calendar.get_loc(day)
-        offset = day_loc - self._calendar_offsets[sid]
+        i = self._sid_index(sid)
+        offset = day_loc - self._calendar_offsets[i]
         if offset < 0:
             raise NoDataOnDate(
                 "No data on or before day={0} for sid={1}".format(
                     day, sid))
-        ix = self._first_rows[sid] + offset
-        if ix > self._last_rows[sid]:
+        ix = self._first_rows[i] + offset
+        if ix > self._last_rows[i]:
             raise NoDataOnDate(
                 "No data on or after day={0} for sid={1}".format(
                     day, sid))
         return ix
 
+    def sid_day_indices(self, sids, day):
+        """
+        Vectorized version of ``sid_day_index``.
+
+        Parameters
+        ----------
+        sids : iterable[int]
+            The asset identifiers.
+        day : datetime64-like
+            Midnight of the day for which data is requested.
+
+        Returns
+        -------
+        indices : np.array[intp]
+            Index into the data tape for each of ``sids`` on ``day``.
+            Entries for sids with no data on ``day`` are undefined.
+        has_data : np.array[bool]
+            Whether each of ``sids`` has data on ``day``, i.e. whether
+            ``sid_day_index`` would not raise NoDataOnDate.
+        """
+        day_loc = self._calendar.get_loc(day)
+        sid_ixs = self._sid_indices(sids)
+        offsets = day_loc - self._calendar_offsets.take(sid_ixs)
+        indices = self._first_rows.take(sid_ixs) + offsets
+        has_data = (offsets >= 0) & (indices <= self._last_rows.take(sid_ixs))
+        return indices, has_data
+
     def spot_price(self, sid, day, colname):
         """
         Parameters
@@ -528,6 +615,41 @@ class BcolzDailyBarReader(object):
         else:
             return price
 
+    def spot_prices(self, sids, day, columns):
+        """
+        Vectorized version of ``spot_price`` for many sids and columns.
+
+        Parameters
+        ----------
+        sids : iterable[int]
+            The asset identifiers.
+        day : datetime64-like
+            Midnight of the day for which data is requested.
+        columns : list[string]
+            The price fields. e.g. ('open', 'high', 'low', 'close', 'volume')
+
+        Returns
+        -------
+        np.array[float64]
+            Array of shape (len(columns), len(sids)) containing the spot
+            price of each column for each sid on the given day.
+            Entries are -1 if the day is within the sid's date range, but the
+            price is 0, and NaN if the day is before or after the sid's date
+            range (where ``spot_price`` would raise NoDataOnDate).
+        """
+        indices, has_data = self.sid_day_indices(sids, day)
+        indices = indices[has_data]
+
+        out = full((len(columns), len(has_data)), nan)
+        for i, colname in enumerate(columns):
+            raw = self._spot_col(colname).take(indices)
+            prices = raw.astype(float64)
+            if colname != 'volume':
+                prices *= 0.001
+            prices[raw == 0] = -1
+            out[i, has_data] = prices
+        return out
+
 
 class SQLiteAdjustmentWriter(object):
     """
@@ -895,6 +1017,30 @@ class SQLiteAdjustmentWriter(object):
             "ON stock_dividend_payouts(ex_date)"
         )
 
+    def write_cumulative_factors(self, rootdir):
+        """
+        Materialize the adjustments written by `write` as cumulative factors
+        to be read by BcolzCumulativeAdjustmentReader.
+
+        Parameters
+        ----------
+        rootdir : str
+            Path at which to write the factors.
+
+        Returns
+        -------
+        table : bcolz.ctable
+            The table of factors.
+
+        See Also
+        --------
+        BcolzCumulativeAdjustmentWriter
+        """
+        return BcolzCumulativeAdjustmentWriter(self._calendar).write(
+            rootdir,
+            self.conn,
+        )
+
     def close(self):
         self.conn.close()
 
@@ -922,3 +1068,218 @@ class SQLiteAdjustmentReader(object):
             dates,
             assets,
         )
+
+
+class BcolzCumulativeAdjustmentWriter(object):
+    """
+    Writer for cumulative adjustment factors to be read by
+    BcolzCumulativeAdjustmentReader.
+
+    The splits, mergers and dividends stored in a database written by
+    SQLiteAdjustmentWriter are combined into per-sid suffix products of their
+    ratios, keyed by the position in `calendar` of the first trading day on or
+    after each effective date.
+
+    Parameters
+    ----------
+    calendar : pd.DatetimeIndex
+        The trading days to which factors are aligned.
+
+    See Also
+    --------
+    SQLiteAdjustmentWriter.write_cumulative_factors
+    """
+    def __init__(self, calendar):
+        self._calendar = calendar
+
+    def _read_ratios(self, conn):
+        """
+        Read every adjustment from `conn` as a frame of sid, calendar
+        position, price ratio and volume ratio.
+        """
+        calendar_seconds = self._calendar.asi8 // 10 ** 9
+        frames = []
+        for tablename in sorted(SQLITE_ADJUSTMENT_TABLENAMES):
+            frame = DataFrame.from_records(
+                conn.execute(
+                    "SELECT sid, ratio, effective_date FROM %s" % tablename
+                ).fetchall(),
+                columns=['sid', 'ratio', 'effective_date'],
+            )
+            eff_dates = frame.effective_date.values.astype(int64)
+            locs = calendar_seconds.searchsorted(eff_dates)
+            ratios = frame.ratio.values.astype(float64)
+
+            # Adjustments outside the calendar can never be applied.
+            in_calendar = (
+                (eff_dates >= calendar_seconds[0]) &
+                (locs < len(calendar_seconds))
+            )
+            # A zero ratio can't be divided back out of a cumulative factor.
+            nonzero = ratios != 0.0
+            for record in frame[in_calendar & ~nonzero].to_dict('records'):
+                logger.warn(
+                    "Skipping zero ratio in %s: %s" % (tablename, record)
+                )
+            keep = in_calendar & nonzero
+            ratios = ratios[keep]
+
+            frames.append(DataFrame({
+                'sid': frame.sid.values[keep],
+                'loc': locs[keep],
+                'price': ratios,
+                # Splits affect volumes inversely, other adjustments not at
+                # all.
+                'volume': (
+                    1.0 / ratios if tablename == 'splits'
+                    else ones(len(ratios))
+                ),
+            }))
+
+        return concat(frames, ignore_index=True)
+
+    def write(self, rootdir, conn):
+        """
+        Write cumulative adjustment factors.
+
+        Parameters
+        ----------
+        rootdir : str
+            Path at which to write the factors.
+        conn : str or sqlite3.Connection
+            A database written by SQLiteAdjustmentWriter.
+
+        Returns
+        -------
+        table : bcolz.ctable
+            The table of factors.
+        """
+        if isinstance(conn, str):
+            conn = sqlite3.connect(conn)
+
+        cumulative = self._read_ratios(conn)
+        if len(cumulative):
+            # Combine adjustments falling on the same day, then accumulate
+            # the ratios of each sid from its last adjustment backwards.
+            per_day = cumulative.groupby(['sid', 'loc']).prod()
+            cumulative = per_day.iloc[::-1].groupby(level='sid').cumprod()
+            cumulative = cumulative.iloc[::-1].reset_index()
+
+        table = ctable(
+            columns=[
+                cumulative.sid.values.astype(uint32),
+                cumulative['loc'].values.astype(uint32),
+                cumulative.price.values.astype(float64),
+                cumulative.volume.values.astype(float64),
+            ],
+            names=CUMULATIVE_ADJUSTMENT_COLUMNS,
+            rootdir=rootdir,
+            mode='w',
+        )
+        table.attrs['calendar'] = self._calendar.asi8.tolist()
+        return table
+
+
+class BcolzCumulativeAdjustmentReader(object):
+    """
+    Reader for cumulative adjustment factors written by
+    BcolzCumulativeAdjustmentWriter.
+
+    Columns
+    -------
+    sid : uint32
+        The asset id of the row.
+    loc : uint32
+        Position in the calendar of the first trading day on or after the
+        effective date of one or more adjustments.
+    price : float64
+        Product of the ratios of every adjustment to the sid's prices
+        effective on or after the calendar day at `loc`.
+    volume : float64
+        Same as price, for the sid's volumes.
+
+    Rows are sorted by sid and then by loc.
+
+    Attributes
+    ----------
+    calendar : list[int64]
+        Calendar used to compute locs, in asi8 format (ns since EPOCH).
+
+    Parameters
+    ----------
+    table : str or bcolz.ctable
+        The table of factors.
+    """
+    @preprocess(table=coerce_string(open_ctable, mode='r'))
+    def __init__(self, table):
+        self._calendar = DatetimeIndex(table.attrs['calendar'], tz='UTC')
+
+        # Flatten (sid, loc) into a single sorted key so that the factors for
+        # every (day, asset) pair in a query can be found with one
+        # searchsorted.
+        self._stride = stride = len(self._calendar) + 1
+        self._keys = (
+            table['sid'][:].astype(int64) * stride + table['loc'][:]
+        )
+        # Queries that find no factor for their sid land on the trailing
+        # 1.0.
+        self._factors = {
+            'price': append(table['price'][:], 1.0),
+            'volume': append(table['volume'][:], 1.0),
+        }
+
+    def load_factors(self, columns, dates, assets):
+        """
+        Load cumulative adjustment factors.
+
+        Parameters
+        ----------
+        columns : list[BoundColumn]
+            Columns for which factors are needed.
+        dates : pd.DatetimeIndex
+            A contiguous range of days of the reader's calendar for which
+            factors are needed.
+        assets : pd.Int64Index
+            Assets for which factors are needed.
+
+        Returns
+        -------
+        factors : list[np.ndarray[float64]]
+            For each column, an array of shape ``(len(dates) + 1,
+            len(assets))`` whose entry ``[r, c]`` is the product of the
+            ratios of all adjustments to ``assets[c]`` effective on or after
+            ``dates[r]``.  The last row covers adjustments effective after
+            ``dates[-1]``, which cancel out of the ratio of any two rows.
+            These are the `factors` expected by
+            zipline.lib.adjusted_array.CumulativeAdjustedArray.
+        """
+        calendar = self._calendar
+        try:
+            start = calendar.get_loc(dates[0])
+        except KeyError:
+            raise ValueError(
+                "Query start %s not in calendar." % dates[0]
+            )
+        stop = start + len(dates)
+        if not calendar[start:stop].equals(dates):
+            raise ValueError(
+                "Query dates must be a contiguous range of the calendar."
+            )
+
+        stride = self._stride
+        sids = assets.values.astype(int64) * stride
+        queries = add.outer(arange(start, stop + 1), sids)
+
+        keys = self._keys
+        idx = keys.searchsorted(queries)
+        # The first key at or after a query only applies if it belongs to
+        # the same sid.
+        found = append(keys, -1)[idx] // stride == sids // stride
+        idx[~found] = len(keys)
+
+        return [
+            self._factors[
+                'volume' if column.name == 'volume' else 'price'
+            ][idx]
+            for column in columns
+        ]
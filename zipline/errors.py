@@ -524,6 +524,19 @@ class AssetDBVersionError(ZiplineError):
     )
 
 
+class AssetDBSnapshotVersionError(ZiplineError):
+    """
+    Raised when reading an asset database snapshot written with a different
+    SNAPSHOT_VERSION or ASSET_DB_VERSION.
+    """
+    msg = (
+        "The asset database snapshot at {path!r} has version "
+        "{snapshot_version} and was taken of an asset database with version "
+        "{db_version}. Expected versions {expected_snapshot_version} and "
+        "{expected_db_version}. Try rewriting the snapshot."
+    )
+
+
 class AssetDBImpossibleDowngrade(ZiplineError):
     msg = (
         "The existing Asset database is version: {db_version} which is lower "
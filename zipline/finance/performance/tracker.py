@@ -119,9 +119,18 @@ class PerformanceTracker(object):
                 risk.RiskMetricsCumulative(self.sim_params, self.env)
 
         elif self.emission_rate == 'minute':
-            self.all_benchmark_returns = pd.Series(index=pd.date_range(
+            # Only market minutes are allocated, so that the buffer stays
+            # proportional to the number of bars in the simulation.
+            self.all_benchmark_minutes = env.minutes_for_days_in_range(
                 self.sim_params.first_open, self.sim_params.last_close,
-                freq='Min'))
+            )
+            self.all_benchmark_returns = np.full(
+                len(self.all_benchmark_minutes), np.nan,
+            )
+            # The benchmark return compounded since the open of
+            # benchmark_session, maintained as benchmark events arrive.
+            self.benchmark_session = None
+            self.benchmark_growth_since_open = 1.0
 
             self.cumulative_risk_metrics = \
                 risk.RiskMetricsCumulative(self.sim_params, self.env,
@@ -320,6 +329,10 @@ class PerformanceTracker(object):
         self.todays_performance.handle_commission(cost)
 
     def process_benchmark(self, event):
+        if self.emission_rate == 'minute':
+            self._process_minute_benchmark(event)
+            return
+
         if self.sim_params.data_frequency == 'minute' and \
            self.sim_params.emission_rate == 'daily':
             # Minute data benchmarks should have a timestamp of market
@@ -340,6 +353,27 @@ class PerformanceTracker(object):
 
         self.all_benchmark_returns[midnight] = event.returns
 
+    def _process_minute_benchmark(self, event):
+        try:
+            loc = self.all_benchmark_minutes.get_loc(event.dt)
+        except KeyError:
+            raise AssertionError(
+                ("Minute %s not allocated in all_benchmark_minutes. "
+                 "Calendar seems to mismatch with benchmark. "
+                 "Benchmark container is=%s" %
+                 (event.dt,
+                  self.all_benchmark_minutes)))
+
+        self.all_benchmark_returns[loc] = event.returns
+
+        session = normalize_date(event.dt)
+        if session != self.benchmark_session:
+            # First benchmark event of the day, restart compounding.
+            self.benchmark_session = session
+            self.benchmark_growth_since_open = 1.0
+        if not np.isnan(event.returns):
+            self.benchmark_growth_since_open *= 1. + event.returns
+
     def process_close_position(self, event):
 
         # CLOSE_POSITION events that contain prices that must be handled as
@@ -412,9 +446,12 @@ class PerformanceTracker(object):
         todays_date = normalize_date(dt)
         account = self.get_account(False)
 
-        bench_returns = self.all_benchmark_returns.loc[todays_date:dt]
         # cumulative returns
-        bench_since_open = (1. + bench_returns).prod() - 1
+        if self.benchmark_session == todays_date:
+            bench_since_open = self.benchmark_growth_since_open - 1
+        else:
+            # No benchmark events yet today.
+            bench_since_open = 0.0
 
         self.cumulative_risk_metrics.update(todays_date,
                                             self.todays_performance.returns,
@@ -524,14 +561,14 @@ class PerformanceTracker(object):
 
         state_dict['_dividend_count'] = self._dividend_count
 
-        STATE_VERSION = 4
+        STATE_VERSION = 5
         state_dict[VERSION_LABEL] = STATE_VERSION
 
         return state_dict
 
     def __setstate__(self, state):
 
-        OLDEST_SUPPORTED_STATE = 4
+        OLDEST_SUPPORTED_STATE = 5
         version = state.pop(VERSION_LABEL)
 
         if version < OLDEST_SUPPORTED_STATE:
@@ -72,6 +72,48 @@ def information_ratio(algo_volatility, algorithm_return, benchmark_return):
     return (algorithm_return - benchmark_return) / algo_volatility
 
 
+class _RunningMoments(object):
+    """
+    Accumulates the count, means, and second (co-)moments of a stream of
+    paired observations using Welford's method, so that sample variances and
+    covariances can be read off in constant time after each observation.
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.mean_x = np.float64(0.0)
+        self.mean_y = np.float64(0.0)
+        self.m2_x = np.float64(0.0)
+        self.m2_y = np.float64(0.0)
+        self.comoment = np.float64(0.0)
+
+    def push(self, x, y=0.0):
+        self.n += 1
+        dx = x - self.mean_x
+        dy = y - self.mean_y
+        self.mean_x += dx / self.n
+        self.mean_y += dy / self.n
+        self.m2_x += dx * (x - self.mean_x)
+        self.m2_y += dy * (y - self.mean_y)
+        self.comoment += dx * (y - self.mean_y)
+
+    def pushed(self, x, y=0.0):
+        """
+        Return a copy of this accumulator with one more observation pushed,
+        leaving this accumulator untouched.
+        """
+        new = _RunningMoments.__new__(_RunningMoments)
+        new.__dict__.update(self.__dict__)
+        new.push(x, y)
+        return new
+
+    def std_x(self):
+        return np.sqrt(self.m2_x / (self.n - 1))
+
+    def std_y(self):
+        return np.sqrt(self.m2_y / (self.n - 1))
+
+
 class RiskMetricsCumulative(object):
     """
     :Usage:
@@ -171,6 +213,46 @@ class RiskMetricsCumulative(object):
 
         self.num_trading_days = 0
 
+        self._reset_accumulators()
+
+    def _reset_accumulators(self):
+        """
+        Reset the running state used by ``update`` to compute the cumulative
+        metrics without rescanning the full history of returns.
+
+        The accumulators only ever hold the days strictly before the latest
+        update, since the latest day's returns are overwritten on every
+        minute emission. They are rebuilt lazily from the ``*_cont`` arrays
+        by the next call to ``update``.
+        """
+        # Number of days, starting from the first, folded into the
+        # accumulators below.
+        self._days_folded = 0
+        # Moments of the (algorithm, benchmark) daily returns.
+        self._returns_moments = _RunningMoments()
+        # Moments of the downside differences used by ``downside_risk``.
+        self._downside_moments = _RunningMoments()
+        self._algorithm_growth = np.float64(1.0)
+        self._benchmark_growth = np.float64(1.0)
+
+    def _fold_day(self, loc):
+        algorithm_returns = self.algorithm_returns_cont[loc]
+        benchmark_returns = self.benchmark_returns_cont[loc]
+        self._returns_moments.push(algorithm_returns, benchmark_returns)
+        self._algorithm_growth *= 1. + algorithm_returns
+        self._benchmark_growth *= 1. + benchmark_returns
+        downside_diff = self._downside_diff(
+            algorithm_returns, self.mean_returns_cont[loc],
+        )
+        if downside_diff < 0:
+            self._downside_moments.push(downside_diff)
+        self._days_folded = loc + 1
+
+    @staticmethod
+    def _downside_diff(algorithm_returns, mean_returns):
+        # Matches the rounding done by ``risk.downside_risk``.
+        return np.round(algorithm_returns, 8) - np.round(mean_returns, 8)
+
     def update(self, dt, algorithm_returns, benchmark_returns, leverage):
         # Keep track of latest dt for use in to_dict and other methods
         # that report current state.
@@ -178,6 +260,12 @@ class RiskMetricsCumulative(object):
         dt_loc = self.cont_index.get_loc(dt)
         self.latest_dt_loc = dt_loc
 
+        if dt_loc < self._days_folded:
+            # Rewriting history; start the running state over.
+            self._reset_accumulators()
+        while self._days_folded < dt_loc:
+            self._fold_day(self._days_folded)
+
         self.algorithm_returns_cont[dt_loc] = algorithm_returns
         self.algorithm_returns = self.algorithm_returns_cont[:dt_loc + 1]
 
@@ -188,7 +276,7 @@ class RiskMetricsCumulative(object):
                 self.algorithm_returns = np.append(0.0, self.algorithm_returns)
 
         self.algorithm_cumulative_returns[dt_loc] = \
-            self.calculate_cumulative_returns(self.algorithm_returns)
+            self._algorithm_growth * (1. + algorithm_returns) - 1
 
         algo_cumulative_returns_to_date = \
             self.algorithm_cumulative_returns[:dt_loc + 1]
@@ -218,7 +306,7 @@ class RiskMetricsCumulative(object):
                 self.benchmark_returns = np.append(0.0, self.benchmark_returns)
 
         self.benchmark_cumulative_returns[dt_loc] = \
-            self.calculate_cumulative_returns(self.benchmark_returns)
+            self._benchmark_growth * (1. + benchmark_returns) - 1
 
         benchmark_cumulative_returns_to_date = \
             self.benchmark_cumulative_returns[:dt_loc + 1]
@@ -257,11 +345,24 @@ algorithm_returns ({algo_count}) in range {start} : {end} on {dt}"
             )
             raise Exception(message)
 
+        returns_moments = self._returns_moments
+        if self.create_first_day_stats and dt_loc == 0:
+            # Account for the zero returns prepended above.
+            returns_moments = returns_moments.pushed(0.0, 0.0)
+        returns_moments = returns_moments.pushed(
+            self.algorithm_returns_cont[dt_loc],
+            self.benchmark_returns_cont[dt_loc],
+        )
+
         self.update_current_max()
-        self.benchmark_volatility[dt_loc] = \
-            self.calculate_volatility(self.benchmark_returns)
-        self.algorithm_volatility[dt_loc] = \
-            self.calculate_volatility(self.algorithm_returns)
+        if returns_moments.n <= 1:
+            self.benchmark_volatility[dt_loc] = 0.0
+            self.algorithm_volatility[dt_loc] = 0.0
+        else:
+            self.benchmark_volatility[dt_loc] = \
+                returns_moments.std_y() * math.sqrt(252)
+            self.algorithm_volatility[dt_loc] = \
+                returns_moments.std_x() * math.sqrt(252)
 
         # caching the treasury rates for the minutely case is a
         # big speedup, because it avoids searching the treasury
@@ -280,11 +381,28 @@ algorithm_returns ({algo_count}) in range {start} : {end} on {dt}"
         self.excess_returns[dt_loc] = (
             self.algorithm_cumulative_returns[dt_loc] -
             self.treasury_period_return)
-        self.beta[dt_loc] = self.calculate_beta()
+        # it doesn't make much sense to calculate beta for less than two
+        # values.
+        if returns_moments.n < 2:
+            self.beta[dt_loc] = 0.0
+        else:
+            self.beta[dt_loc] = \
+                returns_moments.comoment / returns_moments.m2_y
         self.alpha[dt_loc] = self.calculate_alpha()
         self.sharpe[dt_loc] = self.calculate_sharpe()
-        self.downside_risk[dt_loc] = \
-            self.calculate_downside_risk()
+
+        downside_moments = self._downside_moments
+        downside_diff = self._downside_diff(
+            self.algorithm_returns_cont[dt_loc],
+            self.mean_returns_cont[dt_loc],
+        )
+        if downside_diff < 0:
+            downside_moments = downside_moments.pushed(downside_diff)
+        if downside_moments.n <= 1:
+            self.downside_risk[dt_loc] = 0.0
+        else:
+            self.downside_risk[dt_loc] = \
+                downside_moments.std_x() * math.sqrt(252)
         self.sortino[dt_loc] = self.calculate_sortino()
         self.information[dt_loc] = self.calculate_information()
         self.max_drawdown = self.calculate_max_drawdown()
@@ -342,6 +460,10 @@ algorithm_returns ({algo_count}) in range {start} : {end} on {dt}"
 
         return '\n'.join(statements)
 
+    # The calculate_* methods below recompute their metric from the full
+    # history of returns. ``update`` maintains the same values incrementally;
+    # these are kept as the reference implementations.
+
     def calculate_cumulative_returns(self, returns):
         return (1. + returns).prod() - 1
 
@@ -474,3 +596,4 @@ algorithm_returns ({algo_count}) in range {start} : {end} on {dt}"
                     saved state is too old.")
 
         self.__dict__.update(state)
+        self._reset_accumulators()
@@ -13,7 +13,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import bisect
 import logbook
 import datetime
 
@@ -36,6 +35,10 @@ from zipline.errors import (
 
 log = logbook.Logger('Trading')
 
+_DAY = pd.Timedelta(days=1).value
+_MINUTE = pd.Timedelta(minutes=1).value
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
 
 # The financial simulations in zipline depend on information
 # about the benchmark index and the risk free rates of return.
@@ -45,7 +48,9 @@ log = logbook.Logger('Trading')
 # batch_transforms, need access to a calendar of trading days and
 # market hours. The TradingEnvironment maintains two time keeping
 # facilities:
-#   - a DatetimeIndex of trading days for calendar calculations
+#   - a DatetimeIndex of trading days for calendar calculations, along with
+#   int64 arrays of the trading days, opens and closes as nanoseconds since
+#   the epoch, which are searched to navigate the calendar
 #   - a timezone name, which should be local to the exchange
 #   hosting the benchmark index. All dates are normalized to UTC
 #   for serialization and storage, and the timezone is used to
@@ -94,6 +99,17 @@ class TradingEnvironment(object):
         self.open_and_closes = env_trading_calendar.open_and_closes.loc[
             self.trading_days]
 
+        # Nanoseconds since the epoch of each trading day's midnight, open and
+        # close, in UTC.  Navigation methods search these arrays instead of
+        # the pandas objects above.
+        self._trading_days_ns = self.trading_days.asi8
+        self._opens_ns = pd.DatetimeIndex(
+            self.open_and_closes.market_open,
+        ).asi8
+        self._closes_ns = pd.DatetimeIndex(
+            self.open_and_closes.market_close,
+        ).asi8
+
         self.bm_symbol = bm_symbol
         if not load:
             load = load_market_data
@@ -242,31 +258,60 @@ class TradingEnvironment(object):
         mkt_open, mkt_close = self.get_open_and_close(test_date)
         return test_date >= mkt_open and test_date <= mkt_close
 
-    def is_trading_day(self, test_date):
-        dt = self.normalize_date(test_date)
-        return (dt in self.trading_days)
+    def _day_index(self, day_ns):
+        """
+        Return the index of the trading day whose midnight is `day_ns`, or
+        None if it isn't a trading day.
+        """
+        days = self._trading_days_ns
+        idx = days.searchsorted(day_ns)
+        if idx < len(days) and days[idx] == day_ns:
+            return idx
+        return None
 
-    def next_trading_day(self, test_date):
-        dt = self.normalize_date(test_date)
-        delta = datetime.timedelta(days=1)
+    def _next_day_index(self, test_date):
+        """
+        Return the index of the first trading day after the day of
+        `test_date`, or None if there is none.
+        """
+        day_ns = self.normalize_date(test_date).value
+        idx = self._trading_days_ns.searchsorted(day_ns, side='right')
+        if idx == len(self._trading_days_ns):
+            return None
+        return idx
 
-        while dt <= self.last_trading_day:
-            dt += delta
-            if dt in self.trading_days:
-                return dt
+    def _previous_day_index(self, test_date):
+        """
+        Return the index of the last trading day before the day of
+        `test_date`, or None if there is none.
+        """
+        day_ns = self.normalize_date(test_date).value
+        idx = self._trading_days_ns.searchsorted(day_ns, side='left') - 1
+        if idx < 0:
+            return None
+        return idx
 
-        return None
+    def _open_and_close_at(self, idx):
+        return (
+            pd.Timestamp(self._opens_ns[idx], tz='UTC'),
+            pd.Timestamp(self._closes_ns[idx], tz='UTC'),
+        )
 
-    def previous_trading_day(self, test_date):
-        dt = self.normalize_date(test_date)
-        delta = datetime.timedelta(days=-1)
+    def is_trading_day(self, test_date):
+        day_ns = self.normalize_date(test_date).value
+        return self._day_index(day_ns) is not None
 
-        while self.first_trading_day < dt:
-            dt += delta
-            if dt in self.trading_days:
-                return dt
+    def next_trading_day(self, test_date):
+        idx = self._next_day_index(test_date)
+        if idx is None:
+            return None
+        return pd.Timestamp(self._trading_days_ns[idx], tz='UTC')
 
-        return None
+    def previous_trading_day(self, test_date):
+        idx = self._previous_day_index(test_date)
+        if idx is None:
+            return None
+        return pd.Timestamp(self._trading_days_ns[idx], tz='UTC')
 
     def add_trading_days(self, n, date):
         """
@@ -298,9 +343,11 @@ class TradingEnvironment(object):
         return self.trading_days[idx]
 
     def days_in_range(self, start, end):
-        mask = ((self.trading_days >= start) &
-                (self.trading_days <= end))
-        return self.trading_days[mask]
+        trading_days = self.trading_days
+        return trading_days[
+            trading_days.searchsorted(start):
+            trading_days.searchsorted(end, side='right')
+        ]
 
     def opens_in_range(self, start, end):
         return self.open_and_closes.market_open.loc[start:end]
@@ -312,17 +359,21 @@ class TradingEnvironment(object):
         """
         Get all market minutes for the days between start and end, inclusive.
         """
-        start_date = self.normalize_date(start)
-        end_date = self.normalize_date(end)
-
-        all_minutes = []
-        for day in self.days_in_range(start_date, end_date):
-            day_minutes = self.market_minutes_for_day(day)
-            all_minutes.append(day_minutes)
-
-        # Concatenate all minutes and truncate minutes before start/after end.
+        days = self._trading_days_ns
+        first = days.searchsorted(self.normalize_date(start).value)
+        last = days.searchsorted(self.normalize_date(end).value, side='right')
+        opens = self._opens_ns[first:last]
+        minutes_per_day = (self._closes_ns[first:last] - opens) // _MINUTE + 1
+
+        # The minutes of each day are its open plus 0, 1, 2, ... minutes.
+        day_starts = np.cumsum(minutes_per_day) - minutes_per_day
+        offsets = (
+            np.arange(minutes_per_day.sum()) -
+            np.repeat(day_starts, minutes_per_day)
+        )
         return pd.DatetimeIndex(
-            np.concatenate(all_minutes), copy=False, tz='UTC',
+            np.repeat(opens, minutes_per_day) + offsets * _MINUTE,
+            tz='UTC',
         )
 
     def next_open_and_close(self, start_date):
@@ -330,29 +381,29 @@ class TradingEnvironment(object):
         Given the start_date, returns the next open and close of
         the market.
         """
-        next_open = self.next_trading_day(start_date)
+        idx = self._next_day_index(start_date)
 
-        if next_open is None:
+        if idx is None:
             raise NoFurtherDataError(
                 msg=("Attempt to backtest beyond available history. "
                      "Last known date: %s" % self.last_trading_day)
             )
 
-        return self.get_open_and_close(next_open)
+        return self._open_and_close_at(idx)
 
     def previous_open_and_close(self, start_date):
         """
         Given the start_date, returns the previous open and close of the
         market.
         """
-        previous = self.previous_trading_day(start_date)
+        idx = self._previous_day_index(start_date)
 
-        if previous is None:
+        if idx is None:
             raise NoFurtherDataError(
                 msg=("Attempt to backtest beyond available history. "
                      "First known date: %s" % self.first_trading_day)
             )
-        return self.get_open_and_close(previous)
+        return self._open_and_close_at(idx)
 
     def next_market_minute(self, start):
         """
@@ -391,9 +442,11 @@ class TradingEnvironment(object):
         return self.previous_open_and_close(start)[1]
 
     def get_open_and_close(self, day):
-        index = self.open_and_closes.index.get_loc(day.date())
-        todays_minutes = self.open_and_closes.iloc[index]
-        return todays_minutes[0], todays_minutes[1]
+        day_ns = (day.toordinal() - _EPOCH_ORDINAL) * _DAY
+        idx = self._day_index(day_ns)
+        if idx is None:
+            raise KeyError(day)
+        return self._open_and_close_at(idx)
 
     def market_minutes_for_day(self, stamp):
         market_open, market_close = self.get_open_and_close(stamp)
@@ -456,16 +509,14 @@ class TradingEnvironment(object):
         )
 
     def trading_day_distance(self, first_date, second_date):
-        first_date = self.normalize_date(first_date)
-        second_date = self.normalize_date(second_date)
+        days = self._trading_days_ns
 
-        # TODO: May be able to replace the following with searchsorted.
         # Find leftmost item greater than or equal to day
-        i = bisect.bisect_left(self.trading_days, first_date)
-        if i == len(self.trading_days):  # nothing found
+        i = days.searchsorted(self.normalize_date(first_date).value)
+        if i == len(days):  # nothing found
             return None
-        j = bisect.bisect_left(self.trading_days, second_date)
-        if j == len(self.trading_days):
+        j = days.searchsorted(self.normalize_date(second_date).value)
+        if j == len(days):
             return None
 
         return j - i
@@ -475,11 +526,8 @@ class TradingEnvironment(object):
         Return the index of the given @dt, or the index of the preceding
         trading day if the given dt is not in the trading calendar.
         """
-        ndt = self.normalize_date(dt)
-        if ndt in self.trading_days:
-            return self.trading_days.searchsorted(ndt)
-        else:
-            return self.trading_days.searchsorted(ndt) - 1
+        day_ns = self.normalize_date(dt).value
+        return self._trading_days_ns.searchsorted(day_ns, side='right') - 1
 
 
 class SimulationParameters(object):
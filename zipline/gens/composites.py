@@ -14,6 +14,11 @@
 # limitations under the License.
 
 import heapq
+from operator import itemgetter
+
+import numpy as np
+import pandas as pd
+from six.moves import reduce
 
 
 def _decorate_source(source):
@@ -31,3 +36,131 @@ def date_sorted_sources(*sources):
     # Strip out key decoration
     for _, message in sorted_stream:
         yield message
+
+
+class _IndexedEvents(object):
+    """
+    Adapter exposing a date-sorted list of events through the indexed source
+    interface used by ``dt_aligned_snapshots``.
+    """
+    def __init__(self, events):
+        self.events = events
+        self.source_id = events[0].source_id if events else ''
+        dts = pd.DatetimeIndex([event.dt for event in events]).asi8
+        # Start of each run of events sharing a dt.
+        starts = np.flatnonzero(np.r_[True, dts[1:] != dts[:-1]][:len(dts)])
+        self.dt_index = dts[starts]
+        self._bounds = list(zip(
+            starts.tolist(),
+            np.r_[starts[1:], len(events)].tolist(),
+        ))
+
+    @classmethod
+    def from_events(cls, events):
+        """
+        Build an _IndexedEvents from a list of events, or return None if the
+        events are not date-sorted or come from more than one source.
+        """
+        self = cls(events)
+        if (np.diff(self.dt_index) <= 0).any():
+            return None
+        if any(event.source_id != self.source_id for event in events):
+            return None
+        return self
+
+    def iter_snapshots(self):
+        events = self.events
+        for start, stop in self._bounds:
+            yield events[start:stop]
+
+
+def _as_indexed_source(source):
+    """
+    Return (source_id, dt_index, snapshots) for a source whose datetimes are
+    known up front, or None if they are not.
+    """
+    if isinstance(source, (list, tuple)):
+        source = _IndexedEvents.from_events(list(source))
+        if source is None:
+            return None
+        return source.source_id, source.dt_index, source.iter_snapshots()
+
+    dt_index = getattr(source, 'dt_index', None)
+    if dt_index is None:
+        return None
+    return (
+        source.get_hash(),
+        pd.DatetimeIndex(dt_index).asi8,
+        source.iter_snapshots(),
+    )
+
+
+def dt_aligned_snapshots(sources, benchmark_source, source_filter=None):
+    """
+    Merge sources whose datetimes are known up front into a stream of
+    (dt, events) pairs, equivalent to grouping the output of
+    ``date_sorted_sources(benchmark_source, date_sorted_sources(*sources))``
+    by dt.
+
+    Rather than decorating and comparing every event, the union of the
+    sources' datetimes is computed once, and each source contributes a
+    pre-grouped list of events for each of its datetimes.
+
+    Indexed sources expose a ``dt_index`` (the sorted, unique datetimes at
+    which they emit events) and an ``iter_snapshots()`` method yielding one
+    list of events per entry of ``dt_index``. Lists of date-sorted events
+    from a single source are also accepted.
+
+    Parameters
+    ----------
+    sources : iterable
+        The data sources to merge.
+    benchmark_source : iterable
+        The benchmark events to merge.
+    source_filter : callable, optional
+        Predicate applied to the events of ``sources``. Events for which it
+        returns False are dropped.
+
+    Returns
+    -------
+    snapshots : iterator[(pd.Timestamp, list[Event])] or None
+        The merged stream, or None if any source could not expose its
+        datetimes, in which case callers should fall back to
+        ``date_sorted_sources``.
+    """
+    indexed = []
+    for source in sources:
+        as_indexed = _as_indexed_source(source)
+        if as_indexed is None:
+            return None
+        indexed.append(as_indexed + (source_filter,))
+
+    as_indexed = _as_indexed_source(benchmark_source)
+    if as_indexed is None:
+        return None
+    indexed.append(as_indexed + (None,))
+
+    # date_sorted_sources orders events that share a dt by source id.
+    indexed.sort(key=itemgetter(0))
+
+    return _merge_indexed_sources(indexed)
+
+
+def _merge_indexed_sources(indexed):
+    all_dts = reduce(np.union1d, [dts for _, dts, _, _ in indexed])
+    # For each dt, whether each source has a snapshot at that dt.
+    present = np.column_stack(
+        [np.in1d(all_dts, dts) for _, dts, _, _ in indexed],
+    ).tolist()
+    snapshots = [(iter(snaps), filter_) for _, _, snaps, filter_ in indexed]
+
+    for row in present:
+        events = []
+        for has_snapshot, (snaps, filter_) in zip(row, snapshots):
+            if has_snapshot:
+                snapshot = next(snaps)
+                if filter_ is not None:
+                    snapshot = [event for event in snapshot if filter_(event)]
+                events.extend(snapshot)
+        if events:
+            yield events[0].dt, events
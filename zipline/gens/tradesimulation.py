@@ -173,6 +173,12 @@ class AlgorithmSimulator(object):
                         elif event.type == DATASOURCE_TYPE.TRADE:
                             self.update_universe(event)
                             self.algo.perf_tracker.process_trade(event)
+                        elif event.type == DATASOURCE_TYPE.TRADE_SNAPSHOT:
+                            self.update_universe_from_snapshot(event)
+                            perf_tracker = self.algo.perf_tracker
+                            positions = perf_tracker.position_tracker.positions
+                            for trade in event.trades(positions):
+                                perf_tracker.process_trade(trade)
                         elif event.type == DATASOURCE_TYPE.CUSTOM:
                             self.update_universe(event)
 
@@ -245,6 +251,7 @@ class AlgorithmSimulator(object):
 
         if instant_fill:
             events_to_be_processed = []
+            trade_snapshots = []
 
         # Assign process events to variables to avoid attribute access in
         # innermost loops.
@@ -292,6 +299,21 @@ class AlgorithmSimulator(object):
         for event in snapshot:
             if event.type == DATASOURCE_TYPE.TRADE:
                 trades.append(event)
+            elif event.type == DATASOURCE_TYPE.TRADE_SNAPSHOT:
+                # Update the universe straight from the snapshot's arrays, and
+                # only build trade events for the sids that the blotter or the
+                # position tracker care about.  With instant fills, orders
+                # placed in handle_data must see this snapshot's trades, so
+                # the trades are built after handle_data has been called.
+                if len(event):
+                    any_trade_occurred = True
+                    self.update_universe_from_snapshot(event)
+                    if instant_fill:
+                        trade_snapshots.append(event)
+                    else:
+                        trades.extend(event.trades(
+                            self._sids_needing_trades(),
+                        ))
             elif event.type == DATASOURCE_TYPE.BENCHMARK:
                 benchmark = event
             elif event.type == DATASOURCE_TYPE.SPLIT:
@@ -365,6 +387,10 @@ class AlgorithmSimulator(object):
             # Now that handle_data has been called and orders have been placed,
             # process the event stream to fill user orders based on the events
             # from this snapshot.
+            for trade_snapshot in trade_snapshots:
+                events_to_be_processed.extend(trade_snapshot.trades(
+                    self._sids_needing_trades(),
+                ))
             for trade in events_to_be_processed:
                 for txn, order in blotter_process_trade(trade):
                     if txn is not None:
@@ -501,6 +527,44 @@ class AlgorithmSimulator(object):
                 daily_message['daily_perf']['recorded_vars'] = rvars
                 yield daily_message
 
+    def _sids_needing_trades(self):
+        """
+        The sids for which a trade must be processed by the blotter or the
+        performance tracker: those with open orders or positions.
+        """
+        open_orders = self.algo.blotter.open_orders
+        positions = self.algo.perf_tracker.position_tracker.positions
+        if not open_orders:
+            return positions
+        if not positions:
+            return open_orders
+        return set(open_orders).union(positions)
+
+    def update_universe_from_snapshot(self, snapshot):
+        """
+        Update the universe with every trade in a TradeSnapshot.
+        """
+        current_data = self.current_data
+        dt = snapshot.dt
+        source_id = snapshot.source_id
+        trade_type = DATASOURCE_TYPE.TRADE
+        for sid, price, volume in zip(snapshot.sids.tolist(),
+                                      snapshot.price.tolist(),
+                                      snapshot.volume.tolist()):
+            try:
+                sid_data = current_data[sid]
+            except KeyError:
+                sid_data = current_data[sid] = SIDData(sid)
+
+            sid_data.__dict__.update({
+                'type': trade_type,
+                'dt': dt,
+                'sid': sid,
+                'price': price,
+                'volume': volume,
+                'source_id': source_id,
+            })
+
     def update_universe(self, event):
         """
         Update the universe with new event information.
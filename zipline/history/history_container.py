@@ -911,6 +911,164 @@ class HistoryContainer(object):
                                          columns=self.sids)
 
 
+class RingBufferHistoryContainer(HistoryContainer):
+    """
+    A HistoryContainer that avoids rebuilding pandas objects on every bar.
+
+    Each bar is written straight into the next frame of the preallocated
+    (field, bar, sid) ring buffer backing ``buffer_panel`` instead of going
+    through an intermediate DataFrame, and ``get_history`` only copies the
+    requested field out of the buffer. The digested bars and their index are
+    cached per HistorySpec until the corresponding digest panel rolls, so
+    repeated ``history()`` calls within a period only recompute the current,
+    partial bar.
+
+    Select this implementation by passing
+    ``history_container_class=RingBufferHistoryContainer`` to
+    TradingAlgorithm.
+    """
+    def __init__(self, *args, **kwargs):
+        # Map from (Frequency, field, ffill, bar_count) to the digest state
+        # the entry was built from and the digested values and dates.
+        self._digest_cache = {}
+        super(RingBufferHistoryContainer, self).__init__(*args, **kwargs)
+
+    def ensure_spec(self, spec, dt, bar_data):
+        self._digest_cache.clear()
+        return super(RingBufferHistoryContainer, self).ensure_spec(
+            spec, dt, bar_data,
+        )
+
+    def _realign_sids(self):
+        self._digest_cache.clear()
+        super(RingBufferHistoryContainer, self)._realign_sids()
+
+    def _realign_fields(self):
+        self._digest_cache.clear()
+        super(RingBufferHistoryContainer, self)._realign_fields()
+
+    def write_bardata(self, out, data, algo_dt):
+        """
+        Write the values of the bar at @algo_dt in @data into @out, a
+        (fields, sids) array.
+        """
+        out.fill(np.nan)
+        fields = list(self.fields)
+        bars = data._data
+        for j, sid in enumerate(self.sids):
+            sid_data = bars.get(sid)
+            if not sid_data:
+                continue
+            if algo_dt != sid_data['dt']:
+                continue
+            get = sid_data.get
+            out[:, j] = [get(field, np.nan) for field in fields]
+
+    def update(self, data, algo_dt):
+        """
+        Takes the bar at @algo_dt's @data, checks to see if we need to roll any
+        new digests, then writes the new data into the buffer panel.
+        """
+        self.update_last_known_values()
+        self.update_digest_panels(algo_dt, self.buffer_panel)
+        self.write_bardata(
+            self.buffer_panel.next_frame(algo_dt), data, algo_dt,
+        )
+
+    def digest_bars(self, history_spec, do_ffill):
+        bar_count = history_spec.bar_count
+        if bar_count == 1:
+            return super(RingBufferHistoryContainer, self).digest_bars(
+                history_spec, do_ffill,
+            )
+
+        freq = history_spec.frequency
+        field = history_spec.field
+        digest_panel = self.digest_panels[freq]
+
+        # The digest only changes when a new frame is rolled into the panel,
+        # or, when forward-filling, when the prior values used to seed it
+        # change.
+        state = (
+            id(digest_panel),
+            digest_panel.window_length,
+            digest_panel.date_buf[digest_panel._pos - 1],
+        )
+        if do_ffill:
+            key_loc = self.last_known_prior_values.index.get_loc(
+                (freq.freq_str, field),
+            )
+            prior_values = self.last_known_prior_values.values[key_loc]
+        else:
+            prior_values = None
+
+        key = (freq, field, do_ffill, bar_count)
+        cached = self._digest_cache.get(key)
+        if cached is not None:
+            cached_state, cached_prior_values, values, index = cached
+            if cached_state == state and (
+                    prior_values is None or
+                    array_equal_nan(cached_prior_values, prior_values)):
+                return values, index
+
+        values, index = super(RingBufferHistoryContainer, self).digest_bars(
+            history_spec, do_ffill,
+        )
+        self._digest_cache[key] = (
+            state,
+            None if prior_values is None else prior_values.copy(),
+            values,
+            index,
+        )
+        return values, index
+
+    def get_history(self, history_spec, algo_dt):
+        """
+        Main API used by the algoscript is mapped to this function.
+
+        Selects from the overarching history panel the values for the
+        @history_spec at the given @algo_dt.
+        """
+        field = history_spec.field
+        do_ffill = history_spec.ffill
+
+        # Get our stored values from periods prior to the current period.
+        digest_frame, index = self.digest_bars(history_spec, do_ffill)
+
+        # Get only the requested field's minutes from our buffer panel to
+        # build the last row of the returned frame.
+        buffer_frame = self.buffer_panel.get_current(
+            item=field,
+            start=self.cur_window_starts[history_spec.frequency],
+            raw=True,
+        )
+
+        if do_ffill:
+            buffer_frame = ffill_buffer_from_prior_values(
+                history_spec.frequency,
+                field,
+                buffer_frame,
+                digest_frame,
+                self.last_known_prior_values,
+                raw=True
+            )
+        last_period = self.frame_to_series(field, buffer_frame, self.sids)
+        return fast_build_history_output(digest_frame,
+                                         last_period,
+                                         algo_dt,
+                                         index=index,
+                                         columns=self.sids)
+
+
+def array_equal_nan(a, b):
+    """
+    Like np.array_equal, but treats NaNs in the same position as equal.
+    """
+    return a.shape == b.shape and bool(
+        ((a == b) | (np.isnan(a) & np.isnan(b))).all()
+    )
+
+
 def fast_build_history_output(buffer_frame,
                               last_period,
                               algo_dt,
@@ -1,3 +1,4 @@
+from bisect import bisect_left
 from textwrap import dedent
 
 from numpy import (
@@ -10,9 +11,11 @@ from numpy import (
     int16,
     uint16,
     ndarray,
+    newaxis,
     uint32,
     uint8,
 )
+from numpy.lib.stride_tricks import as_strided
 from zipline.errors import (
     WindowLengthNotPositive,
     WindowLengthTooLong,
@@ -196,6 +199,17 @@ class AdjustedArray(object):
             window_length,
         )
 
+    def shared_window_buffer(self):
+        """
+        Produce a buffer from which several consumers can draw rolling
+        windows over our data in lockstep.
+
+        Returns
+        -------
+        buffer : SharedWindowBuffer
+        """
+        return SharedWindowBuffer(self)
+
     def inspect(self):
         """
         Return a string representation of the data stored in this array.
@@ -217,6 +231,371 @@ class AdjustedArray(object):
         )
 
 
+class CumulativeAdjustedArray(AdjustedArray):
+    """
+    An AdjustedArray whose multiplicative adjustments are given as cumulative
+    factors instead of as Adjustment objects.
+
+    Parameters
+    ----------
+    data : np.ndarray[float64]
+        The baseline data values.
+    mask : np.ndarray[bool]
+        A mask indicating the locations of missing data.
+    factors : np.ndarray[float64]
+        An array with one more row than `data`.  A window ending just before
+        row ``a`` of `data` sees row ``r`` of `data` multiplied by
+        ``factors[r] / factors[a]``.
+    missing_value : object
+        A value to use to fill missing data in yielded windows.
+    """
+    __slots__ = ('_factors',)
+
+    def __init__(self, data, mask, factors, missing_value):
+        super(CumulativeAdjustedArray, self).__init__(
+            data, mask, {}, missing_value,
+        )
+        if self._data.dtype != float64_dtype:
+            raise TypeError(
+                "CumulativeAdjustedArray requires floating point data, "
+                "but got data of type %s." % data.dtype
+            )
+        expected_shape = (data.shape[0] + 1,) + data.shape[1:]
+        if factors.shape != expected_shape:
+            raise ValueError(
+                "Factors shape %s != expected shape %s." %
+                (factors.shape, expected_shape),
+            )
+        self._factors = factors
+
+    def traverse(self, window_length, offset=0):
+        """
+        Produce an iterator rolling windows rows over our data.
+        Each emitted window will have `window_length` rows.
+
+        Parameters
+        ----------
+        window_length : int
+            The number of rows in each emitted window.
+        offset : int, optional
+            Number of rows to skip before the first window.
+        """
+        return self.shared_window_buffer().traverse(window_length, offset)
+
+    def shared_window_buffer(self):
+        """
+        Produce a buffer from which several consumers can draw rolling
+        windows over our data.
+
+        Returns
+        -------
+        buffer : CumulativeWindowBuffer
+        """
+        return CumulativeWindowBuffer(self)
+
+
+class CumulativeWindowBuffer(object):
+    """
+    A buffer serving rolling windows of a CumulativeAdjustedArray.
+
+    Every row is adjusted once up front as of the end of the array, after
+    which each window only needs to be rescaled by the factor at its anchor.
+    Windows don't depend on one another, so iterators drawn from the buffer
+    can be advanced in any order.
+
+    Parameters
+    ----------
+    adjusted_array : CumulativeAdjustedArray
+        The array to traverse.
+
+    Attributes
+    ----------
+    adjustments_applied : int
+        Always 0, since no Adjustment objects are applied.
+    """
+    adjustments_applied = 0
+
+    def __init__(self, adjusted_array):
+        factors = adjusted_array._factors
+        self._data = adjusted_array._data * factors[:-1]
+        self._scales = 1.0 / factors
+
+    @property
+    def nbytes(self):
+        """
+        The number of bytes in the buffer's adjusted copy of the data.
+        """
+        return self._data.nbytes
+
+    def traverse(self, window_length, offset=0):
+        """
+        Produce an iterator rolling windows rows over the adjusted data.
+        Each emitted window will have `window_length` rows.
+
+        Parameters
+        ----------
+        window_length : int
+            The number of rows in each emitted window.
+        offset : int, optional
+            Number of rows to skip before the first window.
+        """
+        _check_window_params(self._data, window_length)
+        return SharedWindowIterator(self, window_length, offset)
+
+    def window(self, start, anchor):
+        """
+        Return rows ``[start, anchor)`` of the data, adjusted as of `anchor`.
+        """
+        out = self._data[start:anchor] * self._scales[anchor]
+        out.setflags(write=False)
+        return out
+
+    def block_size(self, anchor, nrows):
+        """
+        Return how many of the `nrows` windows anchored from `anchor` onwards
+        can be served as one block, which is all of them.
+        """
+        return nrows
+
+    def windows(self, anchor, window_length, nrows):
+        """
+        Return a 3D array of the `nrows` windows of length `window_length`
+        anchored from `anchor` onwards.
+        """
+        out = (
+            _stack_windows(self._data, anchor, window_length, nrows) *
+            self._scales[anchor:anchor + nrows, newaxis]
+        )
+        out.setflags(write=False)
+        return out
+
+
+class SharedWindowBuffer(object):
+    """
+    A single adjusted copy of an AdjustedArray's data from which any number of
+    rolling windows can be drawn.
+
+    `AdjustedArray.traverse` gives every consumer a private copy of the data
+    and replays every adjustment on that copy.  Iterators produced by
+    `SharedWindowBuffer.traverse` instead share one copy, on which each
+    adjustment is applied exactly once, so they must be advanced in lockstep:
+    no iterator may ask for a window anchored before an adjustment that has
+    already been applied on behalf of another.
+
+    Parameters
+    ----------
+    adjusted_array : AdjustedArray
+        The array to traverse.
+
+    Attributes
+    ----------
+    adjustments_applied : int
+        The number of adjustments that have been applied to the buffer.
+    """
+    def __init__(self, adjusted_array):
+        self._data = adjusted_array._data.copy()
+        self._viewtype = adjusted_array._viewtype
+        self._adjustments = adjusted_array.adjustments
+        self._adjustment_indices = sorted(self._adjustments, reverse=True)
+        self._all_indices = sorted(self._adjustments)
+        self._last_applied = -1
+        self.adjustments_applied = 0
+
+    @property
+    def nbytes(self):
+        """
+        The number of bytes in the buffer's copy of the data.
+        """
+        return self._data.nbytes
+
+    def traverse(self, window_length, offset=0):
+        """
+        Produce an iterator rolling windows rows over the shared data.
+        Each emitted window will have `window_length` rows.
+
+        Parameters
+        ----------
+        window_length : int
+            The number of rows in each emitted window.
+        offset : int, optional
+            Number of rows to skip before the first window.
+        """
+        _check_window_params(self._data, window_length)
+        return SharedWindowIterator(self, window_length, offset)
+
+    def window(self, start, anchor):
+        """
+        Return a read-only view of rows ``[start, anchor)`` of the buffer,
+        after applying every adjustment whose index is less than `anchor`.
+
+        Raises
+        ------
+        ValueError
+            If an adjustment at or after `anchor` has already been applied.
+        """
+        self._advance(anchor)
+        out = self._data[start:anchor].view(self._viewtype)
+        out.setflags(write=False)
+        return out
+
+    def block_size(self, anchor, nrows):
+        """
+        Return how many of the `nrows` windows anchored from `anchor` onwards
+        see the same adjustments, and so can be served as one block.
+        """
+        i = bisect_left(self._all_indices, anchor)
+        if i == len(self._all_indices):
+            return nrows
+        # The window anchored at the next adjustment's index doesn't see it
+        # yet.
+        return min(nrows, self._all_indices[i] - anchor + 1)
+
+    def windows(self, anchor, window_length, nrows):
+        """
+        Return a read-only 3D view of the `nrows` windows of length
+        `window_length` anchored from `anchor` onwards.
+
+        Callers should use `block_size` to ensure that no adjustment falls
+        between the windows.
+        """
+        self._advance(anchor)
+        out = _stack_windows(
+            self._data, anchor, window_length, nrows,
+        ).view(self._viewtype)
+        out.setflags(write=False)
+        return out
+
+    def _advance(self, anchor):
+        """
+        Apply every adjustment whose index is less than `anchor`.
+
+        Raises
+        ------
+        ValueError
+            If an adjustment at or after `anchor` has already been applied.
+        """
+        if anchor <= self._last_applied:
+            raise ValueError(
+                "Can't produce a window anchored at row %d after applying "
+                "adjustments for row %d." % (anchor, self._last_applied)
+            )
+
+        data = self._data
+        indices = self._adjustment_indices
+        while indices and indices[-1] < anchor:
+            idx = indices.pop()
+            for adjustment in self._adjustments[idx]:
+                adjustment.mutate(data)
+                self.adjustments_applied += 1
+            self._last_applied = idx
+
+
+class SharedWindowIterator(object):
+    """
+    An iterator over rolling windows of a SharedWindowBuffer or a
+    CumulativeWindowBuffer.
+
+    See Also
+    --------
+    zipline.lib.adjusted_array.SharedWindowBuffer.traverse
+    zipline.lib.adjusted_array.CumulativeWindowBuffer.traverse
+    """
+    def __init__(self, buffer, window_length, offset):
+        self._buffer = buffer
+        self.window_length = window_length
+        self.anchor = window_length + offset
+        self.max_anchor = buffer._data.shape[0]
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        anchor = self.anchor
+        if anchor > self.max_anchor:
+            raise StopIteration()
+
+        out = self._buffer.window(anchor - self.window_length, anchor)
+        self.anchor += 1
+        return out
+    next = __next__  # Python 2 compatibility.
+
+    def block_size(self, max_rows):
+        """
+        Return how many of our next windows, up to `max_rows`, can be served
+        as one block by `next_block`.
+        """
+        return self._buffer.block_size(
+            self.anchor,
+            min(max_rows, self.max_anchor - self.anchor + 1),
+        )
+
+    def next_block(self, nrows):
+        """
+        Return our next `nrows` windows as a 3D array, and advance past them.
+        """
+        out = self._buffer.windows(self.anchor, self.window_length, nrows)
+        self.anchor += nrows
+        return out
+
+    def __repr__(self):
+        return "<%s: window_length=%d, anchor=%d, max_anchor=%d>" % (
+            type(self).__name__,
+            self.window_length,
+            self.anchor,
+            self.max_anchor,
+        )
+
+
+def _stack_windows(data, anchor, window_length, nrows):
+    """
+    Return a 3D view of `data` whose ``i``th entry is the window of length
+    `window_length` ending just before row ``anchor + i``.
+    """
+    if anchor + nrows - 1 > data.shape[0]:
+        raise ValueError(
+            "Can't take %d windows anchored from row %d of %d rows." %
+            (nrows, anchor, data.shape[0])
+        )
+    rows = data[anchor - window_length:]
+    return as_strided(
+        rows,
+        shape=(nrows, window_length) + rows.shape[1:],
+        strides=(rows.strides[0],) + rows.strides,
+    )
+
+
+def window_region(windows):
+    """
+    Return the 2D rows spanned by a 3D block of consecutive windows, or None
+    if the windows aren't views onto a single region of memory.
+
+    Blocks returned by `SharedWindowIterator.next_block` are views onto the
+    rows of a buffer over which no adjustments occur, so rolling kernels can
+    consume the ``nwindows + window_length - 1`` underlying rows directly
+    instead of reducing each window separately.
+
+    Parameters
+    ----------
+    windows : np.ndarray[ndim=3]
+        Array whose ``i``th entry is a window of rows.
+
+    Returns
+    -------
+    region : np.ndarray[ndim=2] or None
+        Array such that ``windows[i] == region[i:i + windows.shape[1]]``.
+    """
+    if windows.ndim != 3 or windows.strides[0] != windows.strides[1]:
+        return None
+    nwindows, window_length, ncols = windows.shape
+    if not nwindows or not window_length:
+        return None
+    return as_strided(
+        windows,
+        shape=(nwindows + window_length - 1, ncols),
+        strides=windows.strides[1:],
+    )
+
+
 def ensure_ndarray(ndarray_or_adjusted_array):
     """
     Return the input as a numpy ndarray.
@@ -3,6 +3,7 @@ Functions for ranking and sorting.
 """
 cimport cython
 from cpython cimport bool
+from libc.math cimport floor
 from numpy cimport (
     float64_t,
     import_array,
@@ -13,8 +14,17 @@ from numpy cimport (
     PyArray_ArgSort,
     PyArray_DIMS,
     PyArray_EMPTY,
+    uint8_t,
+)
+from numpy import (
+    apply_along_axis,
+    empty,
+    float64,
+    isnan,
+    nan,
+    uint8,
+    zeros,
 )
-from numpy import apply_along_axis, float64, isnan, nan
 from scipy.stats import rankdata
 
 from zipline.utils.numpy_utils import (
@@ -37,6 +47,14 @@ cpdef ismissing(ndarray data, object missing_value):
     return (data == missing_value)
 
 
+cdef _check_rankable(ndarray data):
+    cdef str dtype_name = data.dtype.name
+    if dtype_name not in ('float64', 'int64', 'datetime64[ns]'):
+        raise TypeError(
+            "Can't compute rankdata on array of dtype %r." % dtype_name
+        )
+
+
 def masked_rankdata_2d(ndarray data,
                        ndarray mask,
                        object missing_value,
@@ -45,11 +63,7 @@ def masked_rankdata_2d(ndarray data,
     """
     Compute masked rankdata on data on float64, int64, or datetime64 data.
     """
-    cdef str dtype_name = data.dtype.name
-    if dtype_name not in ('float64', 'int64', 'datetime64[ns]'):
-        raise TypeError(
-            "Can't compute rankdata on array of dtype %r." % dtype_name
-        )
+    _check_rankable(data)
 
     cdef ndarray missing_locations = (~mask | ismissing(data, missing_value))
 
@@ -110,3 +124,224 @@ cpdef rankdata_2d_ordinal(ndarray[float64_t, ndim=2] array):
             out[i, sort_idxs[i, j]] = j + 1.0
 
     return out
+
+
+def masked_select_n_2d(ndarray data,
+                       ndarray mask,
+                       object missing_value,
+                       Py_ssize_t n,
+                       bool ascending):
+    """
+    Compute a mask of the `n` lowest (or highest, if `ascending` is False)
+    non-missing values in each row of float64, int64, or datetime64 data.
+
+    Equivalent to:
+
+    masked_rankdata_2d(data, mask, missing_value, 'ordinal', ascending) <= n
+
+    but selects values by partitioning each row rather than sorting it.
+    """
+    _check_rankable(data)
+
+    cdef ndarray missing_locations = (~mask | ismissing(data, missing_value))
+
+    # Interpret the bytes of integral data as floats, as in
+    # masked_rankdata_2d, so that ties and nans are ordered the same way.
+    data = data.view(float64)
+    if not ascending:
+        data = -data
+
+    return _select_n_2d(data, missing_locations.view(uint8), n).view(bool)
+
+
+def masked_between_percentiles_2d(ndarray data,
+                                  ndarray mask,
+                                  float64_t min_percentile,
+                                  float64_t max_percentile):
+    """
+    Compute a mask of the values in each row of `data` falling between the
+    `min_percentile` and `max_percentile` percentiles of that row's non-nan
+    values for which `mask` is True.
+
+    Equivalent to:
+
+    data = data.astype(float64)
+    data[~mask] = nan
+    lower = nanpercentile(data, min_percentile, axis=1, keepdims=True)
+    upper = nanpercentile(data, max_percentile, axis=1, keepdims=True)
+    (lower <= data) & (data <= upper)
+
+    but finds each bound by partitioning each row rather than sorting it.
+    """
+    return _between_percentiles_2d(
+        data.astype(float64, copy=False),
+        (~mask).view(uint8),
+        min_percentile,
+        max_percentile,
+    ).view(bool)
+
+
+cdef inline void _swap(float64_t* values, Py_ssize_t i, Py_ssize_t j) nogil:
+    cdef float64_t tmp = values[i]
+    values[i] = values[j]
+    values[j] = tmp
+
+
+@cython.cdivision(True)
+cdef float64_t _kth_smallest(float64_t* values,
+                             Py_ssize_t n,
+                             Py_ssize_t k) nogil:
+    """
+    Partially sort the first `n` entries of `values`, none of which may be
+    nan, so that ``values[k]`` holds the `k`th smallest of them, and return
+    it.
+
+    This is Hoare's selection algorithm, partitioning around the median of
+    the first, middle and last entries of the remaining range.
+    """
+    cdef:
+        Py_ssize_t lo = 0, hi = n - 1, i, j
+        float64_t a, b, c, pivot
+
+    while lo < hi:
+        a = values[lo]
+        b = values[(lo + hi) / 2]
+        c = values[hi]
+        if a < b:
+            pivot = b if b < c else (c if a < c else a)
+        else:
+            pivot = a if a < c else (c if b < c else b)
+
+        i = lo
+        j = hi
+        while i <= j:
+            while values[i] < pivot:
+                i += 1
+            while pivot < values[j]:
+                j -= 1
+            if i <= j:
+                _swap(values, i, j)
+                i += 1
+                j -= 1
+
+        if k <= j:
+            hi = j
+        elif k >= i:
+            lo = i
+        else:
+            break
+
+    return values[k]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef ndarray _select_n_2d(ndarray[float64_t, ndim=2] data,
+                          ndarray[uint8_t, ndim=2] missing,
+                          Py_ssize_t n):
+    cdef:
+        Py_ssize_t nrows = data.shape[0], ncols = data.shape[1]
+        Py_ssize_t i, j, num_values, remaining
+        float64_t value, threshold
+        ndarray[float64_t] scratch = empty(ncols, dtype=float64)
+        float64_t* values = <float64_t*> scratch.data
+        ndarray[uint8_t, ndim=2] out = zeros((nrows, ncols), dtype=uint8)
+
+    if n <= 0:
+        return out
+
+    for i in range(nrows):
+        num_values = 0
+        for j in range(ncols):
+            value = data[i, j]
+            if not missing[i, j] and value == value:
+                values[num_values] = value
+                num_values += 1
+
+        if n >= num_values:
+            # Every value is selected.  Sorting puts nans last, in column
+            # order, so the remainder are filled from those.
+            remaining = n - num_values
+            for j in range(ncols):
+                if missing[i, j]:
+                    continue
+                value = data[i, j]
+                if value == value:
+                    out[i, j] = True
+                elif remaining:
+                    out[i, j] = True
+                    remaining -= 1
+            continue
+
+        # Select everything below the nth smallest value, then break ties
+        # with it in column order, as a stable sort would.
+        threshold = _kth_smallest(values, num_values, n - 1)
+        remaining = n
+        for j in range(ncols):
+            if not missing[i, j] and data[i, j] < threshold:
+                out[i, j] = True
+                remaining -= 1
+        for j in range(ncols):
+            if not remaining:
+                break
+            if not missing[i, j] and data[i, j] == threshold:
+                out[i, j] = True
+                remaining -= 1
+
+    return out
+
+
+@cython.cdivision(True)
+cdef float64_t _percentile(float64_t* values,
+                           Py_ssize_t n,
+                           float64_t percentile) nogil:
+    """
+    Linearly interpolated `percentile` of the first `n` entries of `values`,
+    computed the same way as numpy.percentile.
+    """
+    cdef:
+        float64_t index = (percentile / 100.0) * (n - 1)
+        Py_ssize_t below = <Py_ssize_t> floor(index)
+        Py_ssize_t above = below + 1 if below + 1 < n else n - 1
+        float64_t weight_above = index - below
+        float64_t weight_below = 1.0 - weight_above
+        float64_t value_below = _kth_smallest(values, n, below)
+        float64_t value_above = _kth_smallest(values, n, above)
+
+    return value_below * weight_below + value_above * weight_above
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef ndarray _between_percentiles_2d(ndarray[float64_t, ndim=2] data,
+                                     ndarray[uint8_t, ndim=2] missing,
+                                     float64_t min_percentile,
+                                     float64_t max_percentile):
+    cdef:
+        Py_ssize_t nrows = data.shape[0], ncols = data.shape[1]
+        Py_ssize_t i, j, num_values
+        float64_t value, lower, upper
+        ndarray[float64_t] scratch = empty(ncols, dtype=float64)
+        float64_t* values = <float64_t*> scratch.data
+        ndarray[uint8_t, ndim=2] out = zeros((nrows, ncols), dtype=uint8)
+
+    for i in range(nrows):
+        num_values = 0
+        for j in range(ncols):
+            value = data[i, j]
+            if not missing[i, j] and value == value:
+                values[num_values] = value
+                num_values += 1
+
+        # Rows without any values have nan bounds, which nothing is between.
+        if not num_values:
+            continue
+
+        lower = _percentile(values, num_values, min_percentile)
+        upper = _percentile(values, num_values, max_percentile)
+        for j in range(ncols):
+            value = data[i, j]
+            if not missing[i, j] and lower <= value <= upper:
+                out[i, j] = True
+
+    return out
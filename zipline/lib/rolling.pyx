@@ -0,0 +1,265 @@
+"""
+Rolling-window kernels for built-in factors.
+
+Each kernel takes a 2D `region` of data and a `window_length`, and writes one
+row of `out` for each window of `window_length` consecutive rows of `region`,
+so ``out.shape == (len(region) - window_length + 1, region.shape[1])``.
+
+Row ``i`` of `out` holds the reduction over ``region[i:i + window_length]``.
+Callers are responsible for only passing regions over which no adjustments
+occur, e.g. regions returned by
+`zipline.lib.adjusted_array.window_region`.
+
+Apart from `rolling_max_drawdown`, the kernels update running accumulators
+as each window slides, so the cost per output row doesn't depend on
+`window_length`.  Division by zero produces inf or nan, as in numpy, rather
+than raising ZeroDivisionError.
+"""
+cimport cython
+from libc.math cimport NAN, sqrt
+from numpy cimport float64_t, import_array, ndarray
+
+
+import_array()
+
+
+cdef _check_shapes(ndarray region, Py_ssize_t window_length, ndarray out):
+    if window_length < 1:
+        raise ValueError(
+            "window_length must be positive, got %d." % window_length
+        )
+    if region.shape[1] != out.shape[1]:
+        raise ValueError(
+            "region has %d columns, but out has %d." %
+            (region.shape[1], out.shape[1])
+        )
+    if region.shape[0] - window_length + 1 != out.shape[0]:
+        raise ValueError(
+            "Expected %d rows of output for %d rows of data with a "
+            "window_length of %d, but out has %d rows." % (
+                region.shape[0] - window_length + 1,
+                region.shape[0],
+                window_length,
+                out.shape[0],
+            )
+        )
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cdef _rolling_nansum(ndarray[float64_t, ndim=2] region,
+                     Py_ssize_t window_length,
+                     ndarray[float64_t, ndim=2] out,
+                     bint mean):
+    cdef:
+        Py_ssize_t nout = out.shape[0], ncols = out.shape[1]
+        Py_ssize_t i, j, count
+        float64_t total, x
+
+    for j in range(ncols):
+        total = 0.0
+        count = 0
+        for i in range(window_length - 1):
+            x = region[i, j]
+            if x == x:
+                total += x
+                count += 1
+
+        for i in range(nout):
+            x = region[i + window_length - 1, j]
+            if x == x:
+                total += x
+                count += 1
+
+            if not mean:
+                out[i, j] = total
+            elif count:
+                out[i, j] = total / count
+            else:
+                out[i, j] = NAN
+
+            x = region[i, j]
+            if x == x:
+                count -= 1
+                # Don't let rounding error outlive the values it came from.
+                total = total - x if count else 0.0
+
+
+@cython.embedsignature(True)
+cpdef rolling_nansum(ndarray region,
+                     Py_ssize_t window_length,
+                     ndarray out):
+    """
+    Write the sum of the non-NaN values in each window of `region` into
+    `out`.  Equivalent to ``nansum(window, axis=0)`` for each window.
+    """
+    _check_shapes(region, window_length, out)
+    _rolling_nansum(region, window_length, out, False)
+
+
+@cython.embedsignature(True)
+cpdef rolling_nanmean(ndarray region,
+                      Py_ssize_t window_length,
+                      ndarray out):
+    """
+    Write the mean of the non-NaN values in each window of `region` into
+    `out`.  Equivalent to ``nanmean(window, axis=0)`` for each window.
+    """
+    _check_shapes(region, window_length, out)
+    _rolling_nansum(region, window_length, out, True)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cdef _rolling_ewm(ndarray[float64_t, ndim=2] region,
+                  Py_ssize_t window_length,
+                  float64_t decay_rate,
+                  ndarray[float64_t, ndim=2] out,
+                  bint stddev):
+    """
+    Exponentially-weighted mean or standard deviation of each window, with
+    the weights of `_ExponentialWeightedFactor.weights`.
+
+    Sliding the window forward by a row multiplies every weight by
+    `decay_rate`, so the weighted sums are multiplied by `decay_rate` after
+    removing the oldest row, before adding the newest.
+    """
+    cdef:
+        Py_ssize_t nout = out.shape[0], ncols = out.shape[1]
+        Py_ssize_t i, j, nans
+        float64_t oldest_weight, newest_weight, weight, weight_sum
+        float64_t squared_weight_sum, bias_correction
+        float64_t shift, x, sum_x, sum_x2, mean, variance
+
+    # weights[k] == decay_rate ** (window_length + 1 - k).
+    newest_weight = decay_rate * decay_rate
+    oldest_weight = decay_rate ** (window_length + 1)
+    weight_sum = 0.0
+    squared_weight_sum = 0.0
+    for i in range(window_length):
+        weight = decay_rate ** (window_length + 1 - i)
+        weight_sum += weight
+        squared_weight_sum += weight * weight
+    bias_correction = (
+        weight_sum * weight_sum /
+        (weight_sum * weight_sum - squared_weight_sum)
+    )
+
+    for j in range(ncols):
+        # Accumulate values relative to the column's first non-NaN value to
+        # avoid cancellation when computing variances.
+        shift = 0.0
+        for i in range(region.shape[0]):
+            if region[i, j] == region[i, j]:
+                shift = region[i, j]
+                break
+
+        sum_x = sum_x2 = 0.0
+        nans = 0
+        for i in range(window_length - 1):
+            x = region[i, j] - shift
+            if x == x:
+                weight = decay_rate ** (window_length + 1 - i)
+                sum_x += weight * x
+                sum_x2 += weight * x * x
+            else:
+                nans += 1
+
+        for i in range(nout):
+            x = region[i + window_length - 1, j] - shift
+            if x == x:
+                sum_x += newest_weight * x
+                sum_x2 += newest_weight * x * x
+            else:
+                nans += 1
+
+            if nans:
+                out[i, j] = NAN
+            else:
+                mean = sum_x / weight_sum
+                if stddev:
+                    variance = sum_x2 / weight_sum - mean * mean
+                    if variance < 0.0:
+                        variance = 0.0
+                    out[i, j] = sqrt(variance * bias_correction)
+                else:
+                    out[i, j] = mean + shift
+
+            x = region[i, j] - shift
+            if x == x:
+                sum_x = decay_rate * (sum_x - oldest_weight * x)
+                sum_x2 = decay_rate * (sum_x2 - oldest_weight * x * x)
+            else:
+                nans -= 1
+                sum_x *= decay_rate
+                sum_x2 *= decay_rate
+
+
+@cython.embedsignature(True)
+cpdef rolling_ewma(ndarray region,
+                   Py_ssize_t window_length,
+                   float64_t decay_rate,
+                   ndarray out):
+    """
+    Write the exponentially-weighted moving average of each window of
+    `region` into `out`.  Equivalent to
+    `ExponentialWeightedMovingAverage.compute` for each window.
+    """
+    _check_shapes(region, window_length, out)
+    _rolling_ewm(region, window_length, decay_rate, out, False)
+
+
+@cython.embedsignature(True)
+cpdef rolling_ewmstd(ndarray region,
+                     Py_ssize_t window_length,
+                     float64_t decay_rate,
+                     ndarray out):
+    """
+    Write the exponentially-weighted moving standard deviation of each
+    window of `region` into `out`.  Equivalent to
+    `ExponentialWeightedMovingStdDev.compute` for each window.
+    """
+    _check_shapes(region, window_length, out)
+    _rolling_ewm(region, window_length, decay_rate, out, True)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+@cython.embedsignature(True)
+cpdef rolling_max_drawdown(ndarray[float64_t, ndim=2] region,
+                           Py_ssize_t window_length,
+                           ndarray[float64_t, ndim=2] out):
+    """
+    Write the max drawdown of each window of `region` into `out`.
+    Equivalent to `MaxDrawdown.compute` for each window.
+
+    Unlike the other kernels, each window is scanned in full, since the
+    largest drawdown can't be updated as values leave the window.
+    """
+    _check_shapes(region, window_length, out)
+
+    cdef:
+        Py_ssize_t nout = out.shape[0], ncols = out.shape[1]
+        Py_ssize_t i, j, k
+        float64_t x, peak, drawdown, max_drawdown, max_peak, trough
+
+    for j in range(ncols):
+        for i in range(nout):
+            peak = NAN
+            max_drawdown = -1.0
+            max_peak = trough = NAN
+            for k in range(i, i + window_length):
+                x = region[k, j]
+                if x != x:
+                    continue
+                if not x <= peak:
+                    peak = x
+                drawdown = peak - x
+                if drawdown > max_drawdown:
+                    max_drawdown = drawdown
+                    max_peak = peak
+                    trough = x
+            out[i, j] = (max_peak - trough) / trough
@@ -0,0 +1,330 @@
+"""
+Persistent caching of computed Pipeline terms.
+"""
+from hashlib import sha1
+import json
+import os
+import shutil
+from types import CodeType
+from uuid import uuid4
+
+from numpy import (
+    arange,
+    full,
+    ix_,
+    load,
+    minimum,
+    save,
+    searchsorted,
+    zeros,
+)
+from pandas import Index
+from six import get_function_code, iteritems, itervalues
+
+from .term import Term
+
+
+class TermCache(object):
+    """
+    A size-bounded, on-disk cache of computed Pipeline term outputs.
+
+    Each entry holds the output of one term for a contiguous range of trading
+    days and a set of assets, stored as ``.npy`` files which are
+    memory-mapped when read.  Entries are keyed on the term's identity (its
+    type, inputs, window length, mask and parameters) and on `data_version`.
+    When storing a new entry would grow the cache past `max_bytes`, the least
+    recently used entries are removed.
+
+    Parameters
+    ----------
+    path : str
+        Directory in which to store cached terms.  It is created if it doesn't
+        exist.
+    max_bytes : int
+        Maximum total size, in bytes, of the cached term outputs.
+    data_version : str, optional
+        Label for the data from which terms are computed.  Entries stored
+        under one `data_version` are never read under another, so this should
+        change whenever the underlying pricing, adjustments or asset data do.
+
+    Notes
+    -----
+    The cache's index is rewritten whenever entries are read or stored, so a
+    cache directory should only be used by one process at a time.
+
+    See Also
+    --------
+    zipline.pipeline.engine.SimplePipelineEngine
+    """
+    INDEX_FILENAME = 'index.json'
+
+    def __init__(self, path, max_bytes, data_version=''):
+        if max_bytes < 0:
+            raise ValueError(
+                "max_bytes must be non-negative, got %r" % max_bytes
+            )
+        self._path = path
+        self._max_bytes = max_bytes
+        self._data_version = data_version
+
+        if not os.path.isdir(path):
+            os.makedirs(path)
+
+        try:
+            with open(self._index_path) as fp:
+                index = json.load(fp)
+        except IOError:
+            self._clock = 0
+            self._entries = {}
+        else:
+            self._clock = index['clock']
+            self._entries = index['entries']
+
+    @property
+    def _index_path(self):
+        return os.path.join(self._path, self.INDEX_FILENAME)
+
+    @property
+    def nbytes(self):
+        """
+        The total size, in bytes, of the cached term outputs.
+        """
+        return sum(entry['nbytes'] for entry in itervalues(self._entries))
+
+    def key(self, term):
+        """
+        Compute the key under which outputs of `term` are cached.
+
+        Parameters
+        ----------
+        term : zipline.pipeline.term.Term
+
+        Returns
+        -------
+        key : str
+            A digest of `term`'s identity and of our `data_version`.
+        """
+        identity = '%s:%s' % (self._data_version, _stable_repr(term))
+        return sha1(identity.encode('utf-8')).hexdigest()
+
+    def load(self, term, dates, assets, mask):
+        """
+        Read the cached outputs of `term` for `dates` and `assets`.
+
+        Parameters
+        ----------
+        term : zipline.pipeline.term.Term
+            The term to read.
+        dates : pd.DatetimeIndex
+            Row labels of the output.
+        assets : pd.Int64Index
+            Column labels of the output.
+        mask : np.ndarray[bool, ndim=2]
+            Array of shape ``(len(dates), len(assets))`` indicating which
+            assets existed on each date.
+
+        Returns
+        -------
+        values : np.ndarray
+            Array of shape ``(len(dates), len(assets))`` holding the cached
+            rows of `term`.  Rows which aren't cached are filled with
+            ``term.missing_value``.  If a single entry matches `dates` and
+            `assets` exactly, this is a read-only memory-map of that entry.
+        covered : np.ndarray[bool]
+            Array of length ``len(dates)`` indicating which rows of `values`
+            were read from the cache.
+
+        Notes
+        -----
+        An entry only serves a row if it holds every asset that existed on
+        that date.  Assets that didn't exist on a date are read as
+        ``term.missing_value``, whatever `term` would have computed for them.
+        """
+        key = self.key(term)
+        dates = dates.asi8
+        covered = zeros(len(dates), dtype=bool)
+        values = None
+
+        candidates = sorted(
+            (
+                (entry_id, entry)
+                for entry_id, entry in iteritems(self._entries)
+                if entry['key'] == key and
+                entry['start'] <= dates[-1] and
+                entry['end'] >= dates[0]
+            ),
+            key=lambda item: item[1]['last_used'],
+            reverse=True,
+        )
+        for entry_id, entry in candidates:
+            entry_dir = os.path.join(self._path, entry_id)
+            entry_dates = load(os.path.join(entry_dir, 'dates.npy'))
+            entry_assets = load(os.path.join(entry_dir, 'assets.npy'))
+
+            columns = Index(entry_assets).get_indexer(assets)
+            found = columns != -1
+
+            rows = searchsorted(entry_dates, dates)
+            hit = (rows < len(entry_dates))
+            hit &= entry_dates[minimum(rows, len(entry_dates) - 1)] == dates
+            hit &= ~mask[:, ~found].any(axis=1)
+            hit &= ~covered
+            if not hit.any():
+                continue
+
+            cached = load(
+                os.path.join(entry_dir, 'values.npy'),
+                mmap_mode='r',
+            )
+            self._touch(entry_id)
+
+            if (hit.all() and
+                    len(entry_dates) == len(dates) and
+                    len(entry_assets) == len(assets) and
+                    (columns == arange(len(assets))).all()):
+                # The entry is exactly the requested block.
+                values = cached
+                covered[:] = True
+                break
+
+            if values is None:
+                values = full(
+                    (len(dates), len(assets)),
+                    term.missing_value,
+                    dtype=term.dtype,
+                )
+            values[ix_(hit, found)] = cached[rows[hit]][:, columns[found]]
+            covered |= hit
+            if covered.all():
+                break
+
+        if candidates:
+            self._write_index()
+        if values is None:
+            values = full(
+                (len(dates), len(assets)),
+                term.missing_value,
+                dtype=term.dtype,
+            )
+        return values, covered
+
+    def store(self, term, dates, assets, values):
+        """
+        Cache the outputs of `term` for `dates` and `assets`.
+
+        Parameters
+        ----------
+        term : zipline.pipeline.term.Term
+            The term whose outputs are being stored.
+        dates : pd.DatetimeIndex
+            Row labels of `values`.  These must be contiguous trading days.
+        assets : pd.Int64Index
+            Column labels of `values`.
+        values : np.ndarray
+            The computed outputs of `term`.
+
+        Notes
+        -----
+        Outputs of object dtype, or larger than the cache's `max_bytes`, are
+        not stored.
+        """
+        if values.dtype.hasobject or values.nbytes > self._max_bytes:
+            return
+        if not len(dates):
+            return
+
+        entry_id = uuid4().hex
+        entry_dir = os.path.join(self._path, entry_id)
+        os.makedirs(entry_dir)
+        save(os.path.join(entry_dir, 'values.npy'), values)
+        save(os.path.join(entry_dir, 'dates.npy'), dates.asi8)
+        save(os.path.join(entry_dir, 'assets.npy'), assets.values)
+
+        self._entries[entry_id] = {
+            'key': self.key(term),
+            'start': int(dates.asi8[0]),
+            'end': int(dates.asi8[-1]),
+            'nbytes': int(values.nbytes),
+            'last_used': 0,
+        }
+        self._touch(entry_id)
+        self._evict()
+        self._write_index()
+
+    def _touch(self, entry_id):
+        """
+        Mark an entry as the most recently used.
+        """
+        self._clock += 1
+        self._entries[entry_id]['last_used'] = self._clock
+
+    def _evict(self):
+        """
+        Remove least recently used entries until we fit in `max_bytes`.
+        """
+        nbytes = self.nbytes
+        by_last_use = sorted(
+            iteritems(self._entries),
+            key=lambda item: item[1]['last_used'],
+        )
+        for entry_id, entry in by_last_use:
+            if nbytes <= self._max_bytes:
+                break
+            del self._entries[entry_id]
+            shutil.rmtree(
+                os.path.join(self._path, entry_id),
+                ignore_errors=True,
+            )
+            nbytes -= entry['nbytes']
+
+    def _write_index(self):
+        """
+        Atomically replace the index file with our current entries.
+        """
+        tmp_path = self._index_path + '.' + uuid4().hex
+        with open(tmp_path, 'w') as fp:
+            json.dump({'clock': self._clock, 'entries': self._entries}, fp)
+        os.rename(tmp_path, self._index_path)
+
+
+def _stable_repr(obj):
+    """
+    Build a string identifying `obj` that doesn't change between processes.
+
+    Terms are represented by their identities, and types by their qualified
+    names along with the code of any ``compute`` or ``compute_all`` method,
+    so that editing a custom term invalidates its cached outputs.
+    """
+    if isinstance(obj, Term):
+        return _stable_repr(obj._identity)
+    if isinstance(obj, type):
+        return _type_repr(obj)
+    if isinstance(obj, (tuple, list)):
+        return '(%s)' % ', '.join(map(_stable_repr, obj))
+    if isinstance(obj, dict):
+        return '{%s}' % ', '.join(
+            '%s: %s' % (_stable_repr(k), _stable_repr(v))
+            for k, v in sorted(iteritems(obj))
+        )
+    return repr(obj)
+
+
+def _type_repr(cls):
+    parts = ['%s.%s' % (cls.__module__, cls.__name__)]
+    for name in ('compute', 'compute_all'):
+        method = getattr(cls, name, None)
+        if method is None:
+            continue
+        try:
+            code = get_function_code(method)
+        except AttributeError:
+            continue
+        constants = tuple(
+            c for c in code.co_consts if not isinstance(c, CodeType)
+        )
+        parts.append(
+            sha1(
+                code.co_code + repr((constants, code.co_names)).encode('utf-8')
+            ).hexdigest()
+        )
+    return '<%s>' % ' '.join(parts)
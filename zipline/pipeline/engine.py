@@ -5,14 +5,20 @@ from abc import (
     ABCMeta,
     abstractmethod,
 )
+from collections import namedtuple
+from multiprocessing import Pool
 from uuid import uuid4
 
 from six import (
+    get_unbound_function,
     iteritems,
+    itervalues,
     with_metaclass,
 )
-from numpy import array
+from six.moves import zip_longest
+from numpy import array, concatenate, flatnonzero, logical_and
 from pandas import (
+    concat,
     DataFrame,
     date_range,
     MultiIndex,
@@ -25,9 +31,17 @@ from zipline.errors import NoFurtherDataError
 from zipline.utils.numpy_utils import repeat_first_axis, repeat_last_axis
 from zipline.utils.pandas_utils import explode
 
+from .graph import TermGraph
+from .mixins import CustomTermMixin
 from .term import AssetExists, LoadableTerm
 
 
+PipelineStats = namedtuple(
+    'PipelineStats',
+    ['peak_workspace_bytes', 'window_buffer_bytes', 'adjustments_applied'],
+)
+
+
 class PipelineEngine(with_metaclass(ABCMeta)):
 
     @abstractmethod
@@ -91,20 +105,40 @@ class SimplePipelineEngine(object):
     asset_finder : zipline.assets.AssetFinder
         An AssetFinder instance.  We depend on the AssetFinder to determine
         which assets are in the top-level universe at any point in time.
+    report_stats : callable[PipelineStats -> None], optional
+        A function to call at the end of each `compute_chunk` with a
+        `PipelineStats` recording the largest number of bytes of term data
+        held in the workspace at any one time, the total number of bytes
+        copied into adjusted window buffers, and the number of adjustments
+        applied to those buffers during the chunk.
+    term_cache : zipline.pipeline.cache.TermCache, optional
+        A persistent cache of computed terms.  If supplied, `run_pipeline`
+        reads each of the pipeline's columns and its screen from the cache
+        where possible, and only computes and caches the dates that are
+        missing.
     """
     __slots__ = (
         '_get_loader',
         '_calendar',
         '_finder',
         '_root_mask_term',
+        '_report_stats',
+        '_term_cache',
         '__weakref__',
     )
 
-    def __init__(self, get_loader, calendar, asset_finder):
+    def __init__(self,
+                 get_loader,
+                 calendar,
+                 asset_finder,
+                 report_stats=None,
+                 term_cache=None):
         self._get_loader = get_loader
         self._calendar = calendar
         self._finder = asset_finder
         self._root_mask_term = AssetExists()
+        self._report_stats = report_stats
+        self._term_cache = term_cache
 
     def run_pipeline(self, pipeline, start_date, end_date):
         """
@@ -148,6 +182,9 @@ class SimplePipelineEngine(object):
         Step 2 is performed in `self.compute_chunk`.
         Steps 3, 4, and 5 are performed in self._format_factor_matrix.
 
+        If the engine has a `term_cache`, stage 2 is skipped for any dates on
+        which the outputs are already cached.
+
         See Also
         --------
         PipelineEngine.run_pipeline
@@ -160,8 +197,48 @@ class SimplePipelineEngine(object):
 
         screen_name = uuid4().hex
         graph = pipeline.to_graph(screen_name, self._root_mask_term)
+        if self._term_cache is None:
+            outputs, out_dates, assets = self._compute_outputs(
+                graph, start_date, end_date,
+            )
+        else:
+            outputs, out_dates, assets = self._compute_cached_outputs(
+                graph, start_date, end_date,
+            )
+
+        screen_values = outputs.pop(screen_name)
+
+        return self._to_narrow(outputs, screen_values, out_dates, assets)
+
+    def _compute_outputs(self, graph, start_date, end_date, assets=None):
+        """
+        Compute the outputs of `graph` between `start_date` and `end_date`.
+
+        Parameters
+        ----------
+        graph : zipline.pipeline.graph.TermGraph
+            The graph to compute.
+        start_date : pd.Timestamp
+            First date for which to compute outputs.
+        end_date : pd.Timestamp
+            Last date for which to compute outputs.
+        assets : pd.Int64Index, optional
+            Assets for which to compute outputs.  By default, every asset that
+            existed between `start_date` and `end_date` is used.
+
+        Returns
+        -------
+        outputs : dict
+            Map from the names in ``graph.outputs`` to computed outputs.
+        dates : pd.DatetimeIndex
+            Row labels of the outputs.
+        assets : pd.Int64Index
+            Column labels of the outputs.
+        """
         extra_rows = graph.extra_rows[self._root_mask_term]
-        root_mask = self._compute_root_mask(start_date, end_date, extra_rows)
+        root_mask = self._compute_root_mask(
+            start_date, end_date, extra_rows, assets,
+        )
         dates, assets, root_mask_values = explode(root_mask)
 
         outputs = self.compute_chunk(
@@ -170,13 +247,143 @@ class SimplePipelineEngine(object):
             assets,
             initial_workspace={self._root_mask_term: root_mask_values},
         )
+        return outputs, dates[extra_rows:], assets
 
-        out_dates = dates[extra_rows:]
-        screen_values = outputs.pop(screen_name)
+    def _compute_cached_outputs(self, graph, start_date, end_date):
+        """
+        Read the outputs of `graph` between `start_date` and `end_date` from
+        our term cache, computing and caching those that are missing.
 
-        return self._to_narrow(outputs, screen_values, out_dates, assets)
+        Dates on which any output is missing are computed in contiguous runs,
+        each over only the outputs missing on some date of the run, and over
+        the same assets as the cached outputs so that every row can be served
+        to later requests.
 
-    def _compute_root_mask(self, start_date, end_date, extra_rows):
+        See Also
+        --------
+        SimplePipelineEngine._compute_outputs
+        """
+        cache = self._term_cache
+        dates, assets, root_mask_values = explode(
+            self._compute_root_mask(start_date, end_date, 0)
+        )
+
+        outputs = {}
+        covered = {}
+        for name, term in iteritems(graph.outputs):
+            outputs[name], covered[name] = cache.load(
+                term, dates, assets, root_mask_values,
+            )
+
+        all_covered = logical_and.reduce(list(itervalues(covered)))
+        for start, stop in _false_runs(all_covered):
+            missing = {
+                name: graph.outputs[name]
+                for name in covered if not covered[name][start:stop].all()
+            }
+            computed, run_dates, _ = self._compute_outputs(
+                TermGraph(missing), dates[start], dates[stop - 1], assets,
+            )
+            for name, values in iteritems(computed):
+                outputs[name][start:stop] = values
+                cache.store(missing[name], run_dates, assets, values)
+
+        return outputs, dates, assets
+
+    def run_chunked_pipeline(self,
+                             pipeline,
+                             start_date,
+                             end_date,
+                             chunksize,
+                             workers=None):
+        """
+        Compute a pipeline in chunks of at most `chunksize` trading days.
+
+        Parameters
+        ----------
+        pipeline : zipline.pipeline.Pipeline
+            The pipeline to run.
+        start_date : pd.Timestamp
+            Start date of the computed matrix.
+        end_date : pd.Timestamp
+            End date of the computed matrix.
+        chunksize : int
+            The maximum number of trading days to compute at once.
+        workers : int, optional
+            The number of worker processes to compute chunks in. If this is
+            None or 1, chunks are computed one after another in this process.
+
+        Returns
+        -------
+        result : pd.DataFrame
+            The same frame that ``run_pipeline(pipeline, start_date,
+            end_date)`` would return.
+
+        Notes
+        -----
+        Each chunk is computed with ``run_pipeline``, so it loads its own
+        ``extra_rows`` of lookback before its first day, and only one chunk's
+        worth of inputs is held in memory by each process at a time.
+
+        Worker processes inherit this engine and `pipeline` when they are
+        forked, so the engine's loaders and asset finder must be usable from a
+        child process. On platforms that cannot fork, they must be picklable.
+        Workers don't read or write the engine's term cache, since a cache
+        directory may only be used by one process at a time.
+
+        See Also
+        --------
+        SimplePipelineEngine.run_pipeline
+        """
+        if end_date < start_date:
+            raise ValueError(
+                "start_date must be before or equal to end_date \n"
+                "start_date=%s, end_date=%s" % (start_date, end_date)
+            )
+        if chunksize < 1:
+            raise ValueError("chunksize must be positive, got %r" % chunksize)
+
+        start_idx, end_idx = self._calendar.slice_locs(start_date, end_date)
+        days = self._calendar[start_idx:end_idx]
+        ranges = [
+            (chunk[0], chunk[-1])
+            for chunk in (
+                days[i:i + chunksize] for i in range(0, len(days), chunksize)
+            )
+        ]
+
+        if not ranges:
+            # No trading days in the range; let run_pipeline complain.
+            return self.run_pipeline(pipeline, start_date, end_date)
+
+        if workers is None or workers <= 1 or len(ranges) == 1:
+            chunks = [
+                self.run_pipeline(pipeline, chunk_start, chunk_end)
+                for chunk_start, chunk_end in ranges
+            ]
+        else:
+            pool = Pool(
+                min(workers, len(ranges)),
+                initializer=_init_chunk_worker,
+                initargs=(self, pipeline),
+            )
+            try:
+                chunks = pool.map(_run_chunk, ranges, chunksize=1)
+            except BaseException:
+                pool.terminate()
+                raise
+            else:
+                pool.close()
+            finally:
+                pool.join()
+
+        return concat(chunks)
+
+    def _compute_root_mask(self,
+                           start_date,
+                           end_date,
+                           extra_rows,
+                           assets=None):
         """
         Compute a lifetimes matrix from our AssetFinder, then drop columns that
         didn't exist at all during the query dates.
@@ -191,6 +398,9 @@ class SimplePipelineEngine(object):
             Number of extra rows to compute before `start_date`.
             Extra rows are needed by terms like moving averages that require a
             trailing window of data.
+        assets : pd.Int64Index, optional
+            If supplied, use exactly these columns rather than those of the
+            assets that existed between `start_date` and `end_date`.
 
         Returns
         -------
@@ -215,10 +425,13 @@ class SimplePipelineEngine(object):
             )
 
         # Build lifetimes matrix reaching back to `extra_rows` days before
-        # `start_date.`
+        # `start_date.`  Only assets that existed on some of these dates are
+        # included, and rows shared with the previous chunk's matrix are
+        # reused.
         lifetimes = finder.lifetimes(
             calendar[start_idx - extra_rows:end_idx],
-            include_start_date=False
+            include_start_date=False,
+            alive_only=True,
         )
 
         assert lifetimes.index[extra_rows] == start_date
@@ -228,10 +441,13 @@ class SimplePipelineEngine(object):
             duplicated = columns[columns.duplicated()].unique()
             raise AssertionError("Duplicated sids: %d" % duplicated)
 
-        # Filter out columns that didn't exist between the requested start and
-        # end dates.
-        existed = lifetimes.iloc[extra_rows:].any()
-        ret = lifetimes.loc[:, existed]
+        if assets is not None:
+            ret = lifetimes.reindex(columns=assets, fill_value=False)
+        else:
+            # Filter out columns that didn't exist between the requested start
+            # and end dates.
+            existed = lifetimes.iloc[extra_rows:].any()
+            ret = lifetimes.loc[:, existed]
         shape = ret.shape
         assert shape[0] * shape[1] != 0, 'root mask cannot be empty'
         return ret
@@ -245,20 +461,26 @@ class SimplePipelineEngine(object):
         return workspace[mask][offset:], dates[offset:]
 
     @staticmethod
-    def _inputs_for_term(term, workspace, graph):
+    def _inputs_for_term(term, workspace, graph, buffers=None):
         """
         Compute inputs for the given term.
 
         This is mostly complicated by the fact that for each input we store as
         many rows as will be necessary to serve **any** computation requiring
         that input.
+
+        If `buffers` is supplied, it should map each of a windowed term's
+        inputs to a buffer from `AdjustedArray.shared_window_buffer` from which
+        to draw its windows.
         """
         offsets = graph.offset
         if term.windowed:
             # If term is windowed, then all input data should be instances of
             # AdjustedArray.
+            if buffers is None:
+                buffers = workspace
             return [
-                workspace[input_].traverse(
+                buffers[input_].traverse(
                     window_length=term.window_length,
                     offset=offsets[term, input_]
                 )
@@ -278,6 +500,76 @@ class SimplePipelineEngine(object):
             out.append(input_data)
         return out
 
+    @staticmethod
+    def _lockstep_group(term, workspace, graph):
+        """
+        Find the windowed terms to compute together with `term`.
+
+        Any uncomputed term that implements `_compute` in terms of a
+        user-defined `compute`, whose dependencies are already in `workspace`,
+        and which shares an input with `term` can be advanced in lockstep with
+        `term` over the same adjusted window buffers.
+
+        For a fixed input, the window for row `i` of every term consuming that
+        input ends on the same row of the input (the `window_length` and
+        `offset` of each term cancel out), so advancing all the terms in the
+        group one row at a time never moves a shared buffer backwards.
+        """
+        if not _computes_in_lockstep(term):
+            return [term]
+
+        inputs = set(term.inputs)
+        return [term] + [
+            other for other in graph
+            if other is not term and
+            other not in workspace and
+            other.windowed and
+            _computes_in_lockstep(other) and
+            not inputs.isdisjoint(other.inputs) and
+            all(dep in workspace for dep in other.dependencies)
+        ]
+
+    def _compute_windowed_terms(self, terms, workspace, graph, dates, assets):
+        """
+        Compute a group of windowed terms over shared window buffers.
+
+        Returns
+        -------
+        results : dict
+            Map from each term in `terms` to its computed output.
+        buffers : list
+            The window buffers used to serve the terms' windows.
+        """
+        buffers = {}
+        for term in terms:
+            for input_ in term.inputs:
+                if input_ not in buffers:
+                    buffers[input_] = workspace[input_].shared_window_buffer()
+
+        results = {}
+        steps = []
+        for term in terms:
+            mask, mask_dates = self._mask_and_dates_for_term(
+                term, workspace, graph, dates
+            )
+            windows = self._inputs_for_term(term, workspace, graph, buffers)
+            if len(terms) == 1:
+                results[term] = term._compute(
+                    windows, mask_dates, assets, mask,
+                )
+            else:
+                out = results[term] = term._allocate_output(mask)
+                steps.append(
+                    term._compute_rows(windows, mask_dates, assets, mask, out)
+                )
+            assert(results[term].shape == mask.shape)
+
+        # Advance every term a row at a time until all are exhausted.
+        for _ in zip_longest(*steps):
+            pass
+
+        return results, list(itervalues(buffers))
+
     def get_loader(self, term):
         return self._get_loader(term)
 
@@ -303,12 +595,27 @@ class SimplePipelineEngine(object):
         -------
         results : dict
             Dictionary mapping requested results to outputs.
+
+        Notes
+        -----
+        Each term's data is dropped from the workspace as soon as the last
+        term that depends on it has been computed, so peak memory is bounded
+        by the terms that are live at once rather than by every term in the
+        graph.
         """
         self._validate_compute_chunk_params(dates, assets, initial_workspace)
         get_loader = self.get_loader
 
         # Copy the supplied initial workspace so we don't mutate it in place.
         workspace = initial_workspace.copy()
+        refcounts = graph.initial_refcounts()
+
+        workspace_bytes = sum(
+            ensure_ndarray(data).nbytes for data in itervalues(workspace)
+        )
+        peak_workspace_bytes = workspace_bytes
+        window_buffer_bytes = 0
+        adjustments_applied = 0
 
         # If loadable terms share the same loader and extra_rows, load them all
         # together.
@@ -320,33 +627,73 @@ class SimplePipelineEngine(object):
             # future we may pre-compute loadable terms coming from the same
             # dataset.  In either case, we will already have an entry for this
             # term, which we shouldn't re-compute.
-            if term in workspace:
-                continue
-
-            # Asset labels are always the same, but date labels vary by how
-            # many extra rows are needed.
-            mask, mask_dates = self._mask_and_dates_for_term(
-                term, workspace, graph, dates
-            )
-
-            if isinstance(term, LoadableTerm):
-                to_load = sorted(
-                    loader_groups[loader_group_key(term)],
-                    key=lambda t: t.dataset
+            if term not in workspace:
+                # Asset labels are always the same, but date labels vary by how
+                # many extra rows are needed.
+                mask, mask_dates = self._mask_and_dates_for_term(
+                    term, workspace, graph, dates
                 )
-                loader = get_loader(term)
-                loaded = loader.load_adjusted_array(
-                    to_load, mask_dates, assets, mask,
+
+                if isinstance(term, LoadableTerm):
+                    to_load = sorted(
+                        loader_groups[loader_group_key(term)],
+                        key=lambda t: t.dataset
+                    )
+                    loader = get_loader(term)
+                    loaded = loader.load_adjusted_array(
+                        to_load, mask_dates, assets, mask,
+                    )
+                    workspace.update(loaded)
+                    workspace_bytes += sum(
+                        ensure_ndarray(data).nbytes
+                        for data in itervalues(loaded)
+                    )
+                elif term.windowed:
+                    # Serve every windowed term that's ready and shares an
+                    # input with `term` from one adjusted copy of each input.
+                    computed, buffers = self._compute_windowed_terms(
+                        self._lockstep_group(term, workspace, graph),
+                        workspace,
+                        graph,
+                        dates,
+                        assets,
+                    )
+                    workspace.update(computed)
+                    workspace_bytes += sum(
+                        data.nbytes for data in itervalues(computed)
+                    )
+                    window_buffer_bytes += sum(b.nbytes for b in buffers)
+                    adjustments_applied += sum(
+                        b.adjustments_applied for b in buffers
+                    )
+                else:
+                    workspace[term] = term._compute(
+                        self._inputs_for_term(term, workspace, graph),
+                        mask_dates,
+                        assets,
+                        mask,
+                    )
+                    assert(workspace[term].shape == mask.shape)
+                    workspace_bytes += workspace[term].nbytes
+
+                peak_workspace_bytes = max(
+                    peak_workspace_bytes, workspace_bytes,
                 )
-                workspace.update(loaded)
-            else:
-                workspace[term] = term._compute(
-                    self._inputs_for_term(term, workspace, graph),
-                    mask_dates,
-                    assets,
-                    mask,
+
+            # Release any inputs that no remaining term needs.
+            for garbage in graph.decref_dependencies(term, refcounts):
+                data = workspace.pop(garbage, None)
+                if data is not None:
+                    workspace_bytes -= ensure_ndarray(data).nbytes
+
+        if self._report_stats is not None:
+            self._report_stats(
+                PipelineStats(
+                    peak_workspace_bytes=peak_workspace_bytes,
+                    window_buffer_bytes=window_buffer_bytes,
+                    adjustments_applied=adjustments_applied,
                 )
-                assert(workspace[term].shape == mask.shape)
+            )
 
         out = {}
         graph_extra_rows = graph.extra_rows
@@ -436,3 +783,47 @@ class SimplePipelineEngine(object):
                     implied=implied_shape,
                 )
             )
+
+
+# The engine and pipeline used by the worker processes of
+# SimplePipelineEngine.run_chunked_pipeline.
+_chunk_worker_state = None
+
+
+def _computes_in_lockstep(term):
+    """
+    Can `term` be computed a row at a time with `_compute_rows`?
+    """
+    return (
+        isinstance(term, CustomTermMixin) and
+        get_unbound_function(type(term)._compute) is
+        get_unbound_function(CustomTermMixin._compute)
+    )
+
+
+def _false_runs(flags):
+    """
+    Find the contiguous runs of False values in a boolean array.
+
+    Returns
+    -------
+    runs : list[(int, int)]
+        The (start, stop) indices of each run.
+    """
+    padded = concatenate(([True], flags, [True]))
+    edges = flatnonzero(padded[1:] != padded[:-1])
+    return list(zip(edges[::2], edges[1::2]))
+
+
+def _init_chunk_worker(engine, pipeline):
+    global _chunk_worker_state
+    # A term cache's directory may only be used by one process at a time, so
+    # workers compute every term.
+    engine._term_cache = None
+    _chunk_worker_state = engine, pipeline
+
+
+def _run_chunk(dates):
+    engine, pipeline = _chunk_worker_state
+    start_date, end_date = dates
+    return engine.run_pipeline(pipeline, start_date, end_date)
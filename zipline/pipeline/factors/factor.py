@@ -31,9 +31,11 @@ from zipline.pipeline.expression import (
     unary_op_name,
 )
 from zipline.pipeline.filters import (
+    BottomN,
     NumExprFilter,
     PercentileFilter,
     NullFilter,
+    TopN,
 )
 from zipline.utils.control_flow import nullctx
 from zipline.utils.numpy_utils import (
@@ -451,9 +453,14 @@ class Factor(ComputableTerm):
 
         Returns
         -------
-        filter : zipline.pipeline.filters.Filter
+        filter : zipline.pipeline.filters.TopN
+
+        Notes
+        -----
+        The result is the same as ``self.rank(ascending=False, mask=mask) <=
+        N``, but is computed without sorting each day's values.
         """
-        return self.rank(ascending=False, mask=mask) <= N
+        return TopN(self, N=N, mask=mask)
 
     def bottom(self, N, mask=NotSpecified):
         """
@@ -470,9 +477,14 @@ class Factor(ComputableTerm):
 
         Returns
         -------
-        filter : zipline.pipeline.Filter
+        filter : zipline.pipeline.filters.BottomN
+
+        Notes
+        -----
+        The result is the same as ``self.rank(ascending=True, mask=mask) <=
+        N``, but is computed without sorting each day's values.
         """
-        return self.rank(ascending=True, mask=mask) <= N
+        return BottomN(self, N=N, mask=mask)
 
     def percentile_between(self,
                            min_percentile,
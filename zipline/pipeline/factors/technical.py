@@ -9,31 +9,48 @@ from numpy import (
     average,
     clip,
     diff,
+    empty_like,
     exp,
-    fmax,
     full,
     inf,
-    isnan,
     log,
-    NINF,
+    newaxis,
     sqrt,
     sum as np_sum,
 )
 from numexpr import evaluate
 
+from zipline.lib.adjusted_array import window_region
+from zipline.lib.rolling import (
+    rolling_ewma,
+    rolling_ewmstd,
+    rolling_max_drawdown,
+    rolling_nanmean,
+    rolling_nansum,
+)
 from zipline.pipeline.data import USEquityPricing
 from zipline.pipeline.mixins import SingleInputMixin
 from zipline.utils.control_flow import ignore_nanwarnings
 from zipline.utils.input_validation import expect_types
 from zipline.utils.math_utils import (
-    nanargmax,
-    nanmax,
     nanmean,
     nansum,
 )
+from zipline.utils.numpy_utils import float64_dtype
 from .factor import CustomFactor
 
 
+def _float64_region(windows):
+    """
+    Return the rows spanned by a block of windows if they can be passed to
+    the kernels in `zipline.lib.rolling`, or None if they can't.
+    """
+    region = window_region(windows)
+    if region is None or region.dtype != float64_dtype:
+        return None
+    return region
+
+
 class Returns(CustomFactor):
     """
     Calculates the percent change in close price over the given window_length.
@@ -45,6 +62,9 @@ class Returns(CustomFactor):
     def compute(self, today, assets, out, close):
         out[:] = (close[-1] - close[0]) / close[0]
 
+    def compute_all(self, dates, assets, out, close):
+        out[:] = (close[:, -1] - close[:, 0]) / close[:, 0]
+
 
 class RSI(CustomFactor, SingleInputMixin):
     """
@@ -58,9 +78,29 @@ class RSI(CustomFactor, SingleInputMixin):
     inputs = (USEquityPricing.close,)
 
     def compute(self, today, assets, out, closes):
-        diffs = diff(closes, axis=0)
-        ups = nanmean(clip(diffs, 0, inf), axis=0)
-        downs = abs(nanmean(clip(diffs, -inf, 0), axis=0))
+        self._rsi(out, closes, axis=0)
+
+    def compute_all(self, dates, assets, out, closes):
+        region = _float64_region(closes)
+        if region is None or closes.shape[1] < 2:
+            return self._rsi(out, closes, axis=1)
+
+        diffs = diff(region, axis=0)
+        ups = empty_like(out)
+        downs = empty_like(out)
+        rolling_nanmean(clip(diffs, 0, inf), closes.shape[1] - 1, ups)
+        rolling_nanmean(clip(diffs, -inf, 0), closes.shape[1] - 1, downs)
+        return self._relative_strength(out, ups, abs(downs))
+
+    @classmethod
+    def _rsi(cls, out, closes, axis):
+        diffs = diff(closes, axis=axis)
+        ups = nanmean(clip(diffs, 0, inf), axis=axis)
+        downs = abs(nanmean(clip(diffs, -inf, 0), axis=axis))
+        return cls._relative_strength(out, ups, downs)
+
+    @staticmethod
+    def _relative_strength(out, ups, downs):
         return evaluate(
             "100 - (100 / (1 + (ups / downs)))",
             local_dict={'ups': ups, 'downs': downs},
@@ -85,6 +125,13 @@ class SimpleMovingAverage(CustomFactor, SingleInputMixin):
     def compute(self, today, assets, out, data):
         out[:] = nanmean(data, axis=0)
 
+    def compute_all(self, dates, assets, out, data):
+        region = _float64_region(data)
+        if region is None:
+            out[:] = nanmean(data, axis=1)
+        else:
+            rolling_nanmean(region, data.shape[1], out)
+
 
 class WeightedAverageValue(CustomFactor):
     """
@@ -97,6 +144,18 @@ class WeightedAverageValue(CustomFactor):
     def compute(self, today, assets, out, base, weight):
         out[:] = nansum(base * weight, axis=0) / nansum(weight, axis=0)
 
+    def compute_all(self, dates, assets, out, base, weight):
+        base_region = _float64_region(base)
+        weight_region = _float64_region(weight)
+        if base_region is None or weight_region is None:
+            out[:] = nansum(base * weight, axis=1) / nansum(weight, axis=1)
+            return
+
+        weight_sums = empty_like(out)
+        rolling_nansum(base_region * weight_region, base.shape[1], out)
+        rolling_nansum(weight_region, weight.shape[1], weight_sums)
+        out /= weight_sums
+
 
 class VWAP(WeightedAverageValue):
     """
@@ -120,14 +179,18 @@ class MaxDrawdown(CustomFactor, SingleInputMixin):
     ctx = ignore_nanwarnings()
 
     def compute(self, today, assets, out, data):
-        drawdowns = fmax.accumulate(data, axis=0) - data
-        drawdowns[isnan(drawdowns)] = NINF
-        drawdown_ends = nanargmax(drawdowns, axis=0)
+        rolling_max_drawdown(
+            data.astype(float64_dtype, copy=False),
+            len(data),
+            out[newaxis],
+        )
 
-        # TODO: Accelerate this loop in Cython or Numba.
-        for i, end in enumerate(drawdown_ends):
-            peak = nanmax(data[:end + 1, i])
-            out[i] = (peak - data[end, i]) / data[end, i]
+    def compute_all(self, dates, assets, out, data):
+        region = _float64_region(data)
+        if region is not None:
+            return rolling_max_drawdown(region, data.shape[1], out)
+        for i, window in enumerate(data):
+            self.compute(dates[i], assets, out[i], window)
 
 
 class AverageDollarVolume(CustomFactor):
@@ -143,6 +206,18 @@ class AverageDollarVolume(CustomFactor):
     def compute(self, today, assets, out, close, volume):
         out[:] = nanmean(close * volume, axis=0)
 
+    def compute_all(self, dates, assets, out, close, volume):
+        close_region = _float64_region(close)
+        volume_region = _float64_region(volume)
+        if close_region is None or volume_region is None:
+            out[:] = nanmean(close * volume, axis=1)
+        else:
+            rolling_nanmean(
+                close_region * volume_region,
+                close.shape[1],
+                out,
+            )
+
 
 class _ExponentialWeightedFactor(SingleInputMixin, CustomFactor):
     """
@@ -348,6 +423,16 @@ class ExponentialWeightedMovingAverage(_ExponentialWeightedFactor):
             weights=self.weights(len(data), decay_rate),
         )
 
+    def compute_all(self, dates, assets, out, data, decay_rate):
+        region = _float64_region(data)
+        if region is not None:
+            return rolling_ewma(region, data.shape[1], decay_rate, out)
+        out[:] = average(
+            data,
+            axis=1,
+            weights=self.weights(data.shape[1], decay_rate),
+        )
+
 
 class ExponentialWeightedMovingStdDev(_ExponentialWeightedFactor):
     """
@@ -386,11 +471,30 @@ class ExponentialWeightedMovingStdDev(_ExponentialWeightedFactor):
         mean = average(data, axis=0, weights=weights)
         variance = average((data - mean) ** 2, axis=0, weights=weights)
 
+        out[:] = sqrt(variance * self._bias_correction(weights))
+
+    def compute_all(self, dates, assets, out, data, decay_rate):
+        region = _float64_region(data)
+        if region is not None:
+            return rolling_ewmstd(region, data.shape[1], decay_rate, out)
+
+        weights = self.weights(data.shape[1], decay_rate)
+
+        mean = average(data, axis=1, weights=weights)
+        variance = average(
+            (data - mean[:, newaxis]) ** 2,
+            axis=1,
+            weights=weights,
+        )
+
+        out[:] = sqrt(variance * self._bias_correction(weights))
+
+    @staticmethod
+    def _bias_correction(weights):
         squared_weight_sum = (np_sum(weights) ** 2)
-        bias_correction = (
+        return (
             squared_weight_sum / (squared_weight_sum - np_sum(weights ** 2))
         )
-        out[:] = sqrt(variance * bias_correction)
 
 
 # Convenience aliases.
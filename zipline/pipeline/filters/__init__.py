@@ -1,10 +1,19 @@
-from .filter import Filter, NumExprFilter, NullFilter, PercentileFilter
+from .filter import (
+    BottomN,
+    Filter,
+    NumExprFilter,
+    NullFilter,
+    PercentileFilter,
+    TopN,
+)
 from .latest import Latest
 
 __all__ = [
+    'BottomN',
     'Filter',
     'Latest',
     'NumExprFilter',
     'NullFilter',
     'PercentileFilter',
+    'TopN',
 ]
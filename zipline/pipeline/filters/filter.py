@@ -1,11 +1,6 @@
 """
 filter.py
 """
-from numpy import (
-    float64,
-    nan,
-    nanpercentile,
-)
 from itertools import chain
 from operator import attrgetter
 
@@ -13,7 +8,11 @@ from zipline.errors import (
     BadPercentileBounds,
     UnsupportedDataType,
 )
-from zipline.lib.rank import ismissing
+from zipline.lib.rank import (
+    ismissing,
+    masked_between_percentiles_2d,
+    masked_select_n_2d,
+)
 from zipline.pipeline.mixins import (
     CustomTermMixin,
     PositiveWindowLengthMixin,
@@ -248,28 +247,94 @@ class PercentileFilter(SingleInputMixin, Filter):
         For each row in the input, compute a mask of all values falling between
         the given percentiles.
         """
-        # TODO: Review whether there's a better way of handling small numbers
-        # of columns.
-        data = arrays[0].copy().astype(float64)
-        data[~mask] = nan
-
-        # FIXME: np.nanpercentile **should** support computing multiple bounds
-        # at once, but there's a bug in the logic for multiple bounds in numpy
-        # 1.9.2.  It will be fixed in 1.10.
-        # c.f. https://github.com/numpy/numpy/pull/5981
-        lower_bounds = nanpercentile(
-            data,
+        return masked_between_percentiles_2d(
+            arrays[0],
+            mask,
             self._min_percentile,
-            axis=1,
-            keepdims=True,
-        )
-        upper_bounds = nanpercentile(
-            data,
             self._max_percentile,
-            axis=1,
-            keepdims=True,
         )
-        return (lower_bounds <= data) & (data <= upper_bounds)
+
+
+class TopN(SingleInputMixin, Filter):
+    """
+    A Filter matching the N assets with the highest values of a Factor each
+    day.
+
+    Parameters
+    ----------
+    factor : zipline.pipeline.factor.Factor
+        The factor whose values are compared.
+    N : int
+        Number of assets passing the filter each day.
+
+    Notes
+    -----
+    Ties are broken in favor of the asset with the lower column index, so the
+    result is the same as ``factor.rank(ascending=False) <= N``.  Assets are
+    selected by partitioning each row of the factor rather than sorting it.
+    """
+    window_length = 0
+    _ascending = False
+
+    def __new__(cls, factor, N, mask):
+        return super(TopN, cls).__new__(
+            cls,
+            inputs=(factor,),
+            mask=mask,
+            N=N,
+        )
+
+    def _init(self, N, *args, **kwargs):
+        self._N = N
+        return super(TopN, self)._init(*args, **kwargs)
+
+    @classmethod
+    def static_identity(cls, N, *args, **kwargs):
+        return (
+            super(TopN, cls).static_identity(*args, **kwargs),
+            N,
+        )
+
+    def _compute(self, arrays, dates, assets, mask):
+        """
+        For each row in the input, compute a mask of the N highest (or
+        lowest) values.
+        """
+        return masked_select_n_2d(
+            arrays[0],
+            mask,
+            self.inputs[0].missing_value,
+            self._N,
+            self._ascending,
+        )
+
+    def __repr__(self):
+        return "{type}({input_}, N={N}, mask={mask})".format(
+            type=type(self).__name__,
+            input_=self.inputs[0],
+            N=self._N,
+            mask=self.mask,
+        )
+
+
+class BottomN(TopN):
+    """
+    A Filter matching the N assets with the lowest values of a Factor each
+    day.
+
+    Parameters
+    ----------
+    factor : zipline.pipeline.factor.Factor
+        The factor whose values are compared.
+    N : int
+        Number of assets passing the filter each day.
+
+    Notes
+    -----
+    Ties are broken in favor of the asset with the lower column index, so the
+    result is the same as ``factor.rank(ascending=True) <= N``.
+    """
+    _ascending = True
 
 
 class CustomFilter(PositiveWindowLengthMixin, CustomTermMixin, Filter):
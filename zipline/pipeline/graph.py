@@ -164,6 +164,49 @@ class TermGraph(DiGraph):
         """
         return iter(self._ordered)
 
+    def initial_refcounts(self):
+        """
+        Calculate initial refcounts for execution of this graph.
+
+        Returns
+        -------
+        refcounts : dict[Term -> int]
+            Map from each term to the number of terms that still need it.
+            Each term starts with a refcount equal to its out-degree, and
+            output terms get one extra reference so that they are never
+            released.
+        """
+        refcounts = self.out_degree()
+        for term in itervalues(self.outputs):
+            refcounts[term] += 1
+        return refcounts
+
+    def decref_dependencies(self, term, refcounts):
+        """
+        Decrement the refcounts of the inputs of ``term`` after it has been
+        computed.
+
+        Parameters
+        ----------
+        term : zipline.pipeline.Term
+            The term that was just computed.
+        refcounts : dict[Term -> int]
+            Dictionary of refcounts.
+
+        Returns
+        -------
+        garbage : set[Term]
+            Terms whose refcounts hit zero, i.e. terms that no remaining term
+            depends on.
+        """
+        garbage = set()
+        # Edges are tuples of (dependency, dependent).
+        for dependency, _ in self.in_edges([term]):
+            refcounts[dependency] -= 1
+            if refcounts[dependency] == 0:
+                garbage.add(dependency)
+        return garbage
+
     @lazyval
     def loadable_terms(self):
         return tuple(term for term in self if isinstance(term, LoadableTerm))
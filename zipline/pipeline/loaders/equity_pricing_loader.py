@@ -17,10 +17,11 @@ from numpy import (
 )
 
 from zipline.data.us_equity_pricing import (
+    BcolzCumulativeAdjustmentReader,
     BcolzDailyBarReader,
     SQLiteAdjustmentReader,
 )
-from zipline.lib.adjusted_array import AdjustedArray
+from zipline.lib.adjusted_array import AdjustedArray, CumulativeAdjustedArray
 from zipline.errors import NoFurtherDataError
 
 from .base import PipelineLoader
@@ -33,6 +34,16 @@ class USEquityPricingLoader(PipelineLoader):
     PipelineLoader for US Equity Pricing data
 
     Delegates loading of baselines and adjustments.
+
+    Parameters
+    ----------
+    raw_price_loader : BcolzDailyBarReader
+        Reader providing raw prices.
+    adjustments_loader : SQLiteAdjustmentReader
+        Reader providing adjustments.  A BcolzCumulativeAdjustmentReader may
+        be passed instead, in which case we produce CumulativeAdjustedArrays,
+        whose windows are adjusted with a single multiplication instead of by
+        applying each adjustment.
     """
 
     def __init__(self, raw_price_loader, adjustments_loader):
@@ -76,7 +87,20 @@ class USEquityPricingLoader(PipelineLoader):
             end_date,
             assets,
         )
-        adjustments = self.adjustments_loader.load_adjustments(
+        adjustments_loader = self.adjustments_loader
+        if isinstance(adjustments_loader, BcolzCumulativeAdjustmentReader):
+            factors = adjustments_loader.load_factors(columns, dates, assets)
+            return {
+                c: CumulativeAdjustedArray(
+                    c_raw.astype(c.dtype),
+                    mask,
+                    c_factors,
+                    c.missing_value,
+                )
+                for c, c_raw, c_factors in zip(columns, raw_arrays, factors)
+            }
+
+        adjustments = adjustments_loader.load_adjustments(
             columns,
             dates,
             assets,
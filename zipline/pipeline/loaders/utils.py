@@ -2,8 +2,6 @@ import datetime
 
 import numpy as np
 import pandas as pd
-from six import iteritems
-from six.moves import zip
 
 from zipline.utils.numpy_utils import NaTns
 
@@ -15,7 +13,7 @@ def next_date_frame(dates, events_by_sid, event_date_field_name):
     Parameters
     ----------
     dates : pd.DatetimeIndex.
-        The index of the returned DataFrame.
+        The index of the returned DataFrame.  These must be sorted.
     events_by_sid : dict[int -> pd.Series]
         Dict mapping sids to a series of dates. Each k:v pair of the series
         represents the date we learned of the event mapping to the date the
@@ -31,33 +29,72 @@ def next_date_frame(dates, events_by_sid, event_date_field_name):
         had on the date of the index. Entries falling after the last date will
         have `NaT` as the result in the output.
 
+    Notes
+    -----
+    The events of every sid are flattened into arrays sorted by sid and event
+    date.  Each event is the next known event on the rows between the one on
+    which it's learned and the one on which it occurs, unless an earlier event
+    is also known.  For sids whose events are learned in the order in which
+    they occur, an event is therefore the next event from the later of the row
+    on which it's learned and the row after the previous event, so the ranges
+    of rows of each event are disjoint and are written directly.  For other
+    sids, the next event on each row is found by sorting the rows covered by
+    every event.
 
     See Also
     --------
     previous_date_frame
     """
-    cols = {
-        equity: np.full_like(dates, NaTns) for equity in events_by_sid
-    }
-    raw_dates = dates.values
-    for equity, df in iteritems(events_by_sid):
-        event_dates = df[event_date_field_name]
-        data = cols[equity]
-        if not event_dates.index.is_monotonic_increasing:
-            event_dates = event_dates.sort_index()
-
-        # Iterate over the raw Series values, since we're comparing against
-        # numpy arrays anyway.
-        iterkv = zip(event_dates.index.values, event_dates.values)
-        for knowledge_date, event_date in iterkv:
-            date_mask = (
-                (knowledge_date <= raw_dates) &
-                (raw_dates <= event_date)
-            )
-            value_mask = (event_date <= data) | (data == NaTns)
-            data[date_mask & value_mask] = event_date
-
-    return pd.DataFrame(index=dates, data=cols)
+    if not events_by_sid:
+        return pd.DataFrame(index=dates, data={})
+
+    sids = sorted(events_by_sid)
+    columns, knowledge_dates, (event_dates,) = _flatten_events(
+        events_by_sid,
+        sids,
+        [event_date_field_name],
+    )
+    event_dates = event_dates.astype('datetime64[ns]').view('int64')
+
+    out = np.full((len(dates), len(sids)), NaTns, dtype='datetime64[ns]')
+    raw_out = out.view('int64')
+    raw_dates = dates.asi8
+
+    # Each event is known, and hasn't yet occurred, on rows[starts:ends].
+    starts = raw_dates.searchsorted(knowledge_dates, side='left')
+    ends = raw_dates.searchsorted(event_dates, side='right')
+    order = np.lexsort((starts, event_dates, columns))
+    order = order[starts[order] < ends[order]]
+    columns = columns[order]
+    starts = starts[order]
+    ends = ends[order]
+    event_dates = event_dates[order]
+
+    first_in_column = np.ones(len(columns), dtype=bool)
+    first_in_column[1:] = columns[1:] != columns[:-1]
+    learned_early = np.zeros(len(columns), dtype=bool)
+    learned_early[1:] = (starts[1:] < starts[:-1]) & ~first_in_column[1:]
+    in_order = ~np.in1d(columns, columns[learned_early])
+
+    # Events learned in order are the next event from the row after the
+    # previous event occurs.
+    previous_ends = np.zeros(len(ends), dtype=ends.dtype)
+    previous_ends[1:] = ends[:-1]
+    previous_ends[first_in_column] = 0
+    rows, events = _expand_ranges(
+        np.maximum(starts, previous_ends)[in_order],
+        ends[in_order],
+    )
+    raw_out[rows, columns[in_order][events]] = event_dates[in_order][events]
+
+    # Events are sorted by event date, so the first event covering a cell is
+    # the next event on that cell's date.
+    rows, events = _expand_ranges(starts[~in_order], ends[~in_order])
+    cells = rows * len(sids) + columns[~in_order][events]
+    cells, first = np.unique(cells, return_index=True)
+    raw_out.flat[cells] = event_dates[~in_order][events[first]]
+
+    return pd.DataFrame(out, index=dates, columns=sids)
 
 
 def previous_event_frame(events_by_sid,
@@ -107,28 +144,105 @@ def previous_event_frame(events_by_sid,
         missing_value,
         dtype=field_dtype
     )
-    d_n = date_index[-1].asm8
-    for col_idx, sid in enumerate(sids):
-        # events_by_sid[sid] is a DataFrame mapping knowledge_date to event
-        # date and values.
-        df = events_by_sid[sid]
-        df = df[df[event_date_field] <= d_n]
-        event_date_vals = df[event_date_field].values
-        # Get knowledge dates corresponding to the values in which we are
-        # interested
-        kd_vals = df[df[event_date_field] <= d_n].index.values
-        # The date at which a previous event is first known is the max of the
-        #  kd and the event date.
-        index_dates = np.maximum(kd_vals, event_date_vals)
-        out[
-            date_index.searchsorted(index_dates), col_idx
-        ] = df[previous_return_field]
+    columns, knowledge_dates, (event_dates, values) = _flatten_events(
+        events_by_sid,
+        sids,
+        [event_date_field, previous_return_field],
+    )
+    event_dates = event_dates.astype('datetime64[ns]').view('int64')
+    raw_dates = date_index.asi8
+
+    # The date at which a previous event is first known is the max of the kd
+    # and the event date.  Events which occur after the last date, or which
+    # aren't known by then, never become previous events.
+    occurred = (event_dates != NaTns.view('int64')) & (
+        event_dates <= raw_dates[-1]
+    )
+    rows = raw_dates.searchsorted(
+        np.maximum(knowledge_dates[occurred], event_dates[occurred]),
+    )
+    known = rows < len(raw_dates)
+    rows = rows[known]
+    columns = columns[occurred][known]
+    values = values[occurred][known]
+
+    # If several events of a sid are first known on the same date, the last
+    # one wins.
+    cells = rows * len(sids) + columns
+    _, last = np.unique(cells[::-1], return_index=True)
+    last = len(cells) - 1 - last
+    out[rows[last], columns[last]] = values[last]
 
     frame = pd.DataFrame(out, index=date_index, columns=sids)
     frame.ffill(inplace=True)
     return frame
 
 
+def _flatten_events(events_by_sid, sids, fields):
+    """
+    Concatenate the events of each sid in `sids`.
+
+    Parameters
+    ----------
+    events_by_sid : dict[int -> pd.DataFrame]
+        Dict mapping sids to a frame of events indexed by the date on which
+        we learned of each event.
+    sids : list[int]
+        The sids whose events should be concatenated.
+    fields : list[str]
+        The columns of the events to concatenate.
+
+    Returns
+    -------
+    columns : np.ndarray[int64]
+        The position in `sids` of the sid of each event.
+    knowledge_dates : np.ndarray[int64]
+        The date on which we learned of each event, as nanoseconds since the
+        epoch.
+    values : list[np.ndarray]
+        The value of each of `fields` for each event.
+    """
+    frames = [
+        (column, events_by_sid[sid])
+        for column, sid in enumerate(sids)
+        if len(events_by_sid[sid])
+    ]
+    if not frames:
+        empty = np.array([], dtype='int64')
+        return empty, empty, [empty] * len(fields)
+
+    columns = np.repeat(
+        np.array([column for column, _ in frames], dtype='int64'),
+        [len(frame) for _, frame in frames],
+    )
+    knowledge_dates = np.concatenate([
+        frame.index.values.astype('datetime64[ns]') for _, frame in frames
+    ]).view('int64')
+    values = [
+        np.concatenate([frame[field].values for _, frame in frames])
+        for field in fields
+    ]
+    return columns, knowledge_dates, values
+
+
+def _expand_ranges(starts, ends):
+    """
+    Expand the half-open ranges ``[starts[i], ends[i])`` into the rows they
+    contain.
+
+    Returns
+    -------
+    rows : np.ndarray[int64]
+        The rows contained in each range, range by range.
+    ranges : np.ndarray[int64]
+        The index of the range containing each of `rows`.
+    """
+    lengths = np.maximum(ends - starts, 0)
+    ranges = np.repeat(np.arange(len(lengths)), lengths)
+    offsets = np.cumsum(lengths) - lengths - starts
+    return np.arange(len(ranges)) - offsets[ranges], ranges
+
+
 def normalize_data_query_time(dt, time, tz):
     """Apply the correct time and timezone to a date.
 
@@ -6,6 +6,10 @@ from zipline.errors import WindowLengthNotPositive
 
 from .term import NotSpecified
 
+# Upper bound on the number of cells in each 3D block of windows passed to a
+# term's `compute_all`.
+MAX_BLOCK_CELLS = 2 ** 22
+
 
 class PositiveWindowLengthMixin(object):
     """
@@ -69,6 +73,9 @@ class CustomTermMixin(object):
             **kwargs
         )
 
+    # Optional vectorized alternative to `compute`.  See `_compute_rows`.
+    compute_all = None
+
     def compute(self, today, assets, out, *arrays):
         """
         Override this method with a function that writes a value into `out`.
@@ -80,24 +87,100 @@ class CustomTermMixin(object):
         Call the user's `compute` function on each window with a pre-built
         output array.
         """
+        out = self._allocate_output(mask)
+        for _ in self._compute_rows(windows, dates, assets, mask, out):
+            pass
+        return out
+
+    def _allocate_output(self, mask):
+        """
+        Allocate an array shaped like `mask` to hold our output, pre-filled
+        with `missing_value`.
+        """
+        return full_like(mask, self.missing_value, dtype=self.dtype)
+
+    @classmethod
+    def _uses_compute_all(cls):
+        """
+        Whether `compute_all` can stand in for our `compute`.
+
+        A subclass that overrides `compute` without also overriding
+        `compute_all` must have its own `compute` called, so `compute_all` is
+        only used when it is defined no higher in our MRO than `compute`.
+        """
+        if cls.compute_all is None:
+            return False
+        return issubclass(
+            _defining_class(cls, 'compute_all'),
+            _defining_class(cls, 'compute'),
+        )
+
+    def _compute_rows(self, windows, dates, assets, mask, out):
+        """
+        Generator version of `_compute` that yields once for each row of a
+        pre-allocated `out`.
+
+        This lets the engine advance several terms over windows drawn from a
+        shared buffer in lockstep.  Our context is entered separately for
+        each call to the user's function, so that it isn't left active while
+        other terms are being computed.
+
+        If the term defines ``compute_all(dates, assets, out, *arrays)`` and
+        our windows can be served in blocks, it is called instead of
+        `compute` on as many consecutive rows at a time as possible, with
+        ``out`` a 2D view of those rows and each array a read-only 3D array
+        whose ``i``th entry is the window `compute` would have received for
+        ``dates[i]``.  All rows of a block are computed on the first step,
+        and the remaining steps only yield.
+        """
         # TODO: Make mask available to user's `compute`.
-        compute = self.compute
-        missing_value = self.missing_value
         params = self.params
-        out = full_like(mask, missing_value, dtype=self.dtype)
-        with self.ctx:
+        ctx = self.ctx
+        if self._uses_compute_all() and all(
+                hasattr(w, 'next_block') for w in windows):
+            compute_all = self.compute_all
+            nrows = len(dates)
+            max_rows = max(
+                1,
+                MAX_BLOCK_CELLS // (self.window_length * max(len(assets), 1)),
+            )
+            idx = 0
+            while idx < nrows:
+                limit = min(nrows - idx, max_rows)
+                block_rows = min(
+                    [limit] + [w.block_size(limit) for w in windows]
+                )
+                stop = idx + block_rows
+                with ctx:
+                    compute_all(
+                        dates[idx:stop],
+                        assets,
+                        out[idx:stop],
+                        *(w.next_block(block_rows) for w in windows),
+                        **params
+                    )
+                for _ in range(block_rows):
+                    yield
+                idx = stop
+        else:
+            compute = self.compute
             # TODO: Consider pre-filtering columns that are all-nan at each
             # time-step?
             for idx, date in enumerate(dates):
-                compute(
-                    date,
-                    assets,
-                    out[idx],
-                    *(next(w) for w in windows),
-                    **params
-                )
-        out[~mask] = missing_value
-        return out
+                with ctx:
+                    compute(
+                        date,
+                        assets,
+                        out[idx],
+                        *(next(w) for w in windows),
+                        **params
+                    )
+                yield
+        out[~mask] = self.missing_value
 
     def short_repr(self):
         return type(self).__name__ + '(%d)' % self.window_length
+
+
+def _defining_class(cls, name):
+    return next(c for c in cls.__mro__ if name in vars(c))
@@ -96,6 +96,9 @@ class Term(with_metaclass(ABCMeta, object)):
                     params=params,
                     *args, **kwargs
                 )
+            # Keep the identity so that persistent caches can derive keys for
+            # this term.  c.f. zipline.pipeline.cache.
+            new_instance._identity = identity
             return new_instance
 
     @classmethod
@@ -41,7 +41,8 @@ DATASOURCE_TYPE = enum(
     'CUSTOM',
     'BENCHMARK',
     'COMMISSION',
-    'CLOSE_POSITION'
+    'CLOSE_POSITION',
+    'TRADE_SNAPSHOT'
 )
 
 # Expected fields/index values for a dividend Series.
@@ -128,6 +129,85 @@ class Order(Event):
     pass
 
 
+class TradeSnapshot(Event):
+    """
+    Trades for many sids at a single dt, stored as parallel arrays.
+
+    Sources can emit one TradeSnapshot per dt instead of one TRADE Event per
+    (dt, sid). AlgorithmSimulator updates the universe directly from the
+    arrays, and only materializes TRADE Events for the sids that the blotter
+    or the position tracker need to see.
+
+    Parameters
+    ----------
+    dt : pd.Timestamp
+        The datetime of every trade in the snapshot.
+    sids : np.ndarray
+        The sid of each trade.
+    price : np.ndarray[float64]
+        The price of each trade.
+    volume : np.ndarray[int64]
+        The volume of each trade.
+    source_id : str
+        The id of the source that emitted the snapshot.
+    """
+    def __init__(self, dt, sids, price, volume, source_id):
+        self.type = DATASOURCE_TYPE.TRADE_SNAPSHOT
+        self.dt = dt
+        self.sids = sids
+        self.price = price
+        self.volume = volume
+        self.source_id = source_id
+
+    def __len__(self):
+        return len(self.sids)
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, TradeSnapshot) and
+            self.dt == other.dt and
+            self.source_id == other.source_id and
+            np.array_equal(self.sids, other.sids) and
+            np.array_equal(self.price, other.price) and
+            np.array_equal(self.volume, other.volume)
+        )
+
+    def __ne__(self, other):
+        return not self == other
+
+    def trades(self, sids=None):
+        """
+        Materialize TRADE Events for the trades in this snapshot.
+
+        Parameters
+        ----------
+        sids : container, optional
+            If supplied, only materialize trades for sids in ``sids``.
+
+        Returns
+        -------
+        trades : list[Event]
+        """
+        dt = self.dt
+        source_id = self.source_id
+        return [
+            Event({
+                'type': DATASOURCE_TYPE.TRADE,
+                'dt': dt,
+                'sid': sid,
+                'price': price,
+                'volume': volume,
+                'source_id': source_id,
+            })
+            for sid, price, volume in zip(
+                self.sids.tolist(),
+                self.price.tolist(),
+                self.volume.tolist(),
+            )
+            if sids is None or sid in sids
+        ]
+
+
 class Portfolio(object):
 
     def __init__(self):
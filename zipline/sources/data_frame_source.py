@@ -20,6 +20,7 @@ import numpy as np
 import pandas as pd
 
 from zipline.gens.utils import hash_args
+from zipline.protocol import Event, TradeSnapshot
 
 from zipline.sources.data_source import DataSource
 
@@ -34,15 +35,22 @@ class DataFrameSource(DataSource):
 
     :Note:
         Bars where the price is nan are filtered out.
+
+    :Columnar mode:
+        If ``columnar=True``, the source yields one
+        :class:`~zipline.protocol.TradeSnapshot` per dt, carrying arrays of
+        the sids, prices and volumes traded at that dt, instead of one Event
+        per (dt, sid).
     """
 
-    def __init__(self, data, **kwargs):
+    def __init__(self, data, columnar=False, **kwargs):
         assert isinstance(data.index, pd.tseries.index.DatetimeIndex)
         # Only accept integer SIDs as the items of the DataFrame
         assert isinstance(data.columns, pd.Int64Index)
         # TODO is ffilling correct/necessary?
         # Forward fill prices
         self.data = data.fillna(method='ffill')
+        self.columnar = columnar
         # Unpack config dictionary with default values.
         self.start = kwargs.get('start', self.data.index[0])
         self.end = kwargs.get('end', self.data.index[-1])
@@ -68,31 +76,87 @@ class DataFrameSource(DataSource):
     def instance_hash(self):
         return self.arg_string
 
+    def _raw_rows(self, dt, series):
+        for sid, price in series.iteritems():
+            # Skip SIDs that can not be forward filled
+            if np.isnan(price) and \
+               sid not in self.started_sids:
+                continue
+            self.started_sids.add(sid)
+
+            event = {
+                'dt': dt,
+                'sid': sid,
+                'price': price,
+                # Just chose something large
+                # if no volume available.
+                'volume': 1e9,
+            }
+            yield event
+
     def raw_data_gen(self):
         for dt, series in self.data.iterrows():
-            for sid, price in series.iteritems():
-                # Skip SIDs that can not be forward filled
-                if np.isnan(price) and \
-                   sid not in self.started_sids:
-                    continue
-                self.started_sids.add(sid)
-
-                event = {
-                    'dt': dt,
-                    'sid': sid,
-                    'price': price,
-                    # Just chose something large
-                    # if no volume available.
-                    'volume': 1e9,
-                }
+            for event in self._raw_rows(dt, series):
                 yield event
 
+    @property
+    def dt_index(self):
+        """
+        The datetimes at which this source emits events, or None if the
+        frame's index is not sorted and unique.
+        """
+        index = self.data.index
+        if index.is_monotonic and index.is_unique:
+            return index
+        return None
+
+    def iter_snapshots(self):
+        """
+        Yield a list of the events for each datetime in ``dt_index``.
+        """
+        if self.columnar:
+            for snapshot in self.snapshot_gen():
+                yield [snapshot]
+        else:
+            for dt, series in self.data.iterrows():
+                yield [
+                    Event(self.apply_mapping(row))
+                    for row in self._raw_rows(dt, series)
+                ]
+
+    def snapshot_gen(self):
+        sids = self.data.columns.values
+        # Just chose something large if no volume available.
+        volumes = np.full(len(sids), int(1e9), dtype=np.int64)
+        source_id = self.get_hash()
+        for dt, prices in zip(self.data.index, self.data.values):
+            # After forward filling, the only NaNs left are before a sid's
+            # first price, which can not be forward filled.
+            traded = ~np.isnan(prices)
+            yield TradeSnapshot(
+                dt,
+                sids[traded],
+                prices[traded],
+                volumes[traded],
+                source_id,
+            )
+
     @property
     def raw_data(self):
         if not self._raw_data:
-            self._raw_data = self.raw_data_gen()
+            if self.columnar:
+                self._raw_data = self.snapshot_gen()
+            else:
+                self._raw_data = self.raw_data_gen()
         return self._raw_data
 
+    @property
+    def mapped_data(self):
+        if not self.columnar:
+            return super(DataFrameSource, self).mapped_data
+        # Snapshots are already in their final form.
+        return self.raw_data
+
 
 class DataPanelSource(DataSource):
     """
@@ -147,24 +211,49 @@ class DataPanelSource(DataSource):
     def instance_hash(self):
         return self.arg_string
 
+    def _raw_rows(self, dt):
+        df = self.data.major_xs(dt)
+        for sid, series in df.iteritems():
+            # Skip SIDs that can not be forward filled
+            if np.isnan(series['price']):
+                continue
+            self.started_sids.add(sid)
+
+            event = {
+                'dt': dt,
+                'sid': sid,
+            }
+            for field_name, value in series.iteritems():
+                event[field_name] = value
+
+            yield event
+
     def raw_data_gen(self):
         for dt in self.data.major_axis:
-            df = self.data.major_xs(dt)
-            for sid, series in df.iteritems():
-                # Skip SIDs that can not be forward filled
-                if np.isnan(series['price']):
-                    continue
-                self.started_sids.add(sid)
-
-                event = {
-                    'dt': dt,
-                    'sid': sid,
-                }
-                for field_name, value in series.iteritems():
-                    event[field_name] = value
-
+            for event in self._raw_rows(dt):
                 yield event
 
+    @property
+    def dt_index(self):
+        """
+        The datetimes at which this source emits events, or None if the
+        panel's major axis is not sorted and unique.
+        """
+        index = self.data.major_axis
+        if index.is_monotonic and index.is_unique:
+            return index
+        return None
+
+    def iter_snapshots(self):
+        """
+        Yield a list of the events for each datetime in ``dt_index``.
+        """
+        for dt in self.data.major_axis:
+            yield [
+                Event(self.apply_mapping(row))
+                for row in self._raw_rows(dt)
+            ]
+
     @property
     def raw_data(self):
         if not self._raw_data:
@@ -30,8 +30,7 @@ from zipline.assets.futures import CME_CODE_TO_MONTH
 from zipline.finance.order import ORDER_STATUS
 from zipline.pipeline.engine import SimplePipelineEngine
 from zipline.pipeline.loaders.testing import make_seeded_random_loader
-from zipline.utils import security_list
-from zipline.utils.tradingcalendar import trading_days
+from zipline.utils import security_list, tradingcalendar
 
 
 EPOCH = pd.Timestamp(0, tz='UTC')
@@ -795,6 +794,7 @@ def gen_calendars(start, stop, critical_dates):
         yield (all_dates.drop(to_drop),)
 
     # Also test with the trading calendar.
+    trading_days = tradingcalendar.trading_days
     yield (trading_days[trading_days.slice_indexer(start, stop)],)
 
 
@@ -33,7 +33,7 @@ from six import (
 )
 
 from zipline.utils.algo_instance import get_algo_instance
-from zipline.utils.data import MutableIndexRollingPanel
+from zipline.utils.data import MutableIndexRollingPanel, RollingBarWindow
 from zipline.utils.deprecate import deprecated
 from zipline.protocol import Event
 
@@ -84,6 +84,59 @@ def downsample_panel(minute_rp, daily_rp, mkt_close):
     daily_rp.add_frame(dt1, day_frame)
 
 
+def downsample_bar_window(minute_window, daily_window, dt):
+    """
+    Add a daily bar at `dt` to `daily_window`, aggregating each field of the
+    bars in `minute_window` as `downsample_panel` does.
+    """
+    values = minute_window.values
+    fields = minute_window.fields
+    day = numpy.empty((len(fields), values.shape[2]))
+    for i, field in enumerate(fields):
+        day[i] = _reducers[get_sample_func(field)](values[i])
+    daily_window.append_array(dt, fields, minute_window.sids, day)
+
+
+def _nanfirst(values):
+    valid = ~numpy.isnan(values)
+    return values[valid.argmax(axis=0), numpy.arange(values.shape[1])]
+
+
+def _nanlast(values):
+    return _nanfirst(values[::-1])
+
+
+def _nansum(values):
+    # Like pandas, the sum of a column with no values is nan, not 0.
+    total = numpy.nansum(values, axis=0)
+    total[numpy.isnan(values).all(axis=0)] = numpy.nan
+    return total
+
+
+_reducers = {
+    'first': _nanfirst,
+    'last': _nanlast,
+    'min': lambda values: numpy.fmin.reduce(values, axis=0),
+    'max': lambda values: numpy.fmax.reduce(values, axis=0),
+    'sum': _nansum,
+}
+
+
+def ffill_rows(values):
+    """
+    Forward-fill nans along axis 1 of a (fields, dates, sids) array.
+    """
+    nfields, ndates, nsids = values.shape
+    rows = numpy.arange(ndates).reshape(1, ndates, 1)
+    rows = numpy.where(numpy.isnan(values), 0, rows)
+    numpy.maximum.accumulate(rows, axis=1, out=rows)
+    return values[
+        numpy.arange(nfields).reshape(nfields, 1, 1),
+        rows,
+        numpy.arange(nsids).reshape(1, 1, nsids),
+    ]
+
+
 def get_date(mkt_close, d1, d2, d):
     if d > mkt_close:
         return d2
@@ -163,7 +216,8 @@ class BatchTransform(object):
                  fields=None,
                  compute_only_full=True,
                  bars='daily',
-                 downsample=False):
+                 downsample=False,
+                 panel=True):
         """Instantiate new batch_transform object.
 
         :Arguments:
@@ -190,6 +244,12 @@ class BatchTransform(object):
                 full. Returns None if window is not full yet.
             downsample : bool <default=False>
                 If true, downsample bars to daily bars. Otherwise, do nothing.
+            panel : bool <default=True>
+                If true, pass the window to func as a pandas Panel.
+                Otherwise, bars are written straight into preallocated
+                arrays and func is passed a zipline.utils.data.BarWindow,
+                whose fields index (dates, sids) arrays of the window.
+                Call its as_panel() method to get a Panel on demand.
         """
         if func is not None:
             self.compute_transform_value = func
@@ -250,8 +310,11 @@ class BatchTransform(object):
         # set of stocks per quarter
         self.supplemental_data = None
 
+        self.panel = panel
         self.rolling_panel = None
         self.daily_rolling_panel = None
+        self.bar_window = None
+        self.daily_bar_window = None
 
     def handle_data(self, data, *args, **kwargs):
         """
@@ -305,6 +368,15 @@ class BatchTransform(object):
                 sids,
             )
 
+    def _init_bar_windows(self):
+        if self.downsample:
+            self.bar_window = RollingBarWindow(self.bars_in_day)
+            self.daily_bar_window = RollingBarWindow(self.window_length)
+        else:
+            self.bar_window = RollingBarWindow(
+                self.window_length * self.bars_in_day,
+            )
+
     def _append_to_window(self, event):
         self.field_names = self._get_field_names(event)
 
@@ -321,15 +393,25 @@ class BatchTransform(object):
         # N.B. that the underlying panel grows monotonically
         # if the set of sids changes over time.
         self.latest_sids = sids
-        # Create rolling panel if not existant
-        if self.rolling_panel is None:
-            self._init_panels(sids)
-
-        # Store event in rolling frame
-        self.rolling_panel.add_frame(event.dt,
-                                     pd.DataFrame(event.data,
-                                                  index=self.field_names,
-                                                  columns=sids))
+        if self.panel:
+            # Create rolling panel if not existant
+            if self.rolling_panel is None:
+                self._init_panels(sids)
+
+            # Store event in rolling frame
+            self.rolling_panel.add_frame(event.dt,
+                                         pd.DataFrame(event.data,
+                                                      index=self.field_names,
+                                                      columns=sids))
+        else:
+            if self.bar_window is None:
+                self._init_bar_windows()
+            self.bar_window.append(
+                event.dt,
+                sorted(self.field_names),
+                sids,
+                event.data,
+            )
 
         # update trading day counters
         # we may get events from non-trading sources which occurr on
@@ -342,11 +424,15 @@ class BatchTransform(object):
                 # Daily bars have their dt set to midnight.
                 mkt_close = env.normalize_date(mkt_close)
             if event.dt == mkt_close:
-                if self.downsample:
+                if self.downsample and self.panel:
                     downsample_panel(self.rolling_panel,
                                      self.daily_rolling_panel,
                                      mkt_close
                                      )
+                elif self.downsample:
+                    downsample_bar_window(self.bar_window,
+                                          self.daily_bar_window,
+                                          env.normalize_date(mkt_close))
                 self.trading_days_total += 1
             self.mkt_close = mkt_close
 
@@ -406,7 +492,13 @@ class BatchTransform(object):
         index : field_name (e.g. price)
         major axis/rows : dt
         minor axis/colums : sid
+
+        If the transform was created with ``panel=False``, a BarWindow
+        holding the same values is returned instead.
         """
+        if not self.panel:
+            return self._get_bar_window()
+
         if self.downsample:
             data = self.daily_rolling_panel.get_current()
         else:
@@ -444,6 +536,31 @@ class BatchTransform(object):
 
         return data
 
+    def _get_bar_window(self):
+        if self.downsample:
+            window = self.daily_bar_window
+        else:
+            window = self.bar_window
+        data = window.window(sids=self.latest_sids)
+
+        if self.supplemental_data is not None:
+            supplemental = self.supplemental_data.reindex(
+                items=data.fields,
+                major_axis=data.dates,
+                minor_axis=data.sids,
+            ).values
+            data.values = numpy.where(
+                numpy.isnan(supplemental),
+                data.values,
+                supplemental,
+            )
+
+        if self.clean_nans and numpy.isnan(data.values).any():
+            data.values = ffill_rows(data.values)
+
+        self._curr_data = data
+        return data
+
     def get_value(self, *args, **kwargs):
         raise NotImplementedError(
             "Either overwrite get_value or provide a func argument.")
@@ -41,23 +41,25 @@ def zipline_wrapper(talib_fn, key_map, data):
     # to floats.
     if len(talib_fn.output_names) > 1:
         all_results = pd.DataFrame(index=talib_fn.output_names,
-                                   columns=data.minor_axis)
+                                   columns=data.sids)
     else:
-        all_results = pd.Series(index=data.minor_axis)
+        all_results = pd.Series(index=data.sids)
 
-    for sid in data.minor_axis:
+    for column, sid in enumerate(data.sids):
         # build talib_data from zipline data
         talib_data = dict()
         for talib_key, zipline_key in iteritems(key_map):
             # if zipline_key is found, add it to talib_data
             if zipline_key in data:
-                values = data[zipline_key][sid].values
+                # TA-Lib wants contiguous inputs, so copy the sid's column
+                # out of the window.
+                values = np.ascontiguousarray(data[zipline_key][:, column])
                 # Do not include sids that have only nans, passing only nans
                 # is incompatible with many of the underlying TALib functions.
-                if pd.isnull(values).all():
+                if np.isnan(values).all():
                     break
                 else:
-                    talib_data[talib_key] = data[zipline_key][sid].values
+                    talib_data[talib_key] = values
             # if zipline_key is not found and not required, add zeros
             elif talib_key not in req_inputs:
                 talib_data[talib_key] = np.zeros(data.shape[1])
@@ -194,7 +196,8 @@ def make_transform(talib_fn, name):
                 refresh_period=refresh_period,
                 window_length=window_length,
                 compute_only_full=False,
-                bars=bars)
+                bars=bars,
+                panel=False)
 
         def __repr__(self):
             return 'Zipline BatchTransform: {0}'.format(
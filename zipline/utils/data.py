@@ -159,17 +159,26 @@ class RollingPanel(object):
     def add_frame(self, tick, frame, minor_axis=None, items=None):
         """
         """
-        if self._pos == self.cap:
-            self._roll_data()
-
         values = frame
         if isinstance(frame, pd.DataFrame):
             values = frame.values
 
-        self.buffer.values[:, self._pos, :] = values.astype(self.dtype)
+        self.next_frame(tick)[:] = values
+
+    def next_frame(self, tick):
+        """
+        Advance the window by one frame at ``tick`` and return a writable
+        (items, minor_axis) view of the new frame's storage in the buffer.
+        The caller is responsible for filling every entry of the view.
+        """
+        if self._pos == self.cap:
+            self._roll_data()
+
+        frame = self.buffer.values[:, self._pos, :]
         self.date_buf[self._pos] = tick
 
         self._pos += 1
+        return frame
 
     def get_current(self, item=None, raw=False, start=None, end=None):
         """
@@ -401,6 +410,245 @@ class MutableIndexRollingPanel(object):
         self.buffer = new_buffer
 
 
+class RollingBarWindow(object):
+    """
+    A trailing window of bars stored in a preallocated float64 buffer of
+    shape ``(fields, cap, sids)``.
+
+    Bars are written into the buffer in place.  As in RollingPanel, once the
+    buffer is full the last `window` rows are copied back to the start of the
+    buffer, so the current window is always a contiguous slice of rows.
+    Fields and sids are added to the buffer the first time they are written,
+    and are never removed.
+
+    Parameters
+    ----------
+    window : int
+        The number of bars in the window.
+    fields : iterable, optional
+        Fields with which to start the buffer.
+    sids : iterable, optional
+        Sids with which to start the buffer.
+    cap_multiple : int, optional
+        The buffer holds ``cap_multiple * window`` rows.
+    """
+    def __init__(self, window, fields=(), sids=(), cap_multiple=2):
+        self._window = window
+        self._cap = max(cap_multiple * window, window + 1)
+        self._pos = 0
+
+        self.fields = []
+        self.sids = []
+        self._field_idx = {}
+        self._sid_idx = {}
+
+        self._dates = np.empty(self._cap, dtype='i8')
+        self._buffer = np.full((0, self._cap, 0), np.nan)
+        self._add_fields(fields)
+        self._add_sids(sids)
+
+    def __len__(self):
+        return self._pos - self._start
+
+    @property
+    def _start(self):
+        return max(self._pos - self._window, 0)
+
+    @property
+    def dates(self):
+        """
+        The dates of the bars in the window, as int64 nanoseconds.
+        """
+        return self._dates[self._start:self._pos]
+
+    @property
+    def values(self):
+        """
+        A view of the bars in the window, of shape (fields, dates, sids).
+        """
+        return self._buffer[
+            :len(self.fields),
+            self._start:self._pos,
+            :len(self.sids),
+        ]
+
+    def _add_fields(self, fields):
+        new = [f for f in fields if f not in self._field_idx]
+        if not new:
+            return
+        for field in new:
+            self._field_idx[field] = len(self.fields)
+            self.fields.append(field)
+
+        nfields, cap, nsids = self._buffer.shape
+        if len(self.fields) > nfields:
+            self._buffer = self._grow(self._buffer, 0, len(self.fields))
+
+    def _add_sids(self, sids):
+        new = [s for s in sids if s not in self._sid_idx]
+        if not new:
+            return
+        for sid in new:
+            self._sid_idx[sid] = len(self.sids)
+            self.sids.append(sid)
+
+        nfields, cap, nsids = self._buffer.shape
+        if len(self.sids) > nsids:
+            self._buffer = self._grow(self._buffer, 2, len(self.sids))
+
+    @staticmethod
+    def _grow(buffer, axis, size):
+        """
+        Copy `buffer` into a nan-filled buffer with room for at least `size`
+        entries along `axis`, doubling its capacity so that growing one entry
+        at a time takes amortized constant time.
+        """
+        shape = list(buffer.shape)
+        shape[axis] = max(size, 2 * shape[axis])
+        grown = np.full(shape, np.nan)
+        grown[tuple(slice(0, n) for n in buffer.shape)] = buffer
+        return grown
+
+    def _next_row(self, dt):
+        if self._pos == self._cap:
+            window = self._window
+            self._buffer[:, :window] = self._buffer[:, -window:]
+            self._dates[:window] = self._dates[-window:]
+            self._pos = window
+
+        pos = self._pos
+        self._dates[pos] = pd.Timestamp(dt).value
+        self._pos += 1
+        return pos
+
+    def append(self, dt, fields, sids, bars):
+        """
+        Add a bar to the window.
+
+        Parameters
+        ----------
+        dt : pd.Timestamp
+            The dt of the bar.
+        fields : iterable
+            The fields to write.
+        sids : iterable
+            The sids to write.
+        bars : dict[sid -> dict[field -> float]]
+            The bar's values.  Sids missing from `bars`, and fields missing
+            from a sid's values, are written as nan.
+        """
+        fields = list(fields)
+        sids = list(sids)
+        nan = np.nan
+        empty = {}
+        values = np.array(
+            [
+                [bars.get(sid, empty).get(field, nan) for sid in sids]
+                for field in fields
+            ],
+            dtype=np.float64,
+        ).reshape(len(fields), len(sids))
+        self.append_array(dt, fields, sids, values)
+
+    def append_array(self, dt, fields, sids, values):
+        """
+        Add a bar, given as an array of shape (fields, sids), to the window.
+        """
+        self._add_fields(fields)
+        self._add_sids(sids)
+
+        pos = self._next_row(dt)
+        row = self._buffer[:, pos]
+        row[:] = np.nan
+        if not (len(fields) and len(sids)):
+            return
+        row[np.ix_(
+            [self._field_idx[f] for f in fields],
+            [self._sid_idx[s] for s in sids],
+        )] = values
+
+    def window(self, sids=None):
+        """
+        Get a BarWindow of the bars currently in view.
+
+        Parameters
+        ----------
+        sids : iterable, optional
+            Sids to keep, in our order.  Defaults to all of our sids.
+        """
+        values = self.values
+        all_sids = self.sids
+        if sids is not None:
+            keep = set(sids)
+            if len(keep) < len(all_sids) or not keep.issuperset(all_sids):
+                columns = [
+                    i for i, sid in enumerate(all_sids) if sid in keep
+                ]
+                values = values[:, :, columns]
+                all_sids = [all_sids[i] for i in columns]
+        return BarWindow(self.dates, list(self.fields), all_sids, values)
+
+
+class BarWindow(object):
+    """
+    The bars in a trailing window, as arrays.
+
+    This is what batch transforms created with ``panel=False`` are passed in
+    place of a pandas Panel.  Indexing with a field returns an array of shape
+    (dates, sids), which may be a view onto the transform's buffer and so
+    should not be modified or held between calls.
+
+    Parameters
+    ----------
+    dates : np.ndarray[int64]
+        The dates of the bars, as nanoseconds since the epoch.
+    fields : list
+        The fields of the bars.
+    sids : list
+        The sids of the bars.
+    values : np.ndarray[float64]
+        Array of shape (fields, dates, sids).
+    """
+    def __init__(self, dates, fields, sids, values):
+        self._dates = dates
+        self.fields = fields
+        self.sids = sids
+        self.values = values
+        self._field_idx = {field: i for i, field in enumerate(fields)}
+
+    @property
+    def dates(self):
+        return pd.DatetimeIndex(self._dates, tz='UTC')
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def __len__(self):
+        return len(self.fields)
+
+    def __iter__(self):
+        return iter(self.fields)
+
+    def __contains__(self, field):
+        return field in self._field_idx
+
+    def __getitem__(self, field):
+        return self.values[self._field_idx[field]]
+
+    def as_panel(self):
+        """
+        Copy the window into a pandas Panel with our fields as items, our
+        dates as its major axis and our sids as its minor axis.
+        """
+        return pd.Panel(
+            self.values.copy(),
+            items=self.fields,
+            major_axis=self.dates,
+            minor_axis=self.sids,
+        )
+
+
 class SortedDict(MutableMapping):
     """A mapping of key-value pairs sorted by key according to the sort_key
     function provided to the mapping.  Ties from the sort_key are broken by
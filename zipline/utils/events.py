@@ -17,6 +17,7 @@ from collections import namedtuple
 import six
 
 import datetime
+import numpy as np
 import pandas as pd
 import pytz
 
@@ -26,6 +27,7 @@ from .context_tricks import nop_context
 __all__ = [
     'EventManager',
     'Event',
+    'CompiledEvent',
     'EventRule',
     'StatelessRule',
     'ComposedRule',
@@ -47,12 +49,19 @@ __all__ = [
     'date_rules',
     'time_rules',
     'make_eventrule',
+    'compile_rule',
 ]
 
 
 MAX_MONTH_RANGE = 26
 MAX_WEEK_RANGE = 5
 
+# Sentinel trigger time for sessions on which a compiled rule never triggers.
+NEVER_TRIGGERS = np.iinfo(np.int64).max
+
+_DAY = pd.Timedelta(days=1).value
+_MINUTE = pd.Timedelta(minutes=1).value
+
 
 def naive_to_utc(ts):
     """
@@ -184,6 +193,11 @@ class EventManager(object):
     """
     def __init__(self, create_context=None):
         self._events = []
+        # The objects whose handle_data is called for each event, which are
+        # either the events themselves or CompiledEvents.
+        self._dispatchers = []
+        self._sessions = None
+        self._env = None
         self._create_context = (
             create_context
             if create_context is not None else
@@ -194,15 +208,44 @@ class EventManager(object):
         """
         Adds an event to the manager.
         """
+        dispatcher = self._dispatcher(event)
         if prepend:
             self._events.insert(0, event)
+            self._dispatchers.insert(0, dispatcher)
         else:
             self._events.append(event)
+            self._dispatchers.append(dispatcher)
+
+    def compile(self, sessions, env):
+        """
+        Precompute when each event triggers during `sessions`.
+
+        Events whose rules can be compiled are then dispatched by comparing
+        each dt against an array of trigger times, instead of evaluating their
+        rules on every bar.  Events added later are compiled as they're added.
+
+        Parameters
+        ----------
+        sessions : pd.DatetimeIndex
+            The trading days of the simulation.
+        env : zipline.finance.trading.TradingEnvironment
+            The environment with which the rules are evaluated.
+        """
+        sessions = sessions.asi8
+        # Rules are only compiled over days in the environment's calendar.
+        self._sessions = sessions[np.in1d(sessions, env.trading_days.asi8)]
+        self._env = env
+        self._dispatchers = list(map(self._dispatcher, self._events))
+
+    def _dispatcher(self, event):
+        if self._sessions is None:
+            return event
+        return CompiledEvent.from_event(event, self._sessions, self._env)
 
     def handle_data(self, context, data, dt):
         with self._create_context(data):
-            for event in self._events:
-                event.handle_data(
+            for dispatcher in self._dispatchers:
+                dispatcher.handle_data(
                     context,
                     data,
                     dt,
@@ -228,6 +271,97 @@ class Event(namedtuple('Event', ['rule', 'callback'])):
             self.callback(context, data)
 
 
+class CompiledEvent(object):
+    """
+    An Event whose rule has been compiled into the time at which it first
+    triggers on each session.
+
+    Parameters
+    ----------
+    event : Event
+        The event to dispatch.  Its rule is evaluated directly for any dt
+        that doesn't fall on one of `sessions`.
+    sessions : np.ndarray[int64]
+        The midnights, in nanoseconds since the epoch, of the sessions over
+        which the rule was compiled.
+    triggers : np.ndarray[int64]
+        The time, in nanoseconds since the epoch, from which the rule triggers
+        on each session, or NEVER_TRIGGERS.
+    once_per_day : bool
+        Whether to trigger only on the first dt at or after the trigger time,
+        rather than on every dt from then until the end of the session.
+
+    See Also
+    --------
+    zipline.utils.events.EventManager.compile
+    """
+    def __init__(self, event, sessions, triggers, once_per_day):
+        self.event = event
+        self.callback = event.callback
+        self.once_per_day = once_per_day
+        # Lists are faster than arrays for indexing one element at a time.
+        self._sessions = sessions.tolist()
+        self._triggers = triggers.tolist()
+        self._idx = 0
+        self._last_dt = None
+        self._fired = -1
+
+    @classmethod
+    def from_event(cls, event, sessions, env):
+        """
+        Compile `event` over `sessions`, or return `event` itself if its rule
+        can't be compiled.
+        """
+        rule = event.rule
+        once_per_day = (
+            type(rule) is OncePerDay and 'should_trigger' not in vars(rule)
+        )
+        if type(rule) is Always:
+            # Already as cheap as it gets.
+            return event
+
+        triggers = compile_rule(
+            rule.rule if once_per_day else rule,
+            sessions,
+            env,
+        )
+        if triggers is None:
+            return event
+        return cls(event, sessions, triggers, once_per_day)
+
+    def handle_data(self, context, data, dt, env):
+        """
+        Calls the event's callback if its rule triggers at `dt`.
+        """
+        if isinstance(dt, pd.Timestamp):
+            dt_ns = dt.value
+        else:
+            dt_ns = pd.Timestamp(dt).value
+        sessions = self._sessions
+        idx = self._idx
+        if self._last_dt is not None and dt_ns < self._last_dt:
+            # Time went backwards, so search from the start.
+            idx = 0
+            self._fired = -1
+        self._last_dt = dt_ns
+
+        day_ns = dt_ns - dt_ns % _DAY
+        while idx < len(sessions) and sessions[idx] < day_ns:
+            idx += 1
+        self._idx = idx
+
+        if idx == len(sessions) or sessions[idx] != day_ns:
+            # Not one of the sessions we compiled.
+            self.event.handle_data(context, data, dt, env)
+            return
+
+        if dt_ns < self._triggers[idx] or self._fired == idx:
+            return
+        if self.once_per_day:
+            self._fired = idx
+        self.callback(context, data)
+
+
 class EventRule(six.with_metaclass(ABCMeta)):
     """
     An event rule checks a datetime and sees if it should trigger.
@@ -248,6 +382,30 @@ class StatelessRule(EventRule):
     same datetime.
     Because these are pure, they can be composed to create new rules.
     """
+    def compile(self, sessions, env):
+        """
+        Compute the time from which this rule triggers on each session.
+
+        Rules that can be compiled trigger, on each session, either never or
+        from some time until the end of the session.
+
+        Parameters
+        ----------
+        sessions : np.ndarray[int64]
+            Session midnights, as nanoseconds since the epoch in UTC.
+        env : zipline.finance.trading.TradingEnvironment
+            The environment with which the rule is evaluated.
+
+        Returns
+        -------
+        triggers : np.ndarray[int64] or None
+            The first time, in nanoseconds since the epoch, at which the rule
+            triggers on each session, or NEVER_TRIGGERS if it doesn't.  None if
+            the rule can't be compiled, in which case it's evaluated on every
+            bar.
+        """
+        return None
+
     def and_(self, rule):
         """
         Logical and of two rules, triggers only when both rules trigger.
@@ -290,6 +448,18 @@ class ComposedRule(StatelessRule):
             env,
         )
 
+    def compile(self, sessions, env):
+        if self.composer is not ComposedRule.lazy_and:
+            return None
+        first = compile_rule(self.first, sessions, env)
+        if first is None:
+            return None
+        second = compile_rule(self.second, sessions, env)
+        if second is None:
+            return None
+        # Both rules trigger from the later of their trigger times.
+        return np.maximum(first, second)
+
     @staticmethod
     def lazy_and(first_should_trigger, second_should_trigger, dt, env):
         """
@@ -311,6 +481,9 @@ class Always(StatelessRule):
         return True
     should_trigger = always_trigger
 
+    def compile(self, sessions, env):
+        return sessions.copy()
+
 
 class Never(StatelessRule):
     """
@@ -324,6 +497,9 @@ class Never(StatelessRule):
         return False
     should_trigger = never_trigger
 
+    def compile(self, sessions, env):
+        return np.full_like(sessions, NEVER_TRIGGERS)
+
 
 class AfterOpen(StatelessRule):
     """
@@ -344,6 +520,14 @@ class AfterOpen(StatelessRule):
     def should_trigger(self, dt, env):
         return self._get_open(dt, env) + self.offset <= dt
 
+    def compile(self, sessions, env):
+        opens = pd.DatetimeIndex(env.open_and_closes.market_open).asi8
+        return (
+            _session_values(env, opens, sessions) -
+            _MINUTE +
+            _timedelta_ns(self.offset)
+        )
+
     def _get_open(self, dt, env):
         """
         Cache the open for each day.
@@ -374,6 +558,13 @@ class BeforeClose(StatelessRule):
     def should_trigger(self, dt, env):
         return self._get_close(dt, env) - self.offset <= dt
 
+    def compile(self, sessions, env):
+        closes = pd.DatetimeIndex(env.open_and_closes.market_close).asi8
+        return (
+            _session_values(env, closes, sessions) -
+            _timedelta_ns(self.offset)
+        )
+
     def _get_close(self, dt, env):
         """
         Cache the close for each day.
@@ -391,6 +582,12 @@ class NotHalfDay(StatelessRule):
     def should_trigger(self, dt, env):
         return dt.date() not in env.early_closes
 
+    def compile(self, sessions, env):
+        return _trigger_on(
+            sessions,
+            ~np.in1d(sessions, env.early_closes.asi8),
+        )
+
 
 class NthTradingDayOfWeek(StatelessRule):
     """
@@ -416,6 +613,13 @@ class NthTradingDayOfWeek(StatelessRule):
             dt = env.previous_trading_day(dt)
         return prev.date()
 
+    def compile(self, sessions, env):
+        position, _ = _positions_in_groups(env, _week_starts(env))
+        return _trigger_on(
+            sessions,
+            _session_values(env, position, sessions) == self.td_delta,
+        )
+
 
 class NDaysBeforeLastTradingDayOfWeek(StatelessRule):
     """
@@ -443,6 +647,14 @@ class NDaysBeforeLastTradingDayOfWeek(StatelessRule):
             dt = env.next_trading_day(dt)
         return prev.date()
 
+    def compile(self, sessions, env):
+        _, position_from_end = _positions_in_groups(env, _week_starts(env))
+        return _trigger_on(
+            sessions,
+            _session_values(env, position_from_end, sessions) ==
+            -self.td_delta,
+        )
+
 
 class NthTradingDayOfMonth(StatelessRule):
     """
@@ -482,6 +694,13 @@ class NthTradingDayOfMonth(StatelessRule):
                           else env.next_trading_day(dt)).date()
         return self.first_day
 
+    def compile(self, sessions, env):
+        position, _ = _positions_in_groups(env, _month_starts(env))
+        return _trigger_on(
+            sessions,
+            _session_values(env, position, sessions) == self.td_delta,
+        )
+
 
 class NDaysBeforeLastTradingDayOfMonth(StatelessRule):
     """
@@ -529,6 +748,91 @@ class NDaysBeforeLastTradingDayOfMonth(StatelessRule):
         ).date()
         return self.last_day
 
+    def compile(self, sessions, env):
+        _, position_from_end = _positions_in_groups(env, _month_starts(env))
+        return _trigger_on(
+            sessions,
+            _session_values(env, position_from_end, sessions) ==
+            -self.td_delta,
+        )
+
+
+def compile_rule(rule, sessions, env):
+    """
+    Compile `rule` over `sessions`, as with `StatelessRule.compile`.
+
+    Returns None for rules that override `should_trigger` without overriding
+    `compile` to match.
+    """
+    if not isinstance(rule, StatelessRule) or 'should_trigger' in vars(rule):
+        return None
+    cls = type(rule)
+    if (_defining_class(cls, 'should_trigger') is not
+            _defining_class(cls, 'compile')):
+        return None
+    return rule.compile(sessions, env)
+
+
+def _defining_class(cls, name):
+    return next(c for c in cls.__mro__ if name in vars(c))
+
+
+def _timedelta_ns(td):
+    return pd.Timedelta(td).value
+
+
+def _trigger_on(sessions, mask):
+    """
+    Triggers for a rule that triggers all day on the sessions where `mask` is
+    True.
+    """
+    return np.where(mask, sessions, NEVER_TRIGGERS)
+
+
+def _session_values(env, values, sessions):
+    """
+    Select the entries of `values`, which are aligned with
+    ``env.trading_days``, for each of `sessions`.
+    """
+    return values[env.trading_days.asi8.searchsorted(sessions)]
+
+
+def _month_starts(env):
+    """
+    Whether each of ``env.trading_days`` is the first trading day of its
+    month.
+    """
+    days = env.trading_days
+    months = days.year * 12 + days.month
+    return np.r_[True, months[1:] != months[:-1]]
+
+
+def _week_starts(env):
+    """
+    Whether each of ``env.trading_days`` is the first trading day of its week.
+
+    Like `NthTradingDayOfWeek.get_first_trading_day_of_week`, a new week
+    starts whenever the weekday doesn't increase from one trading day to the
+    next.
+    """
+    weekdays = env.trading_days.dayofweek
+    return np.r_[True, weekdays[1:] <= weekdays[:-1]]
+
+
+def _positions_in_groups(env, starts):
+    """
+    Compute the position of each of ``env.trading_days`` from the start and
+    from the end of its group, where `starts` flags the first day of each
+    group.
+    """
+    idx = np.arange(len(starts))
+    group_start = np.maximum.accumulate(np.where(starts, idx, 0))
+    ends = np.r_[starts[1:], True]
+    group_end = np.minimum.accumulate(
+        np.where(ends, idx, len(starts))[::-1],
+    )[::-1]
+    return idx - group_start, group_end - idx
+
 
 # Stateful rules
 
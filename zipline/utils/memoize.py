@@ -2,6 +2,9 @@
 Tools for memoization of function results.
 """
 from functools import wraps
+import sys
+from types import ModuleType
+
 from six import iteritems
 from weakref import WeakKeyDictionary
 
@@ -139,3 +142,76 @@ def remember_last(f):
         return _previous[VALUE]
 
     return memoized_f
+
+
+class _LazyAttributeModule(ModuleType):
+    """
+    A module whose attributes may be computed on first access.
+
+    See Also
+    --------
+    zipline.utils.memoize.lazy_module_attributes
+    """
+    def __init__(self, module, loaders):
+        super(_LazyAttributeModule, self).__init__(module.__name__)
+        self.__dict__.update(module.__dict__)
+        # Python 2 clears the globals of a module when it's deallocated, which
+        # would break the functions defined in it.
+        self._lazy_original_module = module
+        self._lazy_loaders = loaders
+
+    def __getattr__(self, name):
+        # This is only called when normal attribute lookup fails.
+        try:
+            loader = self.__dict__['_lazy_loaders'][name]
+        except KeyError:
+            raise AttributeError(
+                "module %r has no attribute %r" % (self.__name__, name)
+            )
+        value = loader()
+        # Make the value visible to the module's own functions as a global.
+        setattr(self._lazy_original_module, name, value)
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        return sorted(set(self.__dict__) | set(self._lazy_loaders))
+
+
+def lazy_module_attributes(module_name, **loaders):
+    """
+    Replace a module with one whose attributes in `loaders` are computed on
+    first access.
+
+    This should be called at the end of the module being replaced, since
+    attributes assigned to the original module afterwards aren't copied.
+
+    Parameters
+    ----------
+    module_name : str
+        The name of the module to replace, usually ``__name__``.
+    **loaders
+        Mapping from attribute names to functions of no arguments which
+        compute them.
+
+    Returns
+    -------
+    module : module
+        The module now stored in ``sys.modules[module_name]``.
+
+    Example
+    -------
+    At the end of a module::
+
+        def _expensive():
+            ...
+
+        _module = lazy_module_attributes(__name__, expensive=_expensive)
+
+    ``_expensive`` is called the first time ``module.expensive`` is accessed,
+    including by ``from module import expensive``.  Functions in the module
+    can use ``_module.expensive`` to trigger the computation themselves.
+    """
+    module = _LazyAttributeModule(sys.modules[module_name], loaders)
+    sys.modules[module_name] = module
+    return module
@@ -12,12 +12,22 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
+
+import numpy as np
 import pandas as pd
 import pytz
 
 from datetime import datetime
 from dateutil import rrule
 from functools import partial
+from zipfile import BadZipfile
+
+from zipline.utils.memoize import lazy_module_attributes, remember_last
+
+# Version of the rules used to compute the calendar.  This must be incremented
+# whenever the rules change, to invalidate calendars cached on disk.
+CALENDAR_VERSION = 1
 
 start = pd.Timestamp('1990-01-01', tz='UTC')
 end_base = pd.Timestamp('today', tz='UTC')
@@ -247,17 +257,14 @@ def get_non_trading_days(start, end):
     non_trading_days.sort()
     return pd.DatetimeIndex(non_trading_days)
 
-non_trading_days = get_non_trading_days(start, end)
-trading_day = pd.tseries.offsets.CDay(holidays=non_trading_days)
 
-
-def get_trading_days(start, end, trading_day=trading_day):
+def get_trading_days(start, end, trading_day=None):
+    if trading_day is None:
+        trading_day = _module.trading_day
     return pd.date_range(start=start.date(),
                          end=end.date(),
                          freq=trading_day).tz_localize('UTC')
 
-trading_days = get_trading_days(start, end)
-
 
 def get_early_closes(start, end):
     # 1:00 PM close rules based on
@@ -365,8 +372,6 @@ def get_early_closes(start, end):
     early_closes.sort()
     return pd.DatetimeIndex(early_closes)
 
-early_closes = get_early_closes(start, end)
-
 
 def get_open_and_close(day, early_closes):
     market_open = pd.Timestamp(
@@ -401,5 +406,178 @@ def get_open_and_closes(trading_days, early_closes, get_open_and_close):
 
     return open_and_closes
 
-open_and_closes = get_open_and_closes(trading_days, early_closes,
-                                      get_open_and_close)
+
+def _compute_calendar_arrays():
+    """
+    Compute the calendar from its rules, as int64 nanoseconds since the epoch.
+    """
+    non_trading_days = get_non_trading_days(start, end)
+    trading_days = get_trading_days(
+        start,
+        end,
+        pd.tseries.offsets.CDay(holidays=non_trading_days),
+    )
+    early_closes = get_early_closes(start, end)
+
+    # Equivalent to get_open_and_close for each day, but vectorized.
+    midnights = trading_days.asi8
+    close_hours = np.where(
+        np.in1d(midnights, early_closes.asi8),
+        13,
+        16,
+    )
+
+    def to_utc(eastern_times):
+        return pd.DatetimeIndex(eastern_times).tz_localize(
+            'US/Eastern',
+        ).tz_convert('UTC').asi8
+
+    return {
+        'non_trading_days': non_trading_days.asi8,
+        'trading_days': midnights,
+        'early_closes': early_closes.asi8,
+        'market_open': to_utc(
+            midnights + pd.Timedelta(hours=9, minutes=31).value,
+        ),
+        'market_close': to_utc(
+            midnights + close_hours * pd.Timedelta(hours=1).value,
+        ),
+    }
+
+
+_CALENDAR_ARRAYS = (
+    'non_trading_days',
+    'trading_days',
+    'early_closes',
+    'market_open',
+    'market_close',
+)
+
+
+def calendar_cache_path(environ=None):
+    """
+    The path at which the calendar is cached.
+
+    The path depends on `CALENDAR_VERSION` and on the calendar's start date,
+    so a new cache is written whenever the rules change.  As `end` moves
+    forward each day, the calendar cached at this path is recomputed and
+    replaced by `load_calendar_arrays`.
+
+    Parameters
+    ----------
+    environ : dict, optional
+        An environment dict to forward to zipline.data.paths.cache_root.
+
+    Returns
+    -------
+    path : str
+        Path of the cached calendar.
+    """
+    # Imported here because zipline.data imports this module.
+    from zipline.data.paths import cache_root
+
+    return os.path.join(
+        cache_root(environ=environ),
+        'tradingcalendar-v%d-%s.npz' % (
+            CALENDAR_VERSION,
+            start.strftime('%Y%m%d'),
+        ),
+    )
+
+
+def load_calendar_arrays(path):
+    """
+    Read the arrays of dates defining the calendar from `path`, computing
+    them and writing them to `path` if they can't be read or were computed
+    for a different `end`.
+
+    Parameters
+    ----------
+    path : str
+        Path of the cached calendar, e.g. from `calendar_cache_path`.
+
+    Returns
+    -------
+    arrays : dict[str -> np.ndarray[int64]]
+        The calendar's non-trading days, trading days and early closes, and
+        the market open and close of each trading day, as nanoseconds since
+        the epoch in UTC.
+    """
+    try:
+        cached = np.load(path)
+        try:
+            if cached['end'] == end.value:
+                return {name: cached[name] for name in _CALENDAR_ARRAYS}
+        finally:
+            cached.close()
+    except (BadZipfile, IOError, KeyError, OSError, ValueError):
+        # Missing or unreadable, so recompute it.
+        pass
+
+    arrays = _compute_calendar_arrays()
+    try:
+        dirname = os.path.dirname(path)
+        if not os.path.isdir(dirname):
+            os.makedirs(dirname)
+        # Write to a temporary file and rename it, so that concurrent
+        # processes never read a partially written calendar.
+        tmp_path = '%s.%d.tmp' % (path, os.getpid())
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, end=np.int64(end.value), **arrays)
+        os.rename(tmp_path, path)
+    except (IOError, OSError):
+        # The cache is only an optimization.
+        pass
+    return arrays
+
+
+@remember_last
+def _calendar_arrays():
+    return load_calendar_arrays(calendar_cache_path())
+
+
+def _load_non_trading_days():
+    return pd.DatetimeIndex(_calendar_arrays()['non_trading_days'], tz='UTC')
+
+
+def _load_trading_day():
+    return pd.tseries.offsets.CDay(holidays=_module.non_trading_days)
+
+
+def _load_trading_days():
+    # The days are already known to fall on `trading_day`, so skip pandas'
+    # check of the frequency, which would regenerate them.
+    return pd.DatetimeIndex(
+        _calendar_arrays()['trading_days'],
+        tz='UTC',
+        freq=_module.trading_day,
+        verify_integrity=False,
+    )
+
+
+def _load_early_closes():
+    return pd.DatetimeIndex(_calendar_arrays()['early_closes'], tz='UTC')
+
+
+def _load_open_and_closes():
+    arrays = _calendar_arrays()
+    open_and_closes = pd.DataFrame(index=_module.trading_days,
+                                   columns=('market_open', 'market_close'))
+    for column in open_and_closes.columns:
+        open_and_closes[column] = list(
+            pd.DatetimeIndex(arrays[column], tz='UTC'),
+        )
+    return open_and_closes
+
+
+# Computing the calendar is expensive, so it's only done when one of these
+# attributes is first used, and the results are cached on disk across
+# processes.
+_module = lazy_module_attributes(
+    __name__,
+    non_trading_days=_load_non_trading_days,
+    trading_day=_load_trading_day,
+    trading_days=_load_trading_days,
+    early_closes=_load_early_closes,
+    open_and_closes=_load_open_and_closes,
+)